@@ -5,6 +5,8 @@ import logging
 
 from app.container import ApplicationContainer
 from app.settings import get_settings
+from app.workers import start_sender_jobs
+from src.base.domain.retry_policy import MAX_ATTEMPTS
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +28,11 @@ def build_container() -> ApplicationContainer:
             "s3_presign_ttl": settings.s3_presign_ttl,
             "redis_url": settings.redis_url,
             "default_ttl": settings.default_ttl,
+            "l1_cache_max_entries": settings.l1_cache_max_entries,
+            "l1_cache_ttl": settings.l1_cache_ttl,
+            "cache_lock_ttl": settings.cache_lock_ttl,
+            "attachment_cache_max_bytes": settings.attachment_cache_max_bytes,
+            "attachment_cache_ttl": settings.attachment_cache_ttl,
             "telegram_api_id": settings.telegram_api_id,
             "telegram_api_hash": settings.telegram_api_hash,
             "whatsapp_base_url": settings.whatsapp_base_url,
@@ -38,7 +45,12 @@ def build_container() -> ApplicationContainer:
             "broker_queue": settings.broker_queue,
             "broker_routing_key": settings.broker_routing_key,
             "broker_prefetch": settings.broker_prefetch,
+            "consumer_workers": settings.consumer_workers,
             "broker_durable": settings.broker_durable,
+            "broker_content_type": settings.broker_content_type,
+            "broker_compress_threshold": settings.broker_compress_threshold,
+            "prefetch_upcoming_sends": settings.prefetch_upcoming_sends,
+            "prefetch_lookahead_seconds": settings.prefetch_lookahead_seconds,
         }
     )
     return container
@@ -61,22 +73,37 @@ async def main() -> None:
             "Consumer requires broker mode (set broker_driver='rabbitmq'). "
             "For direct mode (DB polling), use app/workers.py instead."
         )
+    if settings.broker_driver == "inmemory":
+        raise SystemExit(
+            "broker_driver='inmemory' is consumed inside app/workers.py; "
+            "there is no separate consumer process."
+        )
 
 
     logger.info("Starting consumer (broker mode: %s)...", settings.broker_driver)
     logger.info("Queue: %s", settings.broker_queue)
     logger.info("Exchange: %s", settings.broker_exchange)
+    logger.info("Workers: %s", settings.consumer_workers)
 
+    # the sends happen here, so the caches they read are warmed here too
+    sender_jobs = start_sender_jobs(container)
     try:
         await consume_event_bus_messages(
             uow_factory=container.unit_of_work,
             outbox_registry=container.outbox_registry(),
             container=container,
             event_bus=container.event_bus(),
+            workers=settings.consumer_workers,
+            # keep each aggregate in order across failures
+            max_attempts=MAX_ATTEMPTS,
         )
     finally:
         logger.info("Shutting down consumer...")
+        for task in sender_jobs:
+            task.cancel()
+        await asyncio.gather(*sender_jobs, return_exceptions=True)
         await container.event_bus().close()
+        await container.cache_repo().close()
         maybe2 = shutdown_res() if callable(shutdown_res) else None
         if inspect.isawaitable(maybe2):
             await maybe2
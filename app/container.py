@@ -3,9 +3,14 @@ from redis.asyncio import Redis
 from src.base.application.outbox.registry import OutboxRegistry
 from src.base.adapters.http.httpx_client import HttpxAsyncClient
 from src.base.adapters.redis.repository import RedisCacheRepository
+from src.base.adapters.redis.tiered_cache import TieredCacheRepository
 from src.base.adapters.sqlalchemydb.database import AsyncSqlalchemyDatabase
 from src.base.adapters.sqlalchemydb.unit_of_work import AsyncSqlalchemyUnitOfWork
-from src.base.infrastructure.lazy_entity_cache import LazyEntityCache
+from src.base.infrastructure.lazy_entity_cache import (
+    DEFAULT_KEY_PREFIX,
+    LazyEntityCache,
+)
+from src.files.adapters.cached_file_service import CachedFileService
 from src.files.adapters.s3_file_service import S3FileService, S3Settings
 from src.messaging.adapters.clients.telethon_client import TelethonClient
 from src.messaging.adapters.clients.whatsapp_http_service import WhatsappHttpService
@@ -15,14 +20,22 @@ from src.messaging.domain.enums.messenger_type import MessengerType
 from src.users.adapters.security.jose_jwt_service import JwtSettings, JoseJwtService
 from src.messaging.adapters.messengers.whatsapp_messenger import WhatsappMessenger
 from src.users.adapters.security.password_hasher import PasslibPasswordHasher
+from src.users.adapters.security.principal_cache import TwoLevelPrincipalCache
 from src.importing.adapters.redis.import_staging_repo import (
     RedisImportStagingRepository,
 )
+from src.importing.adapters.redis.suppression_list_repo import (
+    RedisSuppressionListRepository,
+)
 from src.importing.adapters.tabular.csv_reader import CsvTabularReader
 from src.importing.adapters.tabular.xlsx_reader import XlsxTabularReader
 from src.importing.adapters.tabular.resolver import TabularReaderResolver
 from src.importing.application.registry.import_registry import ImportRegistry
+from src.base.adapters.event_bus.inmemory_event_bus import InMemoryEventBus
 from src.base.adapters.event_bus.noop_event_bus import NoopEventBus
+from src.base.adapters.postgres.notification_listener import (
+    PostgresNotificationListener,
+)
 from src.base.adapters.rabbitmq.event_bus import (
     RabbitMQEventBus,
     RabbitMQSettings,
@@ -38,17 +51,33 @@ class ApplicationContainer(containers.DeclarativeContainer):
         database_url=config.database_url,
     )
     redis_client = providers.Singleton(Redis.from_url, url=config.redis_url)
-    cache_repo = providers.Factory(
+    redis_cache_repo = providers.Factory(
         RedisCacheRepository,
         redis_client=redis_client,
         key_prefix="app",
     )
+    # process-wide: the in-process L1 must be shared to be useful
+    cache_repo = providers.Singleton(
+        TieredCacheRepository,
+        remote=redis_cache_repo,
+        redis_client=redis_client,
+        max_entries=config.l1_cache_max_entries,
+        ttl=config.l1_cache_ttl,
+    )
+
+    # authenticated-user cache (process-wide: holds the in-process layer)
+    principal_cache = providers.Singleton(
+        TwoLevelPrincipalCache,
+        cache_repo=cache_repo,
+        ttl=config.default_ttl,
+    )
 
     # Unit of Work (depends on database and cache)
     unit_of_work = providers.Factory(
         AsyncSqlalchemyUnitOfWork,
         database=database,
         cache_repo=cache_repo,
+        principal_cache=principal_cache,
     )
 
     # S3
@@ -68,12 +97,21 @@ class ApplicationContainer(containers.DeclarativeContainer):
         S3FileService,
         settings=s3_settings,
     )
+    # process-wide: attachment bytes read by the messengers, warmed ahead of
+    # sends by the prefetch_upcoming_sends job
+    attachment_file_service = providers.Singleton(
+        CachedFileService,
+        inner=file_service,
+        max_bytes=config.attachment_cache_max_bytes,
+        ttl=config.attachment_cache_ttl,
+    )
 
     lazy_entity_cache = providers.Factory(
         LazyEntityCache,
         cache_repo=cache_repo,
-        key_prefix="entity",
+        key_prefix=DEFAULT_KEY_PREFIX,
         default_ttl=config.default_ttl,
+        lock_ttl=config.cache_lock_ttl,
     )
     # Telegram: TelethonClient adapter + TelegramMessenger domain service
     telethon_client = providers.Factory(
@@ -86,7 +124,7 @@ class ApplicationContainer(containers.DeclarativeContainer):
     telegram_messenger = providers.Factory(
         TelegramMessenger,
         client=telethon_client,
-        file_service=file_service,
+        file_service=attachment_file_service,
     )
 
     whatsapp_http_client = providers.Factory(
@@ -104,7 +142,7 @@ class ApplicationContainer(containers.DeclarativeContainer):
     whatsapp_messenger = providers.Factory(
         WhatsappMessenger,
         service=whatsapp_http_service,
-        file_service=file_service,
+        file_service=attachment_file_service,
     )
 
     messenger_registry = providers.Factory(
@@ -124,7 +162,11 @@ class ApplicationContainer(containers.DeclarativeContainer):
         access_token_expire_minutes=config.access_token_expire_minutes,
     )
 
-    password_hasher = providers.Singleton(PasslibPasswordHasher)
+    password_hasher = providers.Singleton(
+        PasslibPasswordHasher,
+        max_workers=config.password_hash_workers,
+        max_pending=config.password_hash_max_pending,
+    )
 
     jwt_service = providers.Singleton(
         JoseJwtService,
@@ -136,6 +178,10 @@ class ApplicationContainer(containers.DeclarativeContainer):
         RedisImportStagingRepository,
         redis_client=redis_client,
     )
+    suppression_list_repo = providers.Factory(
+        RedisSuppressionListRepository,
+        redis_client=redis_client,
+    )
 
     tabular_reader = providers.Singleton(
         TabularReaderResolver,
@@ -158,12 +204,23 @@ class ApplicationContainer(containers.DeclarativeContainer):
         routing_key=config.broker_routing_key,
         prefetch=config.broker_prefetch,
         durable=config.broker_durable,
+        content_type=config.broker_content_type,
+        compress_threshold=config.broker_compress_threshold,
     )
 
     event_bus = providers.Selector(
         config.broker_driver,
         none=providers.Singleton(NoopEventBus),
+        inmemory=providers.Singleton(
+            InMemoryEventBus, max_queued=config.broker_prefetch
+        ),
         rabbitmq=providers.Singleton(RabbitMQEventBus, settings=rabbitmq_settings),
     )
 
     outbox_registry = providers.Singleton(OutboxRegistry)
+
+    # dedicated LISTEN connection used by workers to wake on outbox inserts
+    notification_listener = providers.Singleton(
+        PostgresNotificationListener,
+        database_url=config.database_url,
+    )
@@ -2,6 +2,7 @@ from dependency_injector.wiring import Provide, inject
 from fastapi import Depends
 
 from app.container import ApplicationContainer
+from src.base.ports.services.event_bus import EventBusPort
 from src.base.ports.unit_of_work import AsyncUnitOfWork
 from src.base.infrastructure.lazy_entity_cache import LazyEntityCache
 from src.files.ports.services.file_service import FileServicePort
@@ -28,3 +29,10 @@ def get_file_service(
     file_service: FileServicePort = Depends(Provide[ApplicationContainer.file_service]),
 ) -> FileServicePort:
     return file_service
+
+
+@inject
+def get_event_bus(
+    event_bus: EventBusPort = Depends(Provide[ApplicationContainer.event_bus]),
+) -> EventBusPort:
+    return event_bus
@@ -26,6 +26,22 @@ async def lifespan(app: FastAPI):
                 await whatsapp_client.close()
         except Exception:
             pass
+        try:
+            if hasattr(container, "password_hasher"):
+                container.password_hasher().close()
+        except Exception:
+            pass
+        try:
+            if hasattr(container, "cache_repo"):
+                await container.cache_repo().close()
+        except Exception:
+            pass
+        try:
+            # opened on demand by the dead-letter endpoints
+            if hasattr(container, "event_bus"):
+                await container.event_bus().close()
+        except Exception:
+            pass
         try:
             if hasattr(container, "redis_client"):
                 redis = container.redis_client()
@@ -53,6 +69,7 @@ def create_application() -> FastAPI:
     container.wire(modules=["app.v1.users.routes.endpoints"])
     container.wire(modules=["app.v1.files.routes.endpoints"])
     container.wire(modules=["app.v1.messaging.routes.endpoints"])
+    container.wire(modules=["app.v1.events.routes.endpoints"])
 
     app = FastAPI(
         title="Messenger API",
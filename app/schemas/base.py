@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Self
 
 from pydantic import BaseModel, ConfigDict
 from src.base.domain.dto import BaseDTO
@@ -68,5 +68,11 @@ class AbstractBaseModel(BaseModel):
         return result
 
     @classmethod
-    def from_dto_list(cls, dtos: list[BaseDTO]) -> list["AbstractBaseModel"]:
-        return [cls(**dto.dump(exclude_none=True)) for dto in dtos]
+    def from_dto(cls, dto: BaseDTO) -> "Self":
+        # validate straight from the DTO's attributes (nested DTOs included):
+        # no intermediate dump()/JSON-conversion pass
+        return cls.model_validate(dto)
+
+    @classmethod
+    def from_dto_list(cls, dtos: list[BaseDTO]) -> list["Self"]:
+        return [cls.from_dto(dto) for dto in dtos]
@@ -22,6 +22,9 @@ class Settings(BaseSettings):
     secret_key: str = "your-secret-key-change-in-production"
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
+    # bcrypt runs in a dedicated thread pool; logins beyond max_pending get 429
+    password_hash_workers: int = 2
+    password_hash_max_pending: int = 32
 
     # cors
     cors_origins: list[str] = ["*"]
@@ -43,6 +46,20 @@ class Settings(BaseSettings):
     redis_password: str | None = None
     redis_db: str = "0"
     default_ttl: int = 60
+    # in-process L1 in front of redis (0 entries disables it)
+    l1_cache_max_entries: int = 10000
+    l1_cache_ttl: float = 5.0
+    # lease of the cross-process lock around cache loads (0 disables it)
+    cache_lock_ttl: int = 5
+
+    # in-process cache of attachment bytes read by the messengers (0 disables)
+    attachment_cache_max_bytes: int = 64 * 1024 * 1024
+    attachment_cache_ttl: float = 600.0
+    # prefetch_upcoming_sends runs inside every process that sends (the
+    # direct dispatcher or the broker consumer) and warms, this far ahead,
+    # the files and attachments of pending messages
+    prefetch_upcoming_sends: bool = True
+    prefetch_lookahead_seconds: int = 300
 
     # telgram
     telegram_api_id: int
@@ -57,9 +74,16 @@ class Settings(BaseSettings):
     #   direct: DB outbox worker calls handlers directly (current behavior)
     #   broker: DB outbox worker publishes to broker, and consumers execute handlers
     outbox_dispatch_strategy: str = "direct"
+    # max outbox events handled concurrently per batch (same aggregate stays ordered)
+    outbox_dispatch_concurrency: int = 8
+    # how long a dispatcher owns claimed events; renewed while handlers run,
+    # so it only matters when a worker dies mid-batch
+    outbox_lease_seconds: int = 60
 
     # broker (rabbitmq/kafka/etc)
-    broker_driver: str = "none"  # "none" | "rabbitmq" (future: "kafka")
+    # "none" | "rabbitmq" | "inmemory" (future: "kafka"); inmemory runs the
+    # consumer inside app/workers.py, for single-node deployments
+    broker_driver: str = "none"
     broker_url: str | None = None
 
     broker_exchange: str = "events"
@@ -69,7 +93,16 @@ class Settings(BaseSettings):
     broker_queue: str = "messenger.events"
     broker_routing_key: str = "#"
     broker_prefetch: int = 50
+    # consumer workers; messages are partitioned by aggregate_id, so ordering
+    # holds per aggregate, also across failures: a failing message is retried
+    # in place and holds its worker (a few minutes at most) until it succeeds
+    # or is dead-lettered. Keep broker_prefetch >= consumer_workers.
+    consumer_workers: int = 8
     broker_durable: bool = True
+    # event body encoding: "application/json" or "application/msgpack" (needs
+    # the msgpack package); bodies >= the threshold are gzipped (0 disables)
+    broker_content_type: str = "application/json"
+    broker_compress_threshold: int = 8192
 
     @property
     def redis_url(self) -> str:
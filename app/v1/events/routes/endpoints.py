@@ -0,0 +1,51 @@
+from fastapi import APIRouter, Depends, Query
+
+from app.deps.providers import get_event_bus
+from app.v1.events.schemas import v1_requests as rqm
+from app.v1.events.schemas import v1_responses as rsm
+from app.v1.users.deps.get_current_user import get_current_user
+from src.base.exceptions import ForbiddenException
+from src.base.ports.services.event_bus import EventBusPort
+from src.users.domain.entities.base_user import BaseUser
+from src.users.domain.enums.user_type import UserType
+
+router = APIRouter(prefix="", tags=["events"])
+
+
+def _require_admin(user: BaseUser) -> None:
+    if user.user_type != UserType.admin:
+        raise ForbiddenException(detail="Admin access required")
+
+
+@router.get("/dead-letters", response_model=list[rsm.V1DeadLetterResponse])
+async def list_dead_letters(
+    limit: int = Query(100, ge=1, le=1000),
+    user: BaseUser = Depends(get_current_user),
+    event_bus: EventBusPort = Depends(get_event_bus),
+):
+    _require_admin(user)
+    dead_letters = await event_bus.list_dead_letters(limit=limit)
+    return [
+        rsm.V1DeadLetterResponse(
+            message_id=dl.message.message_id,
+            event_type=dl.message.event_type,
+            payload=dl.message.payload,
+            headers=dl.message.headers or {},
+            attempts=dl.attempts,
+            error=dl.error,
+        )
+        for dl in dead_letters
+    ]
+
+
+@router.post("/dead-letters/replay", response_model=rsm.V1ReplayDeadLettersResponse)
+async def replay_dead_letters(
+    request: rqm.V1ReplayDeadLettersRequest,
+    user: BaseUser = Depends(get_current_user),
+    event_bus: EventBusPort = Depends(get_event_bus),
+):
+    _require_admin(user)
+    replayed = await event_bus.replay_dead_letters(
+        limit=request.limit, message_ids=request.message_ids
+    )
+    return rsm.V1ReplayDeadLettersResponse(replayed=replayed)
@@ -0,0 +1,8 @@
+from pydantic import Field
+
+from app.schemas.base import AbstractBaseModel
+
+
+class V1ReplayDeadLettersRequest(AbstractBaseModel):
+    message_ids: list[str] | None = None
+    limit: int = Field(100, ge=1, le=1000)
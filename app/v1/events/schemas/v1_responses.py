@@ -0,0 +1,16 @@
+from typing import Any
+
+from app.schemas.base import AbstractBaseModel
+
+
+class V1DeadLetterResponse(AbstractBaseModel):
+    message_id: str | None = None
+    event_type: str
+    payload: dict[str, Any]
+    headers: dict[str, Any]
+    attempts: int
+    error: str | None = None
+
+
+class V1ReplayDeadLettersResponse(AbstractBaseModel):
+    replayed: int
@@ -47,7 +47,7 @@ async def upload_file(
         )
         await uow.commit()
 
-    return rsm.V1FileResponse(**file_dto.dump(exclude_none=True))
+    return rsm.V1FileResponse.from_dto(file_dto)
 
 
 @router.get("/{file_id}", response_model=rsm.V1FileResponse)
@@ -64,7 +64,7 @@ async def get_file(
             id=file_id,
             user=user,
         )
-    return rsm.V1FileResponse(**file_dto.dump(exclude_none=True))
+    return rsm.V1FileResponse.from_dto(file_dto)
 
 
 @router.get("", response_model=list[rsm.V1FileResponse])
@@ -86,6 +86,4 @@ async def list_files(
             offset=offset,
         )
 
-    return [
-        rsm.V1FileResponse(**file_dto.dump(exclude_none=True)) for file_dto in file_dtos
-    ]
+    return [rsm.V1FileResponse.from_dto(file_dto) for file_dto in file_dtos]
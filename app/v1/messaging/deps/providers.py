@@ -3,6 +3,9 @@ from fastapi import Depends
 
 from app.container import ApplicationContainer
 from src.base.ports.repositories.cache_repository import AbstractCacheRepository
+from src.importing.ports.repositories.suppression_list_repo_port import (
+    SuppressionListRepositoryPort,
+)
 from src.messaging.application.registry.messenger_registry import MessengerRegistry
 
 
@@ -22,3 +25,12 @@ def get_messenger_registry(
     ),
 ) -> MessengerRegistry:
     return registry
+
+
+@inject
+def get_suppression_list_repo(
+    repo: SuppressionListRepositoryPort = Depends(
+        Provide[ApplicationContainer.suppression_list_repo]
+    ),
+) -> SuppressionListRepositoryPort:
+    return repo
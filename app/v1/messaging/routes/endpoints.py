@@ -2,12 +2,14 @@ from fastapi import APIRouter, Depends
 from dependency_injector.wiring import Provide, inject
 
 from app.deps.providers import get_uow
+from app.v1.messaging.deps.providers import get_suppression_list_repo
 from app.v1.messaging.schemas import v1_requests as rqm
 from app.v1.messaging.schemas import v1_responses as rsm
 from app.v1.messaging.schemas.v1_responses import (
     V1CreateMessageRequestImportResponse,
     V1MessageRequestResponse,
     V1SendMessageResponse,
+    V1SuppressionListUpdateResponse,
 )
 from app.v1.users.deps.get_current_user import get_current_user
 from app.container import ApplicationContainer
@@ -20,9 +22,16 @@ from src.messaging.application.use_cases.get_message_request import (
 from src.messaging.application.use_cases.create_message_request_import import (
     create_message_request_import_use_case,
 )
+from src.messaging.application.use_cases.suppression_list import (
+    add_to_suppression_list_use_case,
+    remove_from_suppression_list_use_case,
+)
 from src.importing.ports.repositories.import_staging_repo_port import (
     ImportStagingRepositoryPort,
 )
+from src.importing.ports.repositories.suppression_list_repo_port import (
+    SuppressionListRepositoryPort,
+)
 from src.users.domain.entities.base_user import BaseUser
 
 router = APIRouter(prefix="", tags=["messages"])
@@ -50,7 +59,7 @@ async def message(
         )
         await uow.commit()
 
-        return rsm.V1SendMessageResponse(**dto.dump())
+        return rsm.V1SendMessageResponse.from_dto(dto)
 
 
 @router.get("/message-requests/{message_request_id}")
@@ -66,7 +75,7 @@ async def get_message_request(
             uow=uow,
         )
 
-        return rsm.V1MessageRequestResponse(**dto.dump())
+        return rsm.V1MessageRequestResponse.from_dto(dto)
 
 
 @router.post(
@@ -90,11 +99,49 @@ async def create_message_request_import(
             file_id=request.file_id,
             title=request.title,
             default_text=request.default_text,
+            templated=request.templated,
             default_sending_time=request.default_sending_time,
             attachment_file_id=request.attachment_file_id,
-            import_config=request.config.model_dump(),
+            # json mode: the config travels inside an outbox payload
+            import_config=request.config.model_dump(mode="json"),
             ttl_seconds=request.ttl_seconds,
             import_staging_repo=import_staging_repo,
         )
         await uow.commit()
-        return V1CreateMessageRequestImportResponse(**dto.dump())
+        return V1CreateMessageRequestImportResponse.from_dto(dto)
+
+
+@router.post("/suppression-list", response_model=V1SuppressionListUpdateResponse)
+async def add_to_suppression_list(
+    request: rqm.V1SuppressionListRequest,
+    user: BaseUser = Depends(get_current_user),
+    suppression_list_repo: SuppressionListRepositoryPort = Depends(
+        get_suppression_list_repo
+    ),
+) -> V1SuppressionListUpdateResponse:
+    added = await add_to_suppression_list_use_case(
+        user=user,
+        phone_numbers=request.phone_numbers,
+        usernames=request.usernames,
+        user_ids=request.user_ids,
+        suppression_list_repo=suppression_list_repo,
+    )
+    return V1SuppressionListUpdateResponse(changed=added)
+
+
+@router.post("/suppression-list/remove", response_model=V1SuppressionListUpdateResponse)
+async def remove_from_suppression_list(
+    request: rqm.V1SuppressionListRequest,
+    user: BaseUser = Depends(get_current_user),
+    suppression_list_repo: SuppressionListRepositoryPort = Depends(
+        get_suppression_list_repo
+    ),
+) -> V1SuppressionListUpdateResponse:
+    removed = await remove_from_suppression_list_use_case(
+        user=user,
+        phone_numbers=request.phone_numbers,
+        usernames=request.usernames,
+        user_ids=request.user_ids,
+        suppression_list_repo=suppression_list_repo,
+    )
+    return V1SuppressionListUpdateResponse(changed=removed)
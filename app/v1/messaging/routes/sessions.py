@@ -70,7 +70,7 @@ async def start_otp_session(
             cache_repo=cache_repo,
         )
         await uow.commit()
-        return V1StartOtpSessionResponse(**res.dump())
+        return V1StartOtpSessionResponse.from_dto(res)
 
 
 @router.post("/qr", response_model=V1StartQrSessionResponse)
@@ -92,7 +92,7 @@ async def start_qr_session(
             file_service=file_service,
         )
         await uow.commit()
-        return V1StartQrSessionResponse(**res.dump())
+        return V1StartQrSessionResponse.from_dto(res)
 
 
 @router.post("/verify/opt", response_model=V1SessionResponse)
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from pydantic import ConfigDict
+from pydantic import ConfigDict, Field
 
 from app.schemas.base import AbstractBaseModel
 from src.messaging.application.import_handlers.message_request_import_config import (
@@ -44,6 +44,12 @@ class V1MessageRequest(AbstractBaseModel):
     file_id: int | None = None
 
 
+class V1SuppressionListRequest(AbstractBaseModel):
+    phone_numbers: list[str] = Field(default_factory=list, max_length=1000)
+    usernames: list[str] = Field(default_factory=list, max_length=1000)
+    user_ids: list[str] = Field(default_factory=list, max_length=1000)
+
+
 class V1ImportMessageRequest(AbstractBaseModel):
     model_config = ConfigDict(extra="forbid")
 
@@ -51,6 +57,9 @@ class V1ImportMessageRequest(AbstractBaseModel):
     file_id: int
     title: str | None = None
     default_text: str | None = None
+    # default_text is sent as-is unless this is set; then `{name}` is filled
+    # from the row's extras / recipient fields and `{{` / `}}` are literal
+    templated: bool = False
     default_sending_time: datetime | None = None
     attachment_file_id: int | None = None
 
@@ -76,3 +76,7 @@ class V1SendMessageResponse(AbstractBaseModel):
     status: MessageStatus
     error_message: str | None = None
     message_request: V1MessageRequestResponse
+
+
+class V1SuppressionListUpdateResponse(AbstractBaseModel):
+    changed: int
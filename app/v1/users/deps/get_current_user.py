@@ -5,8 +5,10 @@ from fastapi import Depends
 from fastapi.security import OAuth2PasswordBearer
 
 from app.container import ApplicationContainer
+from app.deps.providers import get_uow
 from src.base.ports.unit_of_work import AsyncUnitOfWork
 from src.users.ports.security.jwt import JwtPort
+from src.users.ports.security.principal_cache import PrincipalCachePort
 from src.users.domain.entities.base_user import BaseUser
 from src.users.application.services.auth_user import get_current_user_from_token
 
@@ -16,9 +18,17 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/v1/users/auth/login")
 @inject
 async def get_current_user(
     token: Annotated[str, Depends(oauth2_scheme)],
-    uow: AsyncUnitOfWork = Depends(Provide[ApplicationContainer.unit_of_work]),
+    # same dependency as the routes: FastAPI builds one UoW per request and
+    # this lookup enters and leaves it before the route does
+    uow: AsyncUnitOfWork = Depends(get_uow),
     jwt_service: JwtPort = Depends(Provide[ApplicationContainer.jwt_service]),
+    principal_cache: PrincipalCachePort = Depends(
+        Provide[ApplicationContainer.principal_cache]
+    ),
 ) -> BaseUser:
     return await get_current_user_from_token(
-        token=token, uow=uow, jwt_service=jwt_service
+        token=token,
+        uow=uow,
+        jwt_service=jwt_service,
+        principal_cache=principal_cache,
     )
@@ -2,6 +2,10 @@ import argparse
 import asyncio
 import inspect
 import logging
+import multiprocessing
+import signal
+import time
+from datetime import datetime, timezone
 from typing import Any, Callable
 
 from app.container import ApplicationContainer
@@ -12,14 +16,16 @@ import src.messaging.application.outbox_handlers  # noqa: F401
 import src.importing.application.outbox_handlers  # noqa: F401
 
 from src.base.workers import JOBS as BASE_WORKERS
+from src.base.workers.consume_event_bus_messages import consume_event_bus_messages
 from src.messaging.workers import JOBS as MESSAGING_WORKERS
+from src.messaging.workers import SENDER_JOBS
 
 WORKER_JOBS = {**BASE_WORKERS, **MESSAGING_WORKERS}
 
 logger = logging.getLogger(__name__)
 
 
-def build_container() -> ApplicationContainer:
+def build_container(*, shard: tuple[int, int] | None = None) -> ApplicationContainer:
     settings = get_settings()
     container = ApplicationContainer()
     container.config.from_dict(
@@ -36,11 +42,18 @@ def build_container() -> ApplicationContainer:
             "s3_presign_ttl": settings.s3_presign_ttl,
             "redis_url": settings.redis_url,
             "default_ttl": settings.default_ttl,
+            "l1_cache_max_entries": settings.l1_cache_max_entries,
+            "l1_cache_ttl": settings.l1_cache_ttl,
+            "cache_lock_ttl": settings.cache_lock_ttl,
+            "attachment_cache_max_bytes": settings.attachment_cache_max_bytes,
+            "attachment_cache_ttl": settings.attachment_cache_ttl,
             "telegram_api_id": settings.telegram_api_id,
             "telegram_api_hash": settings.telegram_api_hash,
             "whatsapp_base_url": settings.whatsapp_base_url,
             "whatsapp_api_key": settings.whatsapp_api_key,
             "outbox_dispatch_strategy": settings.outbox_dispatch_strategy,
+            "outbox_dispatch_concurrency": settings.outbox_dispatch_concurrency,
+            "outbox_lease_seconds": settings.outbox_lease_seconds,
             "broker_driver": settings.broker_driver,
             "broker_url": settings.broker_url,
             "broker_exchange": settings.broker_exchange,
@@ -49,6 +62,12 @@ def build_container() -> ApplicationContainer:
             "broker_routing_key": settings.broker_routing_key,
             "broker_prefetch": settings.broker_prefetch,
             "broker_durable": settings.broker_durable,
+            "broker_content_type": settings.broker_content_type,
+            "broker_compress_threshold": settings.broker_compress_threshold,
+            "consumer_workers": settings.consumer_workers,
+            "prefetch_upcoming_sends": settings.prefetch_upcoming_sends,
+            "prefetch_lookahead_seconds": settings.prefetch_lookahead_seconds,
+            "worker_shard": shard,
         }
     )
     return container
@@ -80,13 +99,67 @@ def _kwargs_for_job(
             kwargs[name] = container.tabular_reader()
         elif name == "import_registry":
             kwargs[name] = container.import_registry()
+        elif name == "suppression_list_repo":
+            kwargs[name] = container.suppression_list_repo()
+        elif name == "lazy_entity_cache_factory":
+            kwargs[name] = container.lazy_entity_cache
         elif name == "outbox_registry":
             kwargs[name] = container.outbox_registry()
         elif name == "dispatch_strategy":
             kwargs[name] = container.config.outbox_dispatch_strategy()
+        elif name == "concurrency":
+            kwargs[name] = container.config.outbox_dispatch_concurrency()
+        elif name == "lease_seconds":
+            kwargs[name] = container.config.outbox_lease_seconds()
+        elif name == "attachment_cache":
+            kwargs[name] = container.attachment_file_service()
+        elif name == "lookahead_seconds":
+            kwargs[name] = container.config.prefetch_lookahead_seconds()
+        elif name == "shard":
+            kwargs[name] = container.config.worker_shard()
     return kwargs
 
 
+def _start_local_consumer(container: ApplicationContainer) -> asyncio.Task | None:
+    """With broker_driver='inmemory' the consumer runs beside the dispatcher."""
+    if container.config.broker_driver() != "inmemory":
+        return None
+    return asyncio.create_task(
+        consume_event_bus_messages(
+            uow_factory=container.unit_of_work,
+            outbox_registry=container.outbox_registry(),
+            container=container,
+            event_bus=container.event_bus(),
+            workers=container.config.consumer_workers(),
+        ),
+        name="inmemory-consumer",
+    )
+
+
+def start_sender_jobs(container: ApplicationContainer) -> list[asyncio.Task]:
+    """Run SENDER_JOBS beside whatever sends in this process.
+
+    Their caches are process-local, so they are only useful here; with
+    --processes each child warms its own shard.
+    """
+    if not container.config.prefetch_upcoming_sends():
+        return []
+    return [
+        asyncio.create_task(
+            _run_one_job_loop(
+                name,
+                job=spec.job,
+                container=container,
+                interval=spec.interval,
+                batch_size=spec.batch,
+                max_interval=spec.max_interval,
+            ),
+            name=name,
+        )
+        for name, spec in SENDER_JOBS.items()
+    ]
+
+
 async def run_job_once(
     job: Callable[..., Any],
     *,
@@ -97,6 +170,33 @@ async def run_job_once(
     return await job(**kwargs)
 
 
+def _did_work(res: Any) -> bool:
+    if isinstance(res, dict):
+        return any(isinstance(v, int) and v > 0 for v in res.values())
+    return True
+
+
+async def _until_next_due(
+    name: str,
+    next_due: Callable[..., Any],
+    *,
+    container: ApplicationContainer,
+    delay: float,
+    floor: float,
+) -> float:
+    """`delay`, cut short to when the job next has work (never below `floor`)."""
+    try:
+        kwargs = _kwargs_for_job(next_due, container=container, batch_size=0)
+        due = await next_due(**kwargs)
+    except Exception:
+        logger.exception("Job %s: next due time lookup failed", name)
+        return delay
+    if due is None:
+        return delay
+    until = (due - datetime.now(timezone.utc)).total_seconds()
+    return max(floor, min(delay, until))
+
+
 async def _run_one_job_loop(
     name: str,
     *,
@@ -104,19 +204,43 @@ async def _run_one_job_loop(
     container: ApplicationContainer,
     interval: float,
     batch_size: int,
+    wakeup_channel: str | None = None,
+    max_interval: float | None = None,
+    next_due: Callable[..., Any] | None = None,
 ) -> None:
+    listener = container.notification_listener() if wakeup_channel else None
+    delay = interval
+
     while True:
+        busy = True
         try:
             res = await run_job_once(job, container=container, batch_size=batch_size)
-            logger.info("%s: %s", name, res)
+            busy = _did_work(res)
+            if busy:
+                logger.info("%s: %s", name, res)
         except Exception:
             logger.exception("Job %s crashed", name)
-        await asyncio.sleep(interval)
 
+        # adaptive idle backoff: back off while there is nothing to do,
+        # snap back to the base interval as soon as work shows up
+        if busy or max_interval is None:
+            delay = interval
+        else:
+            delay = min(max_interval, delay * 2)
+            if next_due is not None:
+                delay = await _until_next_due(
+                    name, next_due, container=container, delay=delay, floor=interval
+                )
 
-async def main() -> None:
-    logging.basicConfig(level=logging.INFO)
+        if listener is None:
+            await asyncio.sleep(delay)
+            continue
 
+        if await listener.wait(channel=wakeup_channel, timeout=delay, waiter=name):
+            delay = interval
+
+
+def _parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Run background jobs")
     parser.add_argument("--job", default="all", help="Job name, or 'all'")
     parser.add_argument("--once", action="store_true", help="Run once and exit")
@@ -126,8 +250,18 @@ async def main() -> None:
     parser.add_argument(
         "--batch-size", type=int, default=None, help="Override batch size"
     )
-    args = parser.parse_args()
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=1,
+        help="Fork N worker processes, each owning a shard of the outbox",
+    )
+    return parser.parse_args()
+
 
+async def run(
+    args: argparse.Namespace, *, shard: tuple[int, int] | None = None
+) -> None:
     jobs = dict(WORKER_JOBS)
     if args.job != "all":
         if args.job not in jobs:
@@ -135,8 +269,11 @@ async def main() -> None:
                 f"Unknown job '{args.job}'. Known: {', '.join(jobs.keys())}"
             )
         jobs = {args.job: jobs[args.job]}
+    elif args.interval is not None or args.batch_size is not None:
+        # jobs have very different cadences (e.g. the transactional lane)
+        raise SystemExit("--interval/--batch-size need a single --job")
 
-    container = build_container()
+    container = build_container(shard=shard)
 
     init_res = getattr(container, "init_resources", None)
     shutdown_res = getattr(container, "shutdown_resources", None)
@@ -144,6 +281,14 @@ async def main() -> None:
     if inspect.isawaitable(maybe):
         await maybe
 
+    consumer = _start_local_consumer(container)
+    sender_jobs: list[asyncio.Task] = []
+    sends_here = consumer is not None or (
+        container.config.outbox_dispatch_strategy() == "direct"
+        and any(spec.sends for spec in jobs.values())
+    )
+    if sends_here and not args.once:
+        sender_jobs = start_sender_jobs(container)
     try:
         if args.once:
             for name, spec in jobs.items():
@@ -164,16 +309,112 @@ async def main() -> None:
                         container=container,
                         interval=interval,
                         batch_size=batch,
+                        wakeup_channel=spec.wakeup_channel,
+                        max_interval=spec.max_interval,
+                        next_due=spec.next_due,
                     )
                 )
             )
 
         await asyncio.gather(*tasks)
     finally:
+        background = [t for t in (consumer, *sender_jobs) if t is not None]
+        for task in background:
+            task.cancel()
+        await asyncio.gather(*background, return_exceptions=True)
+        if any(spec.wakeup_channel for spec in jobs.values()):
+            await container.notification_listener().close()
+        await container.cache_repo().close()
         maybe2 = shutdown_res() if callable(shutdown_res) else None
         if inspect.isawaitable(maybe2):
             await maybe2
 
 
+def _run_shard(args: argparse.Namespace, shard: tuple[int, int]) -> None:
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(processName)s %(levelname)s:%(name)s:%(message)s",
+    )
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # the supervisor handles ^C
+    asyncio.run(run(args, shard=shard))
+
+
+def supervise(args: argparse.Namespace) -> None:
+    """Run one child per shard and restart children that die.
+
+    Outbox events are sharded by a hash of aggregate_id, and sends are keyed by
+    session id, so a given messenger session is always served by the same
+    process and its client connection stays warm there.
+    """
+    count = args.processes
+    ctx = multiprocessing.get_context("spawn")
+    children: dict[int, multiprocessing.process.BaseProcess] = {}
+    started_at: dict[int, float] = {}
+    failures: dict[int, int] = {i: 0 for i in range(count)}
+    restart_at: dict[int, float] = {}
+    stopping = False
+
+    def _stop(signum, frame) -> None:
+        nonlocal stopping
+        stopping = True
+
+    signal.signal(signal.SIGTERM, _stop)
+    signal.signal(signal.SIGINT, _stop)
+
+    def _start(index: int) -> None:
+        proc = ctx.Process(
+            target=_run_shard,
+            args=(args, (index, count)),
+            name=f"worker-{index}",
+        )
+        proc.start()
+        children[index] = proc
+        started_at[index] = time.monotonic()
+        logger.info("Started %s pid=%s", proc.name, proc.pid)
+
+    for i in range(count):
+        _start(i)
+
+    try:
+        while not stopping:
+            now = time.monotonic()
+            for i in range(count):
+                proc = children.get(i)
+                if proc is not None and proc.is_alive():
+                    continue
+
+                if proc is not None:
+                    # exited: schedule a restart, backing off on crash loops
+                    logger.error("%s exited with code %s", proc.name, proc.exitcode)
+                    if now - started_at[i] < 30:
+                        failures[i] += 1
+                    else:
+                        failures[i] = 0
+                    restart_at[i] = now + min(30, 2 ** failures[i] - 1)
+                    del children[i]
+
+                if now >= restart_at.get(i, 0):
+                    _start(i)
+
+            time.sleep(1)
+    finally:
+        for proc in children.values():
+            proc.terminate()
+        for proc in children.values():
+            proc.join(timeout=10)
+            if proc.is_alive():
+                proc.kill()
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    args = _parse_args()
+
+    if args.processes > 1 and not args.once:
+        supervise(args)
+    else:
+        asyncio.run(run(args))
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    main()
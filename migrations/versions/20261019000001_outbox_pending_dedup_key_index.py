@@ -0,0 +1,33 @@
+"""outbox pending dedup_key index
+
+Revision ID: 20261019000001
+Revises: 20260224000003
+Create Date: 2026-10-19 00:00:01.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019000001"
+down_revision: Union[str, Sequence[str], None] = "20260224000003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # publish-time coalescing only ever looks at unprocessed rows
+    op.create_index(
+        "ix_outbox_events_dedup_key_pending",
+        "outbox_events",
+        ["dedup_key"],
+        unique=False,
+        postgresql_where=sa.text("processed_at IS NULL AND dedup_key IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_outbox_events_dedup_key_pending", table_name="outbox_events")
@@ -0,0 +1,34 @@
+"""outbox event claim leases
+
+Revision ID: 20261019000002
+Revises: 20261019000001
+Create Date: 2026-10-19 00:00:02.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019000002"
+down_revision: Union[str, Sequence[str], None] = "20261019000001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # dispatchers claim rows with a lease instead of holding row locks
+    op.add_column(
+        "outbox_events", sa.Column("claimed_by", sa.String(length=128), nullable=True)
+    )
+    op.add_column(
+        "outbox_events",
+        sa.Column("claimed_until", sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("outbox_events", "claimed_until")
+    op.drop_column("outbox_events", "claimed_by")
@@ -0,0 +1,50 @@
+"""priority lanes for outbox events and messaging requests
+
+Revision ID: 20261019000003
+Revises: 20261019000002
+Create Date: 2026-10-19 00:00:03.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019000003"
+down_revision: Union[str, Sequence[str], None] = "20261019000002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+priority = postgresql.ENUM("transactional", "bulk", name="priority", create_type=False)
+
+
+def upgrade() -> None:
+    priority.create(op.get_bind(), checkfirst=True)
+
+    op.add_column(
+        "outbox_events",
+        sa.Column("priority", priority, nullable=False, server_default="bulk"),
+    )
+    op.add_column(
+        "messaging_requests",
+        sa.Column("priority", priority, nullable=False, server_default="bulk"),
+    )
+
+    # per-lane claim queries scan only ready rows of their lane
+    op.create_index(
+        "ix_outbox_events_priority_ready",
+        "outbox_events",
+        ["priority", "available_at"],
+        unique=False,
+        postgresql_where=sa.text("processed_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_outbox_events_priority_ready", table_name="outbox_events")
+    op.drop_column("messaging_requests", "priority")
+    op.drop_column("outbox_events", "priority")
+    priority.drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,36 @@
+"""templated message text: per-row variables instead of rendered text
+
+Revision ID: 20261019000004
+Revises: 20261019000003
+Create Date: 2026-10-19 00:00:04.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019000004"
+down_revision: Union[str, Sequence[str], None] = "20261019000003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # imported rows keep only their variables; the template lives once on
+    # messaging_requests.default_text
+    op.add_column("messages", sa.Column("variables", sa.JSON(), nullable=True))
+    op.alter_column("messages", "text", existing_type=sa.Text(), nullable=True)
+
+
+def downgrade() -> None:
+    # templated rows fall back to the unrendered template text
+    op.execute(
+        "UPDATE messages AS m SET text = COALESCE(r.default_text, '') "
+        "FROM messaging_requests AS r "
+        "WHERE m.message_request_id = r.id AND m.text IS NULL"
+    )
+    op.alter_column("messages", "text", existing_type=sa.Text(), nullable=False)
+    op.drop_column("messages", "variables")
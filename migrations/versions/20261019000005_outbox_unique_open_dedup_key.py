@@ -0,0 +1,52 @@
+"""one open outbox row per dedup_key and lane
+
+Revision ID: 20261019000005
+Revises: 20261019000004
+Create Date: 2026-10-19 00:00:05.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019000005"
+down_revision: Union[str, Sequence[str], None] = "20261019000004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+OPEN = "processed_at IS NULL AND claimed_by IS NULL AND dedup_key IS NOT NULL"
+
+
+def upgrade() -> None:
+    # fold duplicates left by racing publishers: the oldest row survives with
+    # the earliest available_at
+    ranked = (
+        "SELECT id, "
+        "min(available_at) OVER (PARTITION BY dedup_key, priority) AS first_at, "
+        "row_number() OVER (PARTITION BY dedup_key, priority ORDER BY id) AS rn "
+        f"FROM outbox_events WHERE {OPEN}"
+    )
+    op.execute(
+        f"UPDATE outbox_events AS o SET available_at = r.first_at "
+        f"FROM ({ranked}) AS r WHERE o.id = r.id AND r.rn = 1"
+    )
+    op.execute(
+        f"UPDATE outbox_events AS o SET processed_at = now(), "
+        f"last_error = 'coalesced into a later publish' "
+        f"FROM ({ranked}) AS r WHERE o.id = r.id AND r.rn > 1"
+    )
+
+    op.create_index(
+        "ux_outbox_events_dedup_key_open",
+        "outbox_events",
+        ["dedup_key", "priority"],
+        unique=True,
+        postgresql_where=sa.text(OPEN),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ux_outbox_events_dedup_key_open", table_name="outbox_events")
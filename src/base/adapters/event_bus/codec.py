@@ -0,0 +1,87 @@
+"""Wire codecs for event bus message bodies.
+
+The producer picks a serializer (``content_type``) and, for bodies at or
+above ``compress_threshold`` bytes, a compression (``content_encoding``).
+Both travel with the message, so consumers decode whatever they receive
+regardless of their own producer settings:
+
+    application/json     orjson (always available)
+    application/msgpack  msgpack (only if the package is installed)
+    content_encoding     gzip, or none
+"""
+
+import gzip
+from dataclasses import dataclass
+from typing import Any, Callable
+
+import orjson
+
+try:
+    import msgpack
+except ImportError:  # optional: only needed for application/msgpack
+    msgpack = None
+
+JSON = "application/json"
+MSGPACK = "application/msgpack"
+GZIP = "gzip"
+
+
+class EventCodecError(ValueError):
+    pass
+
+
+def _json_dumps(obj: Any) -> bytes:
+    return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+
+_SERIALIZERS: dict[str, tuple[Callable[[Any], bytes], Callable[[bytes], Any]]] = {
+    JSON: (_json_dumps, orjson.loads),
+}
+if msgpack is not None:
+    _SERIALIZERS[MSGPACK] = (
+        lambda obj: msgpack.packb(obj, default=str, use_bin_type=True),
+        lambda body: msgpack.unpackb(body, raw=False),
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class EventCodec:
+    content_type: str = JSON
+    # bodies at least this large are gzipped; 0 disables compression
+    compress_threshold: int = 0
+    compress_level: int = 6
+
+    def __post_init__(self) -> None:
+        if self.content_type not in _SERIALIZERS:
+            raise EventCodecError(
+                f"Unsupported event content_type {self.content_type!r} "
+                f"(available: {', '.join(sorted(_SERIALIZERS))})"
+            )
+
+    def encode(self, obj: Any) -> tuple[bytes, str, str | None]:
+        """Return ``(body, content_type, content_encoding)``."""
+        body = _SERIALIZERS[self.content_type][0](obj)
+        if self.compress_threshold and len(body) >= self.compress_threshold:
+            return (
+                gzip.compress(body, compresslevel=self.compress_level, mtime=0),
+                self.content_type,
+                GZIP,
+            )
+        return body, self.content_type, None
+
+
+def decode(
+    body: bytes,
+    *,
+    content_type: str | None = None,
+    content_encoding: str | None = None,
+) -> Any:
+    if content_encoding == GZIP:
+        body = gzip.decompress(body)
+    elif content_encoding not in (None, "", "identity"):
+        raise EventCodecError(f"Unsupported content_encoding {content_encoding!r}")
+
+    serializer = _SERIALIZERS.get(content_type or JSON)
+    if serializer is None:
+        raise EventCodecError(f"Unsupported content_type {content_type!r}")
+    return serializer[1](body)
@@ -0,0 +1,135 @@
+import asyncio
+import logging
+from collections.abc import Sequence
+
+from src.base.ports.services.event_bus import (
+    DeadLetter,
+    EventBusHandler,
+    EventBusMessage,
+    EventBusPort,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class InMemoryEventBus(EventBusPort):
+    """Event bus backed by a bounded asyncio queue inside the worker process.
+
+    Meant for single-node deployments: the outbox dispatcher (``broker``
+    strategy) and the consumer share one process. `publish` waits for queue
+    space (backpressure) and then for the local consumer to finish the
+    message, so a "confirm" means the handler committed. A handler failure is
+    returned to the dispatcher, which retries (and eventually parks) the event
+    from the outbox; nothing is kept here across restarts.
+    """
+
+    def __init__(self, *, max_queued: int = 50) -> None:
+        # bounds both the backlog and the deliveries in flight, like a
+        # broker queue with a prefetch window
+        self._queue: asyncio.Queue[tuple[EventBusMessage, asyncio.Future]] = (
+            asyncio.Queue(maxsize=max(1, max_queued))
+        )
+        self._window = asyncio.Semaphore(max(1, max_queued))
+        self._deliveries: set[asyncio.Task] = set()
+        self._consuming = False
+
+    def is_enabled(self) -> bool:
+        return True
+
+    async def publish(self, message: EventBusMessage) -> None:
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((message, future))
+        await future
+
+    async def publish_many(
+        self, messages: Sequence[EventBusMessage]
+    ) -> list[Exception | None]:
+        if not messages:
+            return []
+        # tasks start (and enqueue) in order, so the consumer sees the batch
+        # in publish order
+        results = await asyncio.gather(
+            *(self.publish(message) for message in messages),
+            return_exceptions=True,
+        )
+        outcomes: list[Exception | None] = []
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(result, Exception):
+                raise result
+            outcomes.append(result if isinstance(result, Exception) else None)
+        return outcomes
+
+    async def _deliver(
+        self,
+        handler: EventBusHandler,
+        message: EventBusMessage,
+        future: asyncio.Future,
+    ) -> None:
+        try:
+            await handler(message)
+        except asyncio.CancelledError:
+            if not future.done():
+                future.set_exception(RuntimeError("Event bus closed"))
+            raise
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+        else:
+            if not future.done():
+                future.set_result(None)
+
+    def _delivered(self, task: asyncio.Task) -> None:
+        self._deliveries.discard(task)
+        self._window.release()
+
+    async def consume(self, *, handler: EventBusHandler) -> None:
+        if self._consuming:
+            raise RuntimeError("InMemoryEventBus supports a single consumer")
+        self._consuming = True
+        try:
+            while True:
+                await self._window.acquire()
+                try:
+                    message, future = await self._queue.get()
+                except BaseException:
+                    self._window.release()
+                    raise
+                if future.done():
+                    # publisher gave up (cancelled); the outbox will resend it
+                    self._window.release()
+                    continue
+                if not message.event_type:
+                    logger.warning(
+                        "Dropping message without event_type (message_id=%s)",
+                        message.message_id,
+                    )
+                    future.set_result(None)
+                    self._window.release()
+                    continue
+                # one task per delivery: the handler (PartitionedConsumer)
+                # decides what runs concurrently
+                task = asyncio.create_task(self._deliver(handler, message, future))
+                self._deliveries.add(task)
+                task.add_done_callback(self._delivered)
+        finally:
+            self._consuming = False
+
+    async def list_dead_letters(self, *, limit: int = 100) -> list[DeadLetter]:
+        # failures go back to the outbox dispatcher, which does the parking
+        return []
+
+    async def replay_dead_letters(
+        self, *, limit: int = 100, message_ids: Sequence[str] | None = None
+    ) -> int:
+        return 0
+
+    async def close(self) -> None:
+        deliveries, self._deliveries = self._deliveries, set()
+        for task in deliveries:
+            task.cancel()
+        await asyncio.gather(*deliveries, return_exceptions=True)
+
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            if not future.done():
+                future.set_exception(RuntimeError("Event bus closed"))
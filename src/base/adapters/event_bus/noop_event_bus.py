@@ -1,4 +1,7 @@
+from collections.abc import Sequence
+
 from src.base.ports.services.event_bus import (
+    DeadLetter,
     EventBusHandler,
     EventBusMessage,
     EventBusPort,
@@ -13,8 +16,21 @@ class NoopEventBus(EventBusPort):
     async def publish(self, message: EventBusMessage) -> None:
         return None
 
+    async def publish_many(
+        self, messages: Sequence[EventBusMessage]
+    ) -> list[Exception | None]:
+        return [None] * len(messages)
+
     async def consume(self, *, handler: EventBusHandler) -> None:
         raise RuntimeError("Event bus is disabled (broker_driver=none).")
 
+    async def list_dead_letters(self, *, limit: int = 100) -> list[DeadLetter]:
+        return []
+
+    async def replay_dead_letters(
+        self, *, limit: int = 100, message_ids: Sequence[str] | None = None
+    ) -> int:
+        return 0
+
     async def close(self) -> None:
         return None
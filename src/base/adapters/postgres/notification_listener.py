@@ -0,0 +1,82 @@
+import asyncio
+import logging
+
+import asyncpg
+from sqlalchemy.engine import make_url
+
+from src.base.ports.services.notification_listener import NotificationListenerPort
+
+logger = logging.getLogger(__name__)
+
+
+class PostgresNotificationListener(NotificationListenerPort):
+    """LISTEN on a dedicated asyncpg connection (outside the SQLAlchemy pool).
+
+    Any connection problem degrades to plain polling: `wait` simply sleeps for
+    the timeout and the listener reconnects on the next call.
+    """
+
+    def __init__(self, database_url: str) -> None:
+        url = make_url(database_url).set(drivername="postgresql")
+        self._dsn = url.render_as_string(hide_password=False)
+
+        self._lock = asyncio.Lock()
+        self._conn: asyncpg.Connection | None = None
+        # channel -> waiter -> event; a NOTIFY sets every waiter's event, so
+        # two loops on one channel never consume each other's wakeup
+        self._events: dict[str, dict[str, asyncio.Event]] = {}
+
+    def _on_notify(self, conn, pid, channel: str, payload: str) -> None:
+        for ev in self._events.get(channel, {}).values():
+            ev.set()
+
+    def _on_terminate(self, conn) -> None:
+        logger.warning("LISTEN connection closed; falling back to polling")
+        self._conn = None
+
+    async def _ensure(self, channel: str, waiter: str) -> asyncio.Event:
+        ev = self._events.get(channel, {}).get(waiter)
+        if self._conn is not None and not self._conn.is_closed() and ev is not None:
+            return ev
+
+        async with self._lock:
+            if self._conn is None or self._conn.is_closed():
+                self._conn = await asyncpg.connect(self._dsn)
+                self._conn.add_termination_listener(self._on_terminate)
+                # re-subscribe everything after a reconnect
+                for name, waiters in self._events.items():
+                    await self._conn.add_listener(name, self._on_notify)
+                    for existing in waiters.values():
+                        existing.set()  # notifications may have been missed
+
+            if channel not in self._events:
+                self._events[channel] = {}
+                await self._conn.add_listener(channel, self._on_notify)
+            waiters = self._events[channel]
+            if waiter not in waiters:
+                # first wait: whatever was committed before is picked up by
+                # the caller's own first poll
+                waiters[waiter] = asyncio.Event()
+
+        return self._events[channel][waiter]
+
+    async def wait(self, *, channel: str, timeout: float, waiter: str = "") -> bool:
+        try:
+            ev = await self._ensure(channel, waiter)
+        except Exception:
+            logger.exception("LISTEN %s failed; polling instead", channel)
+            self._conn = None
+            await asyncio.sleep(timeout)
+            return False
+
+        try:
+            await asyncio.wait_for(ev.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return False
+        ev.clear()
+        return True
+
+    async def close(self) -> None:
+        conn, self._conn = self._conn, None
+        if conn is not None and not conn.is_closed():
+            await conn.close()
@@ -1,13 +1,17 @@
 import asyncio
-import json
 import logging
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Any
 
 import aio_pika
 from aio_pika import DeliveryMode
 
+from src.base.adapters.event_bus.codec import JSON, EventCodec, decode
+from src.base.domain.retry_policy import MAX_ATTEMPTS, backoff
 from src.base.ports.services.event_bus import (
+    DeadLetter,
+    DeadLetterError,
     EventBusHandler,
     EventBusMessage,
     EventBusPort,
@@ -15,6 +19,14 @@ from src.base.ports.services.event_bus import (
 
 logger = logging.getLogger(__name__)
 
+# consumer-side retry bookkeeping, carried in AMQP headers
+ATTEMPTS_HEADER = "x-consume-attempts"
+ERROR_HEADER = "x-last-error"
+ROUTING_KEY_HEADER = "x-original-routing-key"
+_BOOKKEEPING_HEADERS = frozenset(
+    (ATTEMPTS_HEADER, ERROR_HEADER, ROUTING_KEY_HEADER, "x-death")
+)
+
 
 @dataclass(frozen=True, slots=True)
 class RabbitMQSettings:
@@ -25,6 +37,11 @@ class RabbitMQSettings:
     routing_key: str = "#"
     prefetch: int = 50
     durable: bool = True
+    max_attempts: int = MAX_ATTEMPTS
+    # producer-side body encoding; consumers decode by the message's own
+    # content_type/content_encoding
+    content_type: str = JSON
+    compress_threshold: int = 0
 
 
 class RabbitMQEventBus(EventBusPort):
@@ -32,6 +49,10 @@ class RabbitMQEventBus(EventBusPort):
         if not settings.url:
             raise ValueError("RabbitMQSettings.url is required")
         self._s = settings
+        self._codec = EventCodec(
+            content_type=settings.content_type,
+            compress_threshold=settings.compress_threshold,
+        )
 
         self._lock = asyncio.Lock()
         self._conn: aio_pika.RobustConnection | None = None
@@ -50,7 +71,8 @@ class RabbitMQEventBus(EventBusPort):
                 return
 
             self._conn = await aio_pika.connect_robust(self._s.url)
-            self._channel = await self._conn.channel()
+            # confirm mode: publish() resolves only once the broker acks
+            self._channel = await self._conn.channel(publisher_confirms=True)
             await self._channel.set_qos(prefetch_count=self._s.prefetch)
 
             self._exchange = await self._channel.declare_exchange(
@@ -59,21 +81,19 @@ class RabbitMQEventBus(EventBusPort):
                 durable=self._s.durable,
             )
 
-    async def publish(self, message: EventBusMessage) -> None:
-        await self._ensure()
-        assert self._exchange is not None
-
+    def _to_amqp(self, message: EventBusMessage) -> aio_pika.Message:
         body_dict: dict[str, Any] = {
             "event_type": message.event_type,
             "payload": message.payload,
             "headers": dict(message.headers or {}),
             "message_id": message.message_id,
         }
-        body = json.dumps(body_dict, default=str).encode("utf-8")
+        body, content_type, content_encoding = self._codec.encode(body_dict)
 
-        amqp_msg = aio_pika.Message(
+        return aio_pika.Message(
             body=body,
-            content_type="application/json",
+            content_type=content_type,
+            content_encoding=content_encoding,
             message_id=message.message_id,
             headers=dict(message.headers or {}),
             delivery_mode=(
@@ -83,10 +103,65 @@ class RabbitMQEventBus(EventBusPort):
             ),
         )
 
-        await self._exchange.publish(amqp_msg, routing_key=message.event_type)
+    async def publish(self, message: EventBusMessage) -> None:
+        await self._ensure()
+        assert self._exchange is not None
 
-    async def consume(self, *, handler: EventBusHandler) -> None:
+        await self._exchange.publish(
+            self._to_amqp(message), routing_key=message.event_type
+        )
+
+    async def publish_many(
+        self, messages: Sequence[EventBusMessage]
+    ) -> list[Exception | None]:
+        if not messages:
+            return []
         await self._ensure()
+        assert self._exchange is not None
+
+        # pipelined: every message goes out before the first confirm is
+        # awaited; the channel keeps them in order
+        results = await asyncio.gather(
+            *(
+                self._exchange.publish(
+                    self._to_amqp(message), routing_key=message.event_type
+                )
+                for message in messages
+            ),
+            return_exceptions=True,
+        )
+        outcomes: list[Exception | None] = []
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(result, Exception):
+                raise result
+            outcomes.append(result if isinstance(result, Exception) else None)
+        return outcomes
+
+    # -------------------------
+    # Retry / dead-letter topology
+    # -------------------------
+    #
+    #   <queue>.retry.<n>s  TTL n seconds, dead-letters back into <queue>
+    #   <queue>.dead        parked after max_attempts, replayed on demand
+    #
+    # Retries are published straight to these queues through the default
+    # exchange, so the main queue keeps its original arguments.
+
+    def _retry_queue_name(self, delay: int) -> str:
+        return f"{self._s.queue}.retry.{delay}s"
+
+    def _dead_queue_name(self) -> str:
+        return f"{self._s.queue}.dead"
+
+    def _retry_delays(self) -> list[int]:
+        return sorted(
+            {
+                int(backoff(attempt).total_seconds())
+                for attempt in range(1, self._s.max_attempts)
+            }
+        )
+
+    async def _declare_topology(self) -> aio_pika.abc.AbstractQueue:
         assert self._channel is not None
         assert self._exchange is not None
 
@@ -94,28 +169,126 @@ class RabbitMQEventBus(EventBusPort):
             name=self._s.queue,
             durable=self._s.durable,
         )
-
         await queue.bind(self._exchange, routing_key=self._s.routing_key)
 
-        async def _on_message(incoming: aio_pika.IncomingMessage) -> None:
-            async with incoming.process(requeue=True):
-                payload = json.loads(incoming.body.decode("utf-8"))
+        for delay in self._retry_delays():
+            await self._channel.declare_queue(
+                name=self._retry_queue_name(delay),
+                durable=self._s.durable,
+                arguments={
+                    "x-message-ttl": delay * 1000,
+                    "x-dead-letter-exchange": "",
+                    "x-dead-letter-routing-key": self._s.queue,
+                },
+            )
+        await self._channel.declare_queue(
+            name=self._dead_queue_name(), durable=self._s.durable
+        )
+        return queue
+
+    @staticmethod
+    def _from_amqp(incoming: aio_pika.abc.AbstractIncomingMessage) -> EventBusMessage:
+        payload = decode(
+            incoming.body,
+            content_type=incoming.content_type,
+            content_encoding=incoming.content_encoding,
+        )
+        return EventBusMessage(
+            event_type=payload.get("event_type", ""),
+            payload=payload.get("payload") or {},
+            headers=payload.get("headers") or {},
+            message_id=payload.get("message_id") or incoming.message_id,
+        )
+
+    @staticmethod
+    def _consume_attempts(incoming: aio_pika.abc.AbstractIncomingMessage) -> int:
+        try:
+            return int((incoming.headers or {}).get(ATTEMPTS_HEADER, 0))
+        except (TypeError, ValueError):
+            return 0
+
+    async def _retry_or_dead_letter(
+        self,
+        incoming: aio_pika.abc.AbstractIncomingMessage,
+        *,
+        error: Exception | str,
+    ) -> None:
+        assert self._channel is not None
+
+        attempts = self._consume_attempts(incoming) + 1
+        if isinstance(error, DeadLetterError):
+            # the handler already retried it in place
+            attempts = max(attempts, self._s.max_attempts)
+        # x-death is added by the broker on every TTL hop; don't let it grow
+        headers = {k: v for k, v in (incoming.headers or {}).items() if k != "x-death"}
+        headers[ATTEMPTS_HEADER] = attempts
+        headers[ERROR_HEADER] = str(error)[:500]
+        headers.setdefault(ROUTING_KEY_HEADER, incoming.routing_key or "")
 
-                msg = EventBusMessage(
-                    event_type=payload.get("event_type", ""),
-                    payload=payload.get("payload") or {},
-                    headers=payload.get("headers") or {},
-                    message_id=payload.get("message_id") or incoming.message_id,
+        if attempts >= self._s.max_attempts:
+            target = self._dead_queue_name()
+        else:
+            target = self._retry_queue_name(int(backoff(attempts).total_seconds()))
+
+        await self._channel.default_exchange.publish(
+            aio_pika.Message(
+                body=incoming.body,
+                content_type=incoming.content_type,
+                content_encoding=incoming.content_encoding,
+                message_id=incoming.message_id,
+                headers=headers,
+                delivery_mode=incoming.delivery_mode,
+            ),
+            routing_key=target,
+        )
+
+    async def consume(self, *, handler: EventBusHandler) -> None:
+        await self._ensure()
+        queue = await self._declare_topology()
+
+        async def _on_message(incoming: aio_pika.abc.AbstractIncomingMessage) -> None:
+            try:
+                msg = self._from_amqp(incoming)
+            except Exception as e:
+                logger.warning(
+                    "Undecodable message (message_id=%s); dead-lettering",
+                    incoming.message_id,
+                )
+                msg, error = None, e
+            else:
+                error = None
+
+            if msg is not None and not msg.event_type:
+                logger.warning(
+                    "Dropping message without event_type (message_id=%s)",
+                    incoming.message_id,
                 )
+                await incoming.ack()
+                return
 
-                if not msg.event_type:
-                    logger.warning(
-                        "Dropping message without event_type (message_id=%s)",
-                        incoming.message_id,
+            if msg is not None:
+                try:
+                    await handler(msg)
+                except Exception as e:
+                    logger.exception(
+                        "Handler failed event_type=%s message_id=%s",
+                        msg.event_type,
+                        msg.message_id,
                     )
-                    return
+                    error = e
 
-                await handler(msg)
+            if error is None:
+                await incoming.ack()
+                return
+
+            try:
+                await self._retry_or_dead_letter(incoming, error=error)
+            except Exception:
+                # could not park it: fall back to a plain requeue
+                logger.exception("Retry publish failed; requeueing")
+                await incoming.nack(requeue=True)
+                return
+            await incoming.ack()
 
         await queue.consume(_on_message)
 
@@ -125,6 +298,112 @@ class RabbitMQEventBus(EventBusPort):
         except asyncio.CancelledError:
             raise
 
+    async def _drain_dead(
+        self, limit: int, *, message_ids: set[str] | None = None
+    ) -> tuple[
+        list[aio_pika.abc.AbstractIncomingMessage],
+        list[aio_pika.abc.AbstractIncomingMessage],
+    ]:
+        """(matching, others) dead messages, all held unacked.
+
+        Without ``message_ids`` the first ``limit`` messages match. With them,
+        the queue is scanned until every id is found (or ``limit`` matched)
+        or it runs out; the caller must settle both lists.
+        """
+        await self._ensure()
+        await self._declare_topology()
+        assert self._channel is not None
+
+        dead = await self._channel.get_queue(self._dead_queue_name())
+        matching: list[aio_pika.abc.AbstractIncomingMessage] = []
+        others: list[aio_pika.abc.AbstractIncomingMessage] = []
+        missing = set(message_ids) if message_ids is not None else None
+        # hold them unacked while collecting, so the same message isn't
+        # fetched twice
+        while len(matching) < limit:
+            if missing is not None and not missing:
+                break
+            incoming = await dead.get(no_ack=False, fail=False)
+            if incoming is None:
+                break
+            if missing is None or incoming.message_id in missing:
+                if missing is not None:
+                    missing.discard(incoming.message_id)
+                matching.append(incoming)
+            else:
+                others.append(incoming)
+        return matching, others
+
+    async def list_dead_letters(self, *, limit: int = 100) -> list[DeadLetter]:
+        fetched, _ = await self._drain_dead(limit)
+        result: list[DeadLetter] = []
+        try:
+            for incoming in fetched:
+                try:
+                    msg = self._from_amqp(incoming)
+                except Exception:
+                    msg = EventBusMessage(
+                        event_type=str(
+                            (incoming.headers or {}).get(ROUTING_KEY_HEADER, "")
+                        ),
+                        payload={},
+                        message_id=incoming.message_id,
+                    )
+                error = (incoming.headers or {}).get(ERROR_HEADER)
+                result.append(
+                    DeadLetter(
+                        message=msg,
+                        attempts=self._consume_attempts(incoming),
+                        error=str(error) if error is not None else None,
+                    )
+                )
+        finally:
+            for incoming in fetched:
+                await incoming.nack(requeue=True)
+        return result
+
+    async def replay_dead_letters(
+        self, *, limit: int = 100, message_ids: Sequence[str] | None = None
+    ) -> int:
+        # with ids, ``limit`` caps the replays, not how deep the scan goes
+        fetched, others = await self._drain_dead(
+            limit, message_ids=set(message_ids) if message_ids is not None else None
+        )
+        for incoming in others:
+            await incoming.nack(requeue=True)
+        assert self._exchange is not None
+
+        replayed = 0
+        for incoming in fetched:
+            try:
+                headers = {
+                    k: v
+                    for k, v in (incoming.headers or {}).items()
+                    if k not in _BOOKKEEPING_HEADERS
+                }
+                routing_key = str(
+                    (incoming.headers or {}).get(ROUTING_KEY_HEADER)
+                    or self._from_amqp(incoming).event_type
+                )
+                await self._exchange.publish(
+                    aio_pika.Message(
+                        body=incoming.body,
+                        content_type=incoming.content_type,
+                        content_encoding=incoming.content_encoding,
+                        message_id=incoming.message_id,
+                        headers=headers,
+                        delivery_mode=incoming.delivery_mode,
+                    ),
+                    routing_key=routing_key,
+                )
+            except Exception:
+                logger.exception("Replay failed for message_id=%s", incoming.message_id)
+                await incoming.nack(requeue=True)
+                continue
+            await incoming.ack()
+            replayed += 1
+        return replayed
+
     async def close(self) -> None:
         try:
             if self._channel:
@@ -0,0 +1,130 @@
+"""Typed cache codec: round-trips entities, enums, UUIDs and datetimes.
+
+Values are encoded as orjson with a small tagging scheme. Any dict that carries
+the reserved ``__t__`` key is a tagged value:
+
+    {"__t__": "entity", "c": "pkg.module:Class", "v": {...state...}}
+    {"__t__": "enum", "c": "pkg.module:Class", "v": <value>}
+    {"__t__": "dt" | "date" | "uuid", "v": "<iso / hex>"}
+    {"__t__": "dict", "v": {...}}  # a plain dict that itself used "__t__"
+
+Classes are resolved only among this project's own ``BaseEntity`` and ``Enum``
+subclasses that are already imported, so a cached payload can neither trigger
+an import nor name any other callable.
+"""
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Any
+from uuid import UUID
+
+import orjson
+
+from src.base.domain.entity import BaseEntity
+
+TAG = "__t__"
+
+
+class CodecError(ValueError):
+    pass
+
+
+def _class_path(cls: type) -> str:
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+# classes a payload may name, per base; the project's own subclasses only
+_ALLOWED_PACKAGE = "src."
+_allowed: dict[type, dict[str, type]] = {}
+
+
+def _subclasses(base: type) -> dict[str, type]:
+    found: dict[str, type] = {}
+    pending = list(base.__subclasses__())
+    while pending:
+        cls = pending.pop()
+        pending.extend(cls.__subclasses__())
+        if cls.__module__.startswith(_ALLOWED_PACKAGE):
+            found[_class_path(cls)] = cls
+    return found
+
+
+def _resolve(path: str, base: type) -> type:
+    registry = _allowed.get(base)
+    if registry is None or path not in registry:
+        # rebuilt on a miss: the class may have been imported since
+        registry = _allowed[base] = _subclasses(base)
+    cls = registry.get(path)
+    if cls is None:
+        raise CodecError(f"Not an allowed {base.__name__}: {path}")
+    return cls
+
+
+def _entity_state(entity: BaseEntity) -> dict[str, Any]:
+    state = dict(getattr(entity, "__dict__", {}))
+    for cls in type(entity).__mro__:
+        for name in getattr(cls, "__slots__", ()):
+            if name not in state and hasattr(entity, name):
+                state[name] = getattr(entity, name)
+    return state
+
+
+def _pack(obj: Any) -> Any:
+    # enums first: str/int enums would otherwise pass as plain scalars
+    if isinstance(obj, Enum):
+        return {TAG: "enum", "c": _class_path(type(obj)), "v": _pack(obj.value)}
+    if obj is None or isinstance(obj, (str, int, float, bool)):
+        return obj
+    if isinstance(obj, BaseEntity):
+        state = {k: _pack(v) for k, v in _entity_state(obj).items()}
+        return {TAG: "entity", "c": _class_path(type(obj)), "v": state}
+    if isinstance(obj, datetime):
+        return {TAG: "dt", "v": obj.isoformat()}
+    if isinstance(obj, date):
+        return {TAG: "date", "v": obj.isoformat()}
+    if isinstance(obj, UUID):
+        return {TAG: "uuid", "v": obj.hex}
+    if isinstance(obj, dict):
+        packed = {str(k): _pack(v) for k, v in obj.items()}
+        return {TAG: "dict", "v": packed} if TAG in packed else packed
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return [_pack(v) for v in obj]
+    raise CodecError(f"Cannot encode value of type {type(obj).__name__}")
+
+
+def _unpack(obj: Any) -> Any:
+    if isinstance(obj, list):
+        return [_unpack(v) for v in obj]
+    if not isinstance(obj, dict):
+        return obj
+
+    tag = obj.get(TAG)
+    if tag is None:
+        return {k: _unpack(v) for k, v in obj.items()}
+    if tag == "dict":
+        return {k: _unpack(v) for k, v in obj["v"].items()}
+    if tag == "dt":
+        return datetime.fromisoformat(obj["v"])
+    if tag == "date":
+        return date.fromisoformat(obj["v"])
+    if tag == "uuid":
+        return UUID(hex=obj["v"])
+    if tag == "enum":
+        enum_cls = _resolve(obj["c"], Enum)
+        return enum_cls(_unpack(obj["v"]))
+    if tag == "entity":
+        entity_cls = _resolve(obj["c"], BaseEntity)
+        # bypass __init__: constructors validate/derive fields, state is final
+        entity = entity_cls.__new__(entity_cls)
+        for name, value in obj["v"].items():
+            setattr(entity, name, _unpack(value))
+        return entity
+    raise CodecError(f"Unknown tag: {tag!r}")
+
+
+def encode(value: Any) -> bytes:
+    return orjson.dumps(_pack(value))
+
+
+def decode(raw: bytes) -> Any:
+    return _unpack(orjson.loads(raw))
@@ -1,29 +1,32 @@
-import json
-from datetime import datetime
+import logging
 from typing import Any, Mapping, Sequence, Dict
 
 from redis.asyncio import Redis
 
+from src.base.adapters.redis import codec
 from src.base.ports.repositories.cache_repository import AbstractCacheRepository
 
+logger = logging.getLogger(__name__)
+
 
 def _serialize(value: Any) -> bytes:
+    return codec.encode(value)
 
-    def default(obj):
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
-    return json.dumps(value, default=default).encode("utf-8")
+# marker for a payload that could not be decoded
+_UNDECODABLE = object()
 
 
-def _deserialize(raw: bytes | None) -> Any | None:
+def _deserialize(key: str, raw: bytes | None) -> Any | None:
     if raw is None:
         return None
     try:
-        return json.loads(raw.decode("utf-8"))
+        return codec.decode(raw)
     except Exception:
-        return raw
+        # stale/foreign payload (class renamed, enum value removed, ...):
+        # behave like a miss; the caller drops the key
+        logger.warning("Dropping undecodable cache value %s", key, exc_info=True)
+        return _UNDECODABLE
 
 
 class RedisCacheRepository(AbstractCacheRepository):
@@ -42,7 +45,11 @@ class RedisCacheRepository(AbstractCacheRepository):
 
     async def get(self, *, key: str) -> Any | None:
         raw = await self._redis.get(self._k(key))
-        return _deserialize(raw)
+        value = _deserialize(key, raw)
+        if value is _UNDECODABLE:
+            await self._redis.delete(self._k(key))
+            return None
+        return value
 
     async def set(self, *, key: str, value: Any, ttl: int | None = None) -> None:
         raw = _serialize(value)
@@ -54,6 +61,14 @@ class RedisCacheRepository(AbstractCacheRepository):
     async def delete(self, *, key: str) -> None:
         await self._redis.delete(self._k(key))
 
+    async def set_if_absent(
+        self, *, key: str, value: Any, ttl: int | None = None
+    ) -> bool:
+        raw = _serialize(value)
+        if ttl is None:
+            return bool(await self._redis.set(self._k(key), raw, nx=True))
+        return bool(await self._redis.set(self._k(key), raw, ex=int(ttl), nx=True))
+
     async def exists(self, *, key: str) -> bool:
         return bool(await self._redis.exists(self._k(key)))
 
@@ -75,8 +90,15 @@ class RedisCacheRepository(AbstractCacheRepository):
         real_keys = [self._k(k) for k in keys]
         raws = await self._redis.mget(*real_keys)
         result: Dict[str, Any | None] = {}
+        undecodable: list[str] = []
         for k, raw in zip(keys, raws):
-            result[k] = _deserialize(raw)
+            value = _deserialize(k, raw)
+            if value is _UNDECODABLE:
+                undecodable.append(self._k(k))
+                value = None
+            result[k] = value
+        if undecodable:
+            await self._redis.delete(*undecodable)
         return result
 
     async def set_many(
@@ -85,17 +107,17 @@ class RedisCacheRepository(AbstractCacheRepository):
         if not mapping:
             return
         kv = {self._k(k): _serialize(v) for k, v in mapping.items()}
-        await self._redis.mset(kv)
-        if ttl is not None:
-            async def _expire_all():
-                for k in kv.keys():
-                    await self._redis.expire(k, int(ttl))
-
-            for k in kv.keys():
-                await self._redis.expire(k, int(ttl))
+        if ttl is None:
+            await self._redis.mset(kv)
+            return
+        # one round trip; SET EX keeps value and expiry atomic per key
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for k, raw in kv.items():
+                pipe.set(k, raw, ex=int(ttl))
+            await pipe.execute()
 
     async def clear(self, *, prefix: str | None = None) -> None:
-        p = prefix if prefix is not None else self._prefix or ""
+        p = self._k(prefix) if prefix is not None else self._prefix or ""
         if p == "":
             raise RuntimeError(
                 "Clearing entire Redis DB is dangerous. Pass a non-empty prefix."
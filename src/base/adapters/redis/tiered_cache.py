@@ -0,0 +1,283 @@
+"""In-process L1 cache in front of a remote (Redis) cache repository.
+
+Reads are served from a bounded LRU with a short TTL; misses fall through to
+the remote layer and are kept locally. Every write goes to the remote layer
+first and is then broadcast on a Redis pub/sub channel so other processes drop
+their L1 copy of the key.
+
+The L1 is only used while the invalidation subscription is live. Until it is
+(or after it drops) every call is a plain pass-through, and a reconnect
+flushes the whole L1 because invalidations may have been missed.
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Mapping, Sequence
+
+import orjson
+from redis.asyncio import Redis
+
+from src.base.adapters.redis import codec
+from src.base.ports.repositories.cache_repository import AbstractCacheRepository
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_CHANNEL = "cache:invalidate"
+
+
+def _prefix_of(key: str) -> str:
+    return key.split(":", 1)[0]
+
+
+class TieredCacheRepository(AbstractCacheRepository):
+    def __init__(
+        self,
+        remote: AbstractCacheRepository,
+        redis_client: "Redis",
+        *,
+        max_entries: int = 10_000,
+        ttl: float = 5.0,
+        channel: str = INVALIDATION_CHANNEL,
+    ) -> None:
+        self._remote = remote
+        self._redis = redis_client
+        self._max_entries = max(0, int(max_entries))
+        self._ttl = float(ttl)
+        self._channel = channel
+        self._node = uuid.uuid4().hex
+
+        # key -> (expires_at, encoded value); values are stored encoded so
+        # callers never share (and mutate) the same entity instance
+        self._local: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._stats: dict[str, dict[str, int]] = {}
+
+        self._listening = False
+        self._listener: asyncio.Task | None = None
+
+    # -------------------------
+    # L1 helpers
+    # -------------------------
+
+    @property
+    def _enabled(self) -> bool:
+        return self._max_entries > 0 and self._listening
+
+    def _count(self, key: str, field: str, n: int = 1) -> None:
+        stats = self._stats.get(_prefix_of(key))
+        if stats is None:
+            stats = self._stats[_prefix_of(key)] = {
+                "hits": 0,
+                "misses": 0,
+                "evictions": 0,
+            }
+        stats[field] += n
+
+    def _lookup(self, key: str) -> tuple[bool, Any | None]:
+        entry = self._local.get(key)
+        if entry is None:
+            return False, None
+        expires_at, raw = entry
+        if expires_at < time.monotonic():
+            del self._local[key]
+            return False, None
+        self._local.move_to_end(key)
+        return True, codec.decode(raw)
+
+    def _remember(self, key: str, value: Any, ttl: int | None = None) -> None:
+        if not self._enabled or value is None:
+            return
+        try:
+            raw = codec.encode(value)
+        except Exception:
+            return
+        local_ttl = self._ttl if ttl is None else min(self._ttl, ttl)
+        self._local[key] = (time.monotonic() + local_ttl, raw)
+        self._local.move_to_end(key)
+        while len(self._local) > self._max_entries:
+            evicted, _ = self._local.popitem(last=False)
+            self._count(evicted, "evictions")
+
+    def _forget(self, keys: Sequence[str]) -> None:
+        for key in keys:
+            self._local.pop(key, None)
+
+    def _forget_prefix(self, prefix: str | None) -> None:
+        if not prefix:
+            self._local.clear()
+            return
+        p = prefix if prefix.endswith(":") else prefix + ":"
+        for key in [k for k in self._local if k.startswith(p)]:
+            del self._local[key]
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Hit/miss/eviction counters per key prefix (first ``:`` segment)."""
+        return {prefix: dict(counters) for prefix, counters in self._stats.items()}
+
+    # -------------------------
+    # Cross-process invalidation
+    # -------------------------
+
+    def _ensure_listener(self) -> None:
+        if self._max_entries == 0:
+            return
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen())
+
+    async def _listen(self) -> None:
+        while True:
+            pubsub = self._redis.pubsub()
+            try:
+                await pubsub.subscribe(self._channel)
+                # anything cached before (re)subscribing may have missed
+                # an invalidation
+                self._local.clear()
+                self._listening = True
+                async for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        self._on_invalidate(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning(
+                    "Cache invalidation subscription lost; L1 disabled",
+                    exc_info=True,
+                )
+            finally:
+                self._listening = False
+                self._local.clear()
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+            await asyncio.sleep(1.0)
+
+    def _on_invalidate(self, data: bytes | str) -> None:
+        try:
+            msg = orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return
+        if msg.get("n") == self._node:
+            return
+        if "p" in msg:
+            self._forget_prefix(msg["p"])
+        else:
+            self._forget(msg.get("k") or [])
+
+    async def _broadcast(
+        self, *, keys: Sequence[str] = (), prefix: str | None = None
+    ) -> None:
+        if self._max_entries == 0:
+            return
+        msg: dict[str, Any] = {"n": self._node}
+        if prefix is not None:
+            msg["p"] = prefix
+        else:
+            msg["k"] = list(keys)
+        try:
+            await self._redis.publish(self._channel, orjson.dumps(msg))
+        except Exception:
+            # peers fall back to their L1 TTL
+            logger.warning("Failed to publish cache invalidation", exc_info=True)
+
+    async def close(self) -> None:
+        listener, self._listener = self._listener, None
+        if listener is not None:
+            listener.cancel()
+            try:
+                await listener
+            except (asyncio.CancelledError, Exception):
+                pass
+
+    # -------------------------
+    # AbstractCacheRepository
+    # -------------------------
+
+    async def get(self, *, key: str) -> Any | None:
+        self._ensure_listener()
+        if self._enabled:
+            found, value = self._lookup(key)
+            if found:
+                self._count(key, "hits")
+                return value
+            self._count(key, "misses")
+
+        value = await self._remote.get(key=key)
+        self._remember(key, value)
+        return value
+
+    async def set(self, *, key: str, value: Any, ttl: int | None = None) -> None:
+        await self._remote.set(key=key, value=value, ttl=ttl)
+        self._remember(key, value, ttl)
+        await self._broadcast(keys=[key])
+
+    async def delete(self, *, key: str) -> None:
+        await self._remote.delete(key=key)
+        self._forget([key])
+        await self._broadcast(keys=[key])
+
+    async def set_if_absent(
+        self, *, key: str, value: Any, ttl: int | None = None
+    ) -> bool:
+        # used for locks/claims: always decided by the shared layer
+        added = await self._remote.set_if_absent(key=key, value=value, ttl=ttl)
+        if added:
+            self._forget([key])
+            await self._broadcast(keys=[key])
+        return added
+
+    async def exists(self, *, key: str) -> bool:
+        if self._enabled and self._lookup(key)[0]:
+            return True
+        return await self._remote.exists(key=key)
+
+    async def incr(self, *, key: str, amount: int = 1, ttl: int | None = None) -> int:
+        new = await self._remote.incr(key=key, amount=amount, ttl=ttl)
+        self._forget([key])
+        await self._broadcast(keys=[key])
+        return new
+
+    async def decr(self, *, key: str, amount: int = 1, ttl: int | None = None) -> int:
+        new = await self._remote.decr(key=key, amount=amount, ttl=ttl)
+        self._forget([key])
+        await self._broadcast(keys=[key])
+        return new
+
+    async def get_many(self, *, keys: Sequence[str]) -> Mapping[str, Any | None]:
+        self._ensure_listener()
+        result: dict[str, Any | None] = {}
+        missing: list[str] = []
+        for key in keys:
+            if self._enabled:
+                found, value = self._lookup(key)
+                if found:
+                    self._count(key, "hits")
+                    result[key] = value
+                    continue
+                self._count(key, "misses")
+            missing.append(key)
+
+        if missing:
+            fetched = await self._remote.get_many(keys=missing)
+            for key in missing:
+                value = fetched.get(key)
+                self._remember(key, value)
+                result[key] = value
+        return result
+
+    async def set_many(
+        self, *, mapping: Mapping[str, Any], ttl: int | None = None
+    ) -> None:
+        if not mapping:
+            return
+        await self._remote.set_many(mapping=mapping, ttl=ttl)
+        for key, value in mapping.items():
+            self._remember(key, value, ttl)
+        await self._broadcast(keys=list(mapping))
+
+    async def clear(self, *, prefix: str | None = None) -> None:
+        await self._remote.clear(prefix=prefix)
+        self._forget_prefix(prefix)
+        await self._broadcast(prefix=prefix or "")
@@ -1,13 +1,50 @@
-from sqlalchemy import Column, DateTime, Integer, JSON, String, Text, text
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Enum,
+    Index,
+    Integer,
+    JSON,
+    String,
+    Text,
+    text,
+)
 from sqlalchemy.sql import func
 
 from src.base.adapters.sqlalchemydb.database import Base
 from src.base.adapters.sqlalchemydb.mixins import EntityModelMixin
 from src.base.domain.entities.outbox_event import OutboxEvent
+from src.base.domain.enums.priority import Priority
+
+OPEN_DEDUP_PREDICATE = (
+    "processed_at IS NULL AND claimed_by IS NULL AND dedup_key IS NOT NULL"
+)
 
 
 class OutboxEventModel(Base, EntityModelMixin):
     __tablename__ = "outbox_events"
+    __table_args__ = (
+        Index(
+            "ix_outbox_events_dedup_key_pending",
+            "dedup_key",
+            postgresql_where=text("processed_at IS NULL AND dedup_key IS NOT NULL"),
+        ),
+        # at most one open (unprocessed, unleased) row per key and lane:
+        # publishers coalesce into it with INSERT ... ON CONFLICT
+        Index(
+            "ux_outbox_events_dedup_key_open",
+            "dedup_key",
+            "priority",
+            unique=True,
+            postgresql_where=text(OPEN_DEDUP_PREDICATE),
+        ),
+        Index(
+            "ix_outbox_events_priority_ready",
+            "priority",
+            "available_at",
+            postgresql_where=text("processed_at IS NULL"),
+        ),
+    )
 
     entity_cls = OutboxEvent
     _entity_fields = [
@@ -21,6 +58,9 @@ class OutboxEventModel(Base, EntityModelMixin):
         "aggregate_type",
         "aggregate_id",
         "created_at",
+        "claimed_by",
+        "claimed_until",
+        "priority",
     ]
 
     id = Column(Integer, primary_key=True, index=True)
@@ -43,3 +83,12 @@ class OutboxEventModel(Base, EntityModelMixin):
     created_at = Column(
         DateTime(timezone=True), nullable=False, index=True, server_default=func.now()
     )
+
+    claimed_by = Column(String(128), nullable=True)
+    claimed_until = Column(DateTime(timezone=True), nullable=True)
+
+    priority = Column(
+        Enum(Priority, name="priority"),
+        nullable=False,
+        server_default=Priority.bulk.name,
+    )
@@ -25,6 +25,14 @@ class AsyncSqlalchemyQueries:
         model = res.scalars().first()
         return None if model is None else mapper(model)
 
+    async def _all_tuples(
+        self,
+        stmt: Executable,
+        mapper: Callable[[tuple], T],
+    ) -> list[T]:
+        res = await self.session.execute(stmt)
+        return [mapper(tuple(row)) for row in res.all()]
+
     async def _one_tuple(
         self,
         stmt: Executable,
@@ -1,12 +1,40 @@
-from datetime import datetime
+from collections.abc import Sequence
+from datetime import datetime, timedelta
 
-from sqlalchemy import select
+from sqlalchemy import Select, String, cast, func, or_, select, text, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from src.base.adapters.sqlalchemydb.repository import AsyncSqlalchemyRepository
-from src.base.adapters.sqlalchemydb.models.outbox_event import OutboxEventModel
+from src.base.adapters.sqlalchemydb.models.outbox_event import (
+    OPEN_DEDUP_PREDICATE,
+    OutboxEventModel,
+)
 from src.base.domain.entities.outbox_event import OutboxEvent
-from src.base.ports.repositories.outbox_event_repo_port import OutboxEventRepositoryPort
+from src.base.domain.enums.priority import Priority
+from src.base.ports.repositories.outbox_event_repo_port import (
+    OUTBOX_NOTIFY_CHANNEL,
+    OutboxEventRepositoryPort,
+)
+
+
+def _unclaimed(now: datetime | None = None):
+    until = OutboxEventModel.claimed_until
+    return or_(until.is_(None), until <= (func.now() if now is None else now))
+
+
+def _in_shard(stmt: Select, shard: tuple[int, int] | None) -> Select:
+    if shard is None:
+        return stmt
+    # (index, count): stable hash of the aggregate so every event of an
+    # aggregate is always claimed by the same worker process
+    index, count = shard
+    key = func.coalesce(
+        OutboxEventModel.aggregate_id, cast(OutboxEventModel.id, String)
+    )
+    return stmt.where(func.hashtext(key).op("&")(0x7FFFFFFF) % count == index)
 
 
 class SqlalchemyOutboxEventRepository(
@@ -16,6 +44,66 @@ class SqlalchemyOutboxEventRepository(
     def __init__(self, session: AsyncSession) -> None:
         super().__init__(session=session, model=OutboxEventModel)
 
+    async def add_or_coalesce(self, *, entity: OutboxEvent, **kwargs) -> OutboxEvent:
+        if not entity.dedup_key:
+            return await self.add(entity=entity)
+
+        # the unique open-row index makes this atomic: of two concurrent
+        # publishers one inserts and the other folds into that row. Leased
+        # rows are outside the index, so a row a dispatcher is handling never
+        # absorbs a re-publish (e.g. "more messages remain").
+        model = OutboxEventModel.from_entity(entity)
+        values = {
+            c.key: getattr(model, c.key)
+            for c in OutboxEventModel.__table__.columns
+            if getattr(model, c.key) is not None
+        }
+        stmt = insert(OutboxEventModel).values(**values)
+        stmt = (
+            stmt.on_conflict_do_update(
+                index_elements=[OutboxEventModel.dedup_key, OutboxEventModel.priority],
+                index_where=text(OPEN_DEDUP_PREDICATE),
+                set_={
+                    "available_at": func.least(
+                        OutboxEventModel.available_at, stmt.excluded.available_at
+                    )
+                },
+            )
+            .returning(OutboxEventModel)
+            .execution_options(populate_existing=True)
+        )
+        res = await self.session.execute(stmt)
+        return res.scalars().one().to_entity()
+
+    async def add_many(
+        self, *, entities: list[OutboxEvent], **kwargs
+    ) -> list[OutboxEvent]:
+        models = [OutboxEventModel.from_entity(e) for e in entities]
+        self.session.add_all(models)
+        await self.session.flush()  # one batched INSERT ... RETURNING
+        return [m.to_entity() for m in models]
+
+    async def get_next_due_at(
+        self,
+        *,
+        shard: tuple[int, int] | None = None,
+        priorities: Sequence[Priority] | None = None,
+        **kwargs,
+    ) -> datetime | None:
+        due = func.greatest(
+            OutboxEventModel.available_at,
+            func.coalesce(
+                OutboxEventModel.claimed_until, OutboxEventModel.available_at
+            ),
+        )
+        stmt = select(func.min(due)).where(OutboxEventModel.processed_at.is_(None))
+        if priorities is not None:
+            stmt = stmt.where(OutboxEventModel.priority.in_(list(priorities)))
+        stmt = _in_shard(stmt, shard)
+
+        res = await self.session.execute(stmt)
+        return res.scalar_one_or_none()
+
     async def get_ready(
         self,
         *,
@@ -23,6 +111,7 @@ class SqlalchemyOutboxEventRepository(
         limit: int = 100,
         lock: bool = False,
         skip_locked: bool = True,
+        shard: tuple[int, int] | None = None,
         **kwargs,
     ) -> list[OutboxEvent]:
         stmt = (
@@ -35,8 +124,175 @@ class SqlalchemyOutboxEventRepository(
             .limit(limit)
         )
 
+        stmt = _in_shard(stmt, shard)
+
         if lock:
             stmt = stmt.with_for_update(skip_locked=skip_locked)
 
         res = await self.session.execute(stmt)
         return [m.to_entity() for m in res.scalars().all()]
+
+    async def _lock_lanes(
+        self, *, priority: Priority | None, shard: tuple[int, int] | None
+    ) -> None:
+        # the aggregate_busy check below only sees committed leases; holding
+        # this until commit makes concurrent claims on a lane take turns, so
+        # each one sees the leases the previous one took. Shards never share
+        # an aggregate, so they do not contend. Lanes must be locked in one
+        # order everywhere: Priority order, the weighted claim's order too.
+        lanes = list(Priority) if priority is None else [priority]
+        part = "*" if shard is None else f"{shard[0]}/{shard[1]}"
+        for lane in lanes:
+            key = func.hashtext(f"outbox_claim:{lane.value}:{part}")
+            await self.session.execute(select(func.pg_advisory_xact_lock(key)))
+
+    async def claim_ready(
+        self,
+        *,
+        now: datetime,
+        worker_id: str,
+        lease: timedelta,
+        limit: int = 100,
+        shard: tuple[int, int] | None = None,
+        priority: Priority | None = None,
+        **kwargs,
+    ) -> list[OutboxEvent]:
+        await self._lock_lanes(priority=priority, shard=shard)
+
+        other = aliased(OutboxEventModel)
+        aggregate_busy = (
+            select(other.id)
+            .where(
+                other.aggregate_id == OutboxEventModel.aggregate_id,
+                other.aggregate_type.is_not_distinct_from(
+                    OutboxEventModel.aggregate_type
+                ),
+                # lanes are ordered independently: a single send is not held
+                # back by a campaign batch on the same session
+                other.priority == OutboxEventModel.priority,
+                other.processed_at.is_(None),
+                other.claimed_until > now,
+                other.claimed_by.is_distinct_from(worker_id),
+            )
+            .exists()
+        )
+        claimable = (
+            select(OutboxEventModel.id)
+            .where(
+                OutboxEventModel.processed_at.is_(None),
+                OutboxEventModel.available_at <= now,
+                _unclaimed(now),
+                ~aggregate_busy,
+            )
+            .order_by(OutboxEventModel.available_at.asc(), OutboxEventModel.id.asc())
+            .limit(limit)
+        )
+        if priority is not None:
+            claimable = claimable.where(OutboxEventModel.priority == priority)
+        claimable = (
+            _in_shard(claimable, shard)
+            .with_for_update(skip_locked=True)
+            .cte("claimable")
+        )
+
+        stmt = (
+            update(OutboxEventModel)
+            .where(OutboxEventModel.id == claimable.c.id)
+            .values(claimed_by=worker_id, claimed_until=now + lease)
+            .returning(OutboxEventModel)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        res = await self.session.execute(stmt)
+        events = [m.to_entity() for m in res.scalars().all()]
+        # RETURNING order is unspecified
+        events.sort(key=lambda e: (e.available_at, e.id))
+        return events
+
+    async def extend_claims(
+        self, *, ids: list[int], worker_id: str, until: datetime, **kwargs
+    ) -> int:
+        if not ids:
+            return 0
+        stmt = (
+            update(OutboxEventModel)
+            .where(
+                OutboxEventModel.id.in_(ids),
+                OutboxEventModel.claimed_by == worker_id,
+                OutboxEventModel.processed_at.is_(None),
+            )
+            .values(claimed_until=until)
+            .execution_options(synchronize_session=False)
+        )
+        res = await self.session.execute(stmt)
+        return res.rowcount or 0
+
+    async def release_claim(
+        self, *, entity: OutboxEvent, worker_id: str, **kwargs
+    ) -> bool:
+        try:
+            async with self.session.begin_nested():
+                released = await self._release(entity=entity, worker_id=worker_id)
+        except IntegrityError:
+            # re-opening it collides with a row published while it was leased
+            released = await self._fold_into_open(entity=entity, worker_id=worker_id)
+        entity.claimed_by = None
+        entity.claimed_until = None
+        return released
+
+    async def _fold_into_open(self, *, entity: OutboxEvent, worker_id: str) -> bool:
+        """Coalesce a released row into the open row with its key and lane."""
+        await self.session.execute(
+            update(OutboxEventModel)
+            .where(
+                OutboxEventModel.dedup_key == entity.dedup_key,
+                OutboxEventModel.priority == entity.priority,
+                text(OPEN_DEDUP_PREDICATE),
+            )
+            .values(
+                available_at=func.least(
+                    OutboxEventModel.available_at, entity.available_at
+                )
+            )
+            .execution_options(synchronize_session=False)
+        )
+        res = await self.session.execute(
+            update(OutboxEventModel)
+            .where(
+                OutboxEventModel.id == entity.id,
+                OutboxEventModel.claimed_by == worker_id,
+            )
+            .values(
+                processed_at=func.now(),
+                attempts=entity.attempts,
+                last_error="coalesced into a later publish",
+                claimed_by=None,
+                claimed_until=None,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return bool(res.rowcount)
+
+    async def _release(self, *, entity: OutboxEvent, worker_id: str) -> bool:
+        stmt = (
+            update(OutboxEventModel)
+            .where(
+                OutboxEventModel.id == entity.id,
+                OutboxEventModel.claimed_by == worker_id,
+            )
+            .values(
+                available_at=entity.available_at,
+                processed_at=entity.processed_at,
+                attempts=entity.attempts,
+                last_error=entity.last_error,
+                claimed_by=None,
+                claimed_until=None,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        res = await self.session.execute(stmt)
+        return bool(res.rowcount)
+
+    async def notify_ready(self, **kwargs) -> None:
+        # NOTIFY is transactional: delivered on commit, dropped on rollback,
+        # and collapsed to one delivery per transaction.
+        await self.session.execute(select(func.pg_notify(OUTBOX_NOTIFY_CHANNEL, "")))
@@ -1,17 +1,24 @@
-from typing import Generic, Type, TypeVar
+from typing import Any, Awaitable, Callable, Generic, Iterable, Type, TypeVar
 from hashlib import sha256
 from json import dumps
-from sqlalchemy import select
+from sqlalchemy import any_, bindparam, select
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.base.adapters.sqlalchemydb.mixins import EntityModelMixin
 from src.base.ports.repositories.repository import AbstractRepository
 from src.base.domain.entity import BaseEntity
 from src.base.ports.repositories.cache_repository import AbstractCacheRepository
+from src.base.infrastructure.lazy_entity_cache import entity_cache_key
 
 E = TypeVar("E", bound=BaseEntity)
 M = TypeVar("M", bound=EntityModelMixin)
 
+# per-UoW read memo: (model name, id) -> entity already loaded in this session
+IdentityMap = dict[tuple[str, Any], BaseEntity]
+# per-UoW callbacks the UoW awaits once its transaction has committed
+AfterCommit = list[Callable[[], Awaitable[None]]]
+
 
 class AsyncSqlalchemyRepository(AbstractRepository, Generic[E, M]):
 
@@ -22,12 +29,16 @@ class AsyncSqlalchemyRepository(AbstractRepository, Generic[E, M]):
         cache_repo: AbstractCacheRepository | None = None,
         *,
         default_ttl: int = 3600,
+        identity_map: IdentityMap | None = None,
+        after_commit: AfterCommit | None = None,
     ) -> None:
         super().__init__(session)
         self.session: AsyncSession = session
         self.model: Type[M] = model
         self._cache = cache_repo
         self._default_ttl = default_ttl
+        self._identity_map = identity_map
+        self._after_commit = after_commit
 
     # -------------------------
     # Write operations
@@ -43,6 +54,10 @@ class AsyncSqlalchemyRepository(AbstractRepository, Generic[E, M]):
         self.session.add(model)
         await self.session.flush()
         await self.session.refresh(model)
+
+        if self._cache:
+            await self._invalidate_model_caches()
+
         return model.to_entity()
 
     async def update(
@@ -56,9 +71,11 @@ class AsyncSqlalchemyRepository(AbstractRepository, Generic[E, M]):
         await self.session.flush()
         await self.session.refresh(merged)
         result = merged.to_entity()
+        if entity.id is not None:
+            self._forget(entity.id)
 
         if self._cache and entity.id is not None:
-            await self._invalidate_model_caches()
+            await self._invalidate_model_caches(id=entity.id)
 
         return result
 
@@ -73,8 +90,9 @@ class AsyncSqlalchemyRepository(AbstractRepository, Generic[E, M]):
         if not model:
             return
 
+        self._forget(id)
         if self._cache:
-            await self._invalidate_model_caches()
+            await self._invalidate_model_caches(id=id)
 
         if soft_delete and hasattr(model, "deleted_at"):
             from datetime import datetime, timezone
@@ -85,6 +103,27 @@ class AsyncSqlalchemyRepository(AbstractRepository, Generic[E, M]):
             await self.session.delete(model)
             await self.session.flush()
 
+    # -------------------------
+    # Identity map helpers
+    # -------------------------
+
+    def _identity_key(self, id: Any) -> tuple[str, Any]:
+        return (self.model.__name__, id)
+
+    def _remember(self, entity: E) -> E:
+        if self._identity_map is not None and entity.id is not None:
+            self._identity_map[self._identity_key(entity.id)] = entity
+        return entity
+
+    def _forget(self, id: Any) -> None:
+        if self._identity_map is not None:
+            self._identity_map.pop(self._identity_key(id), None)
+
+    def _known(self, id: Any) -> E | None:
+        if self._identity_map is None:
+            return None
+        return self._identity_map.get(self._identity_key(id))  # type: ignore[return-value]
+
     # -------------------------
     # Cache helpers
     # -------------------------
@@ -93,15 +132,45 @@ class AsyncSqlalchemyRepository(AbstractRepository, Generic[E, M]):
         """Generate cache key for entity by ID."""
         return f"{self.model.__name__}:id:{id}"
 
-    def _query_cache_key(self, **params) -> str:
+    def _generation_cache_key(self) -> str:
+        return f"{self.model.__name__}:gen"
+
+    async def _scoped_cache_key(self, suffix: str) -> str:
+        """Key for derived (non-id) caches, namespaced by the model generation.
+
+        Bumping the generation orphans every such key at once; orphans simply
+        age out through their TTL.
+        """
+        generation = 0
+        if self._cache:
+            generation = int(
+                await self._cache.get(key=self._generation_cache_key()) or 0
+            )
+        return f"{self.model.__name__}:g{generation}:{suffix}"
+
+    async def _query_cache_key(self, **params) -> str:
         param_str = dumps(sorted(params.items()), sort_keys=True, default=str)
         hash_hex = sha256(param_str.encode()).hexdigest()[:16]
-        return f"{self.model.__name__}:query:{hash_hex}"
+        return await self._scoped_cache_key(f"query:{hash_hex}")
 
-    async def _invalidate_model_caches(self) -> None:
+    async def _invalidate_model_caches(self, *, id: int | None = None) -> None:
         if not self._cache:
             return
-        await self._cache.clear(prefix=f"{self.model.__name__}:")
+        await self._drop_cached(id=id)
+        # a concurrent reader can re-cache the old row before we commit, so
+        # drop it again once the write is visible
+        if self._after_commit is not None:
+            self._after_commit.append(lambda: self._drop_cached(id=id))
+
+    async def _drop_cached(self, *, id: int | None) -> None:
+        assert self._cache is not None
+        if id is not None:
+            await self._cache.delete(key=self._id_cache_key(id))
+            # and the copy LazyEntityCache may hold for readers of this row
+            entity_cls = getattr(self.model, "entity_cls", None)
+            if entity_cls is not None:
+                await self._cache.delete(key=entity_cache_key(entity_cls, id))
+        await self._cache.incr(key=self._generation_cache_key())
 
     # -------------------------
     # Read operations
@@ -118,8 +187,9 @@ class AsyncSqlalchemyRepository(AbstractRepository, Generic[E, M]):
         **kwargs,
     ) -> list[E]:
         # Check cache if enabled
+        cache_key: str | None = None
         if self._cache and use_cache:
-            cache_key = self._query_cache_key(
+            cache_key = await self._query_cache_key(
                 limit=limit, offset=offset, include_deleted=include_deleted, **kwargs
             )
             cached = await self._cache.get(key=cache_key)
@@ -136,10 +206,7 @@ class AsyncSqlalchemyRepository(AbstractRepository, Generic[E, M]):
         entities = [m.to_entity() for m in models]
 
         # Store in cache if enabled
-        if self._cache and use_cache:
-            cache_key = self._query_cache_key(
-                limit=limit, offset=offset, include_deleted=include_deleted, **kwargs
-            )
+        if self._cache and cache_key is not None:
             await self._cache.set(
                 key=cache_key, value=entities, ttl=ttl or self._default_ttl
             )
@@ -155,12 +222,18 @@ class AsyncSqlalchemyRepository(AbstractRepository, Generic[E, M]):
         ttl: int | None = None,
         **kwargs,
     ) -> E | None:
+        known = self._known(id)
+        if known is not None:
+            if include_deleted or getattr(known, "deleted_at", None) is None:
+                return known
+            return None
+
         # Check cache if enabled
         if self._cache and use_cache:
             cache_key = self._id_cache_key(id)
             cached = await self._cache.get(key=cache_key)
             if cached is not None:
-                return cached
+                return self._remember(cached)
 
         # Query database
         model = await self.session.get(self.model, id)
@@ -178,4 +251,86 @@ class AsyncSqlalchemyRepository(AbstractRepository, Generic[E, M]):
                 key=cache_key, value=entity, ttl=ttl or self._default_ttl
             )
 
-        return entity
+        return self._remember(entity)
+
+    async def get_many_by_ids(
+        self,
+        *,
+        ids: Iterable[int],
+        include_deleted: bool = False,
+        use_cache: bool = True,
+        ttl: int | None = None,
+        **kwargs,
+    ) -> dict[int, E]:
+        """Batch `get_by_id`: one MGET, then one query for the misses.
+
+        Returns ``{id: entity}``; ids that don't exist are left out.
+        """
+        wanted = list(dict.fromkeys(ids))
+        if not wanted:
+            return {}
+
+        found: dict[int, E] = {}
+        for id in wanted:
+            known = self._known(id)
+            if known is not None:
+                found[id] = known
+
+        if self._cache and use_cache and len(found) < len(wanted):
+            keys = [self._id_cache_key(id) for id in wanted if id not in found]
+            cached = await self._cache.get_many(keys=keys)
+            for id in wanted:
+                entity = cached.get(self._id_cache_key(id))
+                if entity is not None:
+                    found[id] = self._remember(entity)
+
+        missing = [id for id in wanted if id not in found]
+        if missing:
+            found.update(await self._load_many(missing, use_cache=use_cache, ttl=ttl))
+
+        if include_deleted:
+            return found
+        return {
+            id: e for id, e in found.items() if getattr(e, "deleted_at", None) is None
+        }
+
+    async def warm_cache(
+        self,
+        *,
+        ids: Iterable[int],
+        ttl: int | None = None,
+        **kwargs,
+    ) -> int:
+        """Load the ids missing from the cache into it, ahead of use.
+
+        Returns how many were already cached. A no-op without a cache.
+        """
+        wanted = list(dict.fromkeys(ids))
+        if not self._cache or not wanted:
+            return 0
+
+        keys = [self._id_cache_key(id) for id in wanted]
+        cached = await self._cache.get_many(keys=keys)
+        missing = [id for id, key in zip(wanted, keys) if cached.get(key) is None]
+        if missing:
+            await self._load_many(missing, use_cache=True, ttl=ttl)
+        return len(wanted) - len(missing)
+
+    async def _load_many(
+        self, ids: list[int], *, use_cache: bool, ttl: int | None
+    ) -> dict[int, E]:
+        # a single array parameter keeps the statement text stable
+        stmt = select(self.model).where(
+            self.model.id
+            == any_(bindparam("ids", ids, type_=ARRAY(self.model.id.type)))
+        )
+        result = await self.session.execute(stmt)
+        loaded = {m.id: self._remember(m.to_entity()) for m in result.scalars().all()}
+
+        if self._cache and use_cache and loaded:
+            await self._cache.set_many(
+                mapping={self._id_cache_key(id): e for id, e in loaded.items()},
+                ttl=ttl or self._default_ttl,
+            )
+
+        return loaded
@@ -1,9 +1,12 @@
+import logging
 from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.base.ports.unit_of_work import AsyncUnitOfWork
 from src.base.adapters.sqlalchemydb.database import AsyncSqlalchemyDatabase
+from src.base.adapters.sqlalchemydb.repository import AfterCommit, IdentityMap
 from src.base.ports.repositories.cache_repository import AbstractCacheRepository
+from src.users.ports.security.principal_cache import PrincipalCachePort
 
 from src.messaging.adapters.sqlalchemydb.queries.messaging_queries import (
     SqlalchemyMessagingQueries,
@@ -15,38 +18,63 @@ import src.files.adapters.sqlalchemydb.repositories as file_repos
 import src.messaging.adapters.sqlalchemydb.repositories as messaging_repos
 import src.base.adapters.sqlalchemydb.repositories as base_repos
 
+logger = logging.getLogger(__name__)
+
 
 class AsyncSqlalchemyUnitOfWork(AsyncUnitOfWork):
     def __init__(
         self,
         database: AsyncSqlalchemyDatabase,
         cache_repo: Optional[AbstractCacheRepository] = None,
+        principal_cache: Optional[PrincipalCachePort] = None,
     ) -> None:
         super().__init__(database)
         self._cache_repo = cache_repo
+        self._principal_cache = principal_cache
         self.session: AsyncSession | None = None
+        self._identity_map: IdentityMap = {}
+        self._after_commit: AfterCommit = []
 
     async def _init_repositories(self) -> None:
         assert self.session is not None
 
+        # repeated get_by_id calls within this UoW return the same entity
+        self._identity_map = {}
+        self._after_commit = []
+
         # user repos (no caching - domain entities should not be cached)
         self.base_user_repo = user_repos.SqlalchemyBaseUserRepository(
-            self.session, cache_repo=None
+            self.session, cache_repo=None, principal_cache=self._principal_cache
         )
         self.admin_repo = user_repos.SqlalchemyAdminRepository(
-            self.session, cache_repo=None
+            self.session, cache_repo=None, principal_cache=self._principal_cache
         )
         self.user_repo = user_repos.SqlalchemyUserRepository(
-            self.session, cache_repo=None
+            self.session, cache_repo=None, principal_cache=self._principal_cache
         )
 
-        # file repos (without caching for now)
-        self.file_repo = file_repos.SqlalchemyFileRepository(self.session)
+        # file repos
+        self.file_repo = file_repos.SqlalchemyFileRepository(
+            self.session,
+            cache_repo=self._cache_repo,
+            identity_map=self._identity_map,
+            after_commit=self._after_commit,
+        )
 
-        # messaging repos (without caching for now)
-        self.session_repo = messaging_repos.SqlalchemySessionRepository(self.session)
+        # messaging repos (uncached: a session row carries the messenger login
+        # credential, which must not be copied into redis)
+        self.session_repo = messaging_repos.SqlalchemySessionRepository(
+            self.session, identity_map=self._identity_map
+        )
+        # cached: the send path reads it through LazyEntityCache, and writes
+        # here drop that copy too
         self.message_request_repo = (
-            messaging_repos.SqlalchemyMessagingRequestRepository(self.session)
+            messaging_repos.SqlalchemyMessagingRequestRepository(
+                self.session,
+                cache_repo=self._cache_repo,
+                identity_map=self._identity_map,
+                after_commit=self._after_commit,
+            )
         )
         self.message_repo = messaging_repos.SqlalchemyMessageRepository(self.session)
 
@@ -62,11 +90,23 @@ class AsyncSqlalchemyUnitOfWork(AsyncUnitOfWork):
     async def commit(self) -> None:
         if self.session:
             await self.session.commit()
+        # the repos hold this list, so drain it in place
+        callbacks = list(self._after_commit)
+        self._after_commit.clear()
+        for callback in callbacks:
+            try:
+                await callback()
+            except Exception:
+                # the write is committed; cached copies age out via their TTL
+                logger.warning("Post-commit cache invalidation failed", exc_info=True)
 
     async def flush(self) -> None:
         if self.session:
             await self.session.flush()
 
     async def rollback(self) -> None:
+        # memoized entities may reflect writes that were just rolled back
+        self._identity_map.clear()
+        self._after_commit.clear()
         if self.session:
             await self.session.rollback()
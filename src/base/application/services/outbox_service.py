@@ -1,4 +1,5 @@
 from datetime import datetime, timezone
+from typing import Iterable
 
 from src.base.domain.entities.outbox_event import OutboxEvent
 from src.base.domain.events.outbox_domain_event import OutboxDomainEvent
@@ -9,15 +10,52 @@ class OutboxService:
     def __init__(self, uow: AsyncUnitOfWork) -> None:
         self.uow = uow
 
-    async def publish(self, event: OutboxDomainEvent) -> OutboxEvent:
-        now = datetime.now(timezone.utc)
-
-        row = OutboxEvent(
+    @staticmethod
+    def _to_row(event: OutboxDomainEvent, now: datetime) -> OutboxEvent:
+        return OutboxEvent(
             event_type=event.event_type(),
             payload=event.payload(),
             available_at=event.available_at or now,
             dedup_key=event.dedup_key,
             aggregate_type=event.aggregate_type,
             aggregate_id=event.aggregate_id,
+            priority=event.priority,
         )
-        return await self.uow.outbox_event_repo.add(entity=row)
+
+    async def publish(self, event: OutboxDomainEvent) -> OutboxEvent:
+        now = datetime.now(timezone.utc)
+
+        row = self._to_row(event, now)
+        created = await self.uow.outbox_event_repo.add_or_coalesce(entity=row)
+        if row.available_at <= now:
+            await self.uow.outbox_event_repo.notify_ready()
+        return created
+
+    async def publish_many(
+        self, events: Iterable[OutboxDomainEvent]
+    ) -> list[OutboxEvent]:
+        now = datetime.now(timezone.utc)
+
+        # fold same-key events inside the batch first, keeping the earliest
+        keyed: dict[tuple[str, str], OutboxEvent] = {}
+        plain: list[OutboxEvent] = []
+        ready = False
+        for event in events:
+            row = self._to_row(event, now)
+            ready = ready or row.available_at <= now
+            if not row.dedup_key:
+                plain.append(row)
+                continue
+            key = (row.dedup_key, str(row.priority))
+            current = keyed.get(key)
+            if current is None or row.available_at < current.available_at:
+                keyed[key] = row
+
+        repo = self.uow.outbox_event_repo
+        created = await repo.add_many(entities=plain) if plain else []
+        for row in keyed.values():
+            created.append(await repo.add_or_coalesce(entity=row))
+
+        if ready:
+            await repo.notify_ready()
+        return created
@@ -2,9 +2,25 @@ from datetime import datetime, timezone
 from typing import Any
 
 from src.base.domain.entity import BaseEntity
+from src.base.domain.enums.priority import Priority
 
 
 class OutboxEvent(BaseEntity):
+    __slots__ = (
+        "event_type",
+        "payload",
+        "available_at",
+        "processed_at",
+        "attempts",
+        "last_error",
+        "dedup_key",
+        "aggregate_type",
+        "aggregate_id",
+        "created_at",
+        "claimed_by",
+        "claimed_until",
+        "priority",
+    )
 
     repo_attr = "outbox_event_repo"
 
@@ -28,6 +44,13 @@ class OutboxEvent(BaseEntity):
 
     created_at: datetime
 
+    # dispatcher lease: the row is being handled by `claimed_by` until then
+    claimed_by: str | None
+    claimed_until: datetime | None
+
+    # dispatch lane; transactional events are claimed ahead of bulk ones
+    priority: Priority
+
     def __init__(
         self,
         *,
@@ -41,6 +64,9 @@ class OutboxEvent(BaseEntity):
         aggregate_type: str | None = None,
         aggregate_id: str | None = None,
         created_at: datetime | None = None,
+        claimed_by: str | None = None,
+        claimed_until: datetime | None = None,
+        priority: Priority = Priority.bulk,
         id: int | None = None,
     ) -> None:
         super().__init__(id=id, deleted_at=None)
@@ -60,3 +86,8 @@ class OutboxEvent(BaseEntity):
         self.aggregate_id = aggregate_id
 
         self.created_at = created_at or now
+
+        self.claimed_by = claimed_by
+        self.claimed_until = claimed_until
+
+        self.priority = priority
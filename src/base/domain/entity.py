@@ -1,15 +1,19 @@
 from abc import ABC
-from datetime import datetime, date
-from enum import Enum
+from datetime import datetime
 from json import dumps as json_dumps
-from typing import Any, ClassVar, Literal, Mapping
-from uuid import UUID
+from typing import Any, ClassVar, Literal
+
+from src.base.domain.serialization import dump_fields, to_jsonable
 
 
 class BaseEntity(ABC):
+    # subclasses may declare __slots__ for their own fields; those that
+    # don't simply get a __dict__ as before
+    __slots__ = ("id", "deleted_at")
+
     repo_attr: str
-    id: int | None = None
-    deleted_at: datetime | None = None
+    id: int | None
+    deleted_at: datetime | None
 
     # Per-entity override hook: {"password", "secret", ...}
     __serialize_exclude__: ClassVar[set[str]] = set()
@@ -33,27 +37,13 @@ class BaseEntity(ABC):
         exclude: set[str] | None = None,
         include: set[str] | None = None,
     ) -> dict[str, Any]:
-        data = {k: v for k, v in vars(self).items() if not k.startswith("_")}
-
-        # combine exclusions
-        all_exclude = set(self.__serialize_exclude__)
-        if exclude:
-            all_exclude |= set(exclude)
-
-        if include is not None:
-            data = {k: v for k, v in data.items() if k in include}
-
-        if all_exclude:
-            for k in all_exclude:
-                data.pop(k, None)
-
-        if exclude_none:
-            data = {k: v for k, v in data.items() if v is not None}
-
-        if mode == "python":
-            return data
-
-        return self._to_jsonable(data)
+        return dump_fields(
+            self,
+            mode=mode,
+            exclude_none=exclude_none,
+            exclude=exclude,
+            include=include,
+        )
 
     def dumps(
         self,
@@ -76,32 +66,4 @@ class BaseEntity(ABC):
     @classmethod
     def _to_jsonable(cls, obj: Any) -> Any:
         """Recursively convert object to JSON-safe primitives."""
-        if obj is None:
-            return None
-
-        # Entities (nested)
-        if isinstance(obj, BaseEntity):
-            return obj.dump(mode="json")
-
-        # Pydantic models (optional convenience)
-        if hasattr(obj, "model_dump") and callable(getattr(obj, "model_dump")):
-            return obj.model_dump(mode="json", exclude_none=True)
-
-        # datetime/date/UUID
-        if isinstance(obj, (datetime, date)):
-            return obj.isoformat()
-        if isinstance(obj, UUID):
-            return str(obj)
-
-        # Enums
-        if isinstance(obj, Enum):
-            return obj.value
-
-        # Mappings / Iterables
-        if isinstance(obj, Mapping):
-            return {str(k): cls._to_jsonable(v) for k, v in obj.items()}
-        if isinstance(obj, (list, tuple, set)):
-            return [cls._to_jsonable(v) for v in obj]
-
-        # Fallback: basic JSON types should pass through
-        return obj
+        return to_jsonable(obj)
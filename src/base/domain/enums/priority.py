@@ -0,0 +1,8 @@
+from src.base.domain.enum import BaseStrEnum
+
+
+class Priority(BaseStrEnum):
+    # one-off sends from the API; must not wait behind campaign batches
+    transactional = "transactional"
+    # imported campaigns and other background work
+    bulk = "bulk"
@@ -4,6 +4,7 @@ from typing import Any, ClassVar, Self
 from abc import ABC
 
 from src.base.domain.dto import BaseDTO
+from src.base.domain.enums.priority import Priority
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -15,6 +16,7 @@ class OutboxDomainEvent(BaseDTO, ABC):
     dedup_key: str | None = None
     aggregate_type: str | None = None
     aggregate_id: str | None = None
+    priority: Priority = Priority.bulk
 
     # BaseDTO.dump honors this
     __serialize_exclude__: ClassVar[set[str]] = {
@@ -22,6 +24,7 @@ class OutboxDomainEvent(BaseDTO, ABC):
         "dedup_key",
         "aggregate_type",
         "aggregate_id",
+        "priority",
     }
 
     @classmethod
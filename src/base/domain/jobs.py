@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from datetime import datetime
 from typing import Awaitable, Callable
 
 
@@ -7,3 +8,11 @@ class JobSpec:
     job: Callable[..., Awaitable[dict[str, int]]]
     interval: float
     batch: int
+    # LISTEN channel that wakes the job early; interval becomes the fallback poll
+    wakeup_channel: str | None = None
+    # when set, the poll interval doubles while idle, up to this ceiling
+    max_interval: float | None = None
+    # when set, an idle backoff never sleeps past the time this returns
+    next_due: Callable[..., Awaitable[datetime | None]] | None = None
+    # runs outbox handlers (the messenger sends) in its own process
+    sends: bool = False
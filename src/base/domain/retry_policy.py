@@ -0,0 +1,9 @@
+from datetime import timedelta
+
+# shared by the outbox dispatcher and the broker consumer
+MAX_ATTEMPTS = 10
+
+
+def backoff(attempts: int) -> timedelta:
+    seconds = min(60, 2 ** max(0, attempts - 1))
+    return timedelta(seconds=seconds)
@@ -1,4 +1,9 @@
-from typing import Any, Awaitable, Callable, Generic, TypeVar
+import asyncio
+import copy
+import math
+import random
+import time
+from typing import Any, Awaitable, Callable, Generic, Iterable, TypeVar
 
 from src.base.ports.repositories.cache_repository import AbstractCacheRepository
 from src.base.domain.entity import BaseEntity
@@ -7,19 +12,43 @@ from src.base.ports.unit_of_work import AsyncUnitOfWork
 E = TypeVar("E", bound=BaseEntity)
 Loader = Callable[[AsyncUnitOfWork], Awaitable[E | None]]
 
+# key -> load in progress, shared by every LazyEntityCache in the process so
+# concurrent misses on the same key coalesce into a single loader call
+_inflight: dict[str, asyncio.Future] = {}
+# result of a leader that was cancelled: followers retry instead of failing
+_RETRY = object()
+_PEER_POLL_INTERVAL = 0.05
+
+DEFAULT_KEY_PREFIX = "entity"
+
+
+def entity_cache_key(
+    entity_type: type[BaseEntity], identifier: Any, *, prefix: str = DEFAULT_KEY_PREFIX
+) -> str:
+    """Key an entity is cached under; repositories drop it on writes."""
+    prefix = prefix.rstrip(":")
+    if prefix:
+        return f"{prefix}:{entity_type.__name__}:{identifier}"
+    return f"{entity_type.__name__}:{identifier}"
+
 
 class LazyEntityCache(Generic[E]):
     def __init__(
         self,
         cache_repo: AbstractCacheRepository,
         *,
-        key_prefix: str = "entity",
+        key_prefix: str = DEFAULT_KEY_PREFIX,
         default_ttl: int | None = None,
+        lock_ttl: int | None = None,
+        early_refresh_beta: float = 1.0,
         uow: AsyncUnitOfWork | None = None,
     ) -> None:
         self._cache = cache_repo
         self._prefix = key_prefix.rstrip(":")
         self._default_ttl = default_ttl
+        # lease of the cross-process load lock; None/0 = in-process only
+        self._lock_ttl = lock_ttl or None
+        self._beta = early_refresh_beta
         self._uow: AsyncUnitOfWork | None = uow
 
     def set_uow(self, uow: AsyncUnitOfWork) -> "LazyEntityCache":
@@ -40,9 +69,7 @@ class LazyEntityCache(Generic[E]):
     # -------------------------
 
     def _cache_key(self, entity_type: type[E], identifier: Any) -> str:
-        if self._prefix:
-            return f"{self._prefix}:{entity_type.__name__}:{identifier}"
-        return f"{entity_type.__name__}:{identifier}"
+        return entity_cache_key(entity_type, identifier, prefix=self._prefix)
 
     def _get_repo_from_uow(self, uow: AsyncUnitOfWork, entity_type: type[E]) -> Any:
         repo_attr = getattr(entity_type, "repo_attr", None)
@@ -60,6 +87,115 @@ class LazyEntityCache(Generic[E]):
                 f"for entity {entity_type.__name__}"
             ) from exc
 
+    @staticmethod
+    def _unwrap(cached: Any) -> tuple[Any, float, float | None] | None:
+        """Return (value, load seconds, expires_at) of a cached entry."""
+        if cached is None:
+            return None
+        if isinstance(cached, dict) and cached.keys() == {
+            "value",
+            "delta",
+            "expires_at",
+        }:
+            return cached["value"], cached["delta"], cached["expires_at"]
+        # entry written before load timings were recorded
+        return cached, 0.0, None
+
+    def _should_refresh_early(self, delta: float, expires_at: float | None) -> bool:
+        # probabilistic early expiration ("XFetch"): the closer to expiry and
+        # the slower the load, the likelier one caller refreshes ahead of time
+        if expires_at is None or delta <= 0 or self._beta <= 0:
+            return False
+        jitter = -delta * self._beta * math.log(1.0 - random.random())
+        return time.time() + jitter >= expires_at
+
+    async def _wait_for_peer(self, key: str, lock_key: str) -> Any | None:
+        """Poll for the value a peer is loading.
+
+        None once the peer lets go of the lock without writing one (missing
+        entity or failed load) or its lease runs out.
+        """
+        deadline = time.monotonic() + float(self._lock_ttl or 0)
+        while time.monotonic() < deadline:
+            await asyncio.sleep(_PEER_POLL_INTERVAL)
+            entry = self._unwrap(await self._cache.get(key=key))
+            if entry is not None:
+                return entry[0]
+            if not await self._cache.exists(key=lock_key):
+                # released: one last look in case the value landed in between
+                entry = self._unwrap(await self._cache.get(key=key))
+                return entry[0] if entry is not None else None
+        return None
+
+    async def _load(
+        self, *, key: str, loader: Loader, ttl: int | None, stale: Any | None
+    ) -> E | None:
+        uow = self._require_uow()
+
+        lock_key = f"{key}:lock"
+        locked = False
+        if self._lock_ttl:
+            locked = await self._cache.set_if_absent(
+                key=lock_key, value=1, ttl=self._lock_ttl
+            )
+            if not locked:
+                # another process is loading this key
+                if stale is not None:
+                    return stale
+                value = await self._wait_for_peer(key, lock_key)
+                if value is not None:
+                    return value
+                # peer gave up or its lease ran out: load it ourselves
+
+        try:
+            started = time.monotonic()
+            entity = await loader(uow)
+            delta = time.monotonic() - started
+
+            if entity is not None:
+                await self._cache.set(
+                    key=key,
+                    value={
+                        "value": entity,
+                        "delta": delta,
+                        "expires_at": time.time() + ttl if ttl else None,
+                    },
+                    ttl=ttl,
+                )
+            return entity
+        finally:
+            if locked:
+                await self._cache.delete(key=lock_key)
+
+    async def _load_once(
+        self, *, key: str, loader: Loader, ttl: int | None, stale: Any | None = None
+    ) -> E | None:
+        while (pending := _inflight.get(key)) is not None:
+            if stale is not None:
+                return stale
+            result = await asyncio.shield(pending)
+            if result is not _RETRY:
+                # private copy: callers must not share a mutable entity
+                return copy.deepcopy(result)
+
+        future = asyncio.get_running_loop().create_future()
+        _inflight[key] = future
+        try:
+            entity = await self._load(key=key, loader=loader, ttl=ttl, stale=stale)
+        except Exception as exc:
+            future.set_exception(exc)
+            future.exception()  # followers re-raise it; don't log it twice
+            raise
+        except BaseException:
+            future.set_result(_RETRY)
+            raise
+        else:
+            future.set_result(entity)
+            return entity
+        finally:
+            if _inflight.get(key) is future:
+                del _inflight[key]
+
     # -------------------------
     # Generic get-or-load (no uow param anymore)
     # -------------------------
@@ -71,22 +207,23 @@ class LazyEntityCache(Generic[E]):
         loader: Loader,
         ttl: int | None = None,
     ) -> E | None:
-        uow = self._require_uow()
+        """Read-through with stampede protection.
 
-        cached = await self._cache.get(key=key)
-        if cached is not None:
-            return cached
+        Concurrent misses in this process share one loader call; with
+        ``lock_ttl`` set, a short Redis lease extends that to the fleet.
+        Shortly before expiry a single caller may reload the entry early
+        while everyone else keeps getting the cached value.
+        """
+        ttl = ttl if ttl is not None else self._default_ttl
 
-        entity = await loader(uow)
-
-        if entity is not None:
-            await self._cache.set(
-                key=key,
-                value=entity,
-                ttl=ttl if ttl is not None else self._default_ttl,
-            )
+        entry = self._unwrap(await self._cache.get(key=key))
+        if entry is not None:
+            value, delta, expires_at = entry
+            if not self._should_refresh_early(delta, expires_at):
+                return value
+            return await self._load_once(key=key, loader=loader, ttl=ttl, stale=value)
 
-        return entity
+        return await self._load_once(key=key, loader=loader, ttl=ttl)
 
     # -------------------------
     # Public: get by id (no uow argument)
@@ -112,3 +249,48 @@ class LazyEntityCache(Generic[E]):
             loader=loader,
             ttl=ttl,
         )
+
+    async def get_many_by_ids(
+        self,
+        *,
+        entity_type: type[E],
+        ids: Iterable[Any],
+        ttl: int | None = None,
+    ) -> dict[Any, E]:
+        """Batch `get_by_id`: one MGET, a single DB read for the misses and
+        one pipelined write-back. Ids that don't exist are left out."""
+        uow = self._require_uow()
+        ttl = ttl if ttl is not None else self._default_ttl
+
+        wanted = list(dict.fromkeys(ids))
+        if not wanted:
+            return {}
+        keys = {id: self._cache_key(entity_type, id) for id in wanted}
+
+        cached = await self._cache.get_many(keys=list(keys.values()))
+        found: dict[Any, E] = {}
+        for id, key in keys.items():
+            entry = self._unwrap(cached.get(key))
+            if entry is not None:
+                found[id] = entry[0]
+
+        missing = [id for id in wanted if id not in found]
+        if not missing:
+            return found
+
+        repo = self._get_repo_from_uow(uow, entity_type)
+        started = time.monotonic()
+        loaded = await repo.get_many_by_ids(ids=missing)
+        delta = time.monotonic() - started
+
+        if loaded:
+            expires_at = time.time() + ttl if ttl else None
+            await self._cache.set_many(
+                mapping={
+                    keys[id]: {"value": e, "delta": delta, "expires_at": expires_at}
+                    for id, e in loaded.items()
+                },
+                ttl=ttl,
+            )
+        found.update(loaded)
+        return found
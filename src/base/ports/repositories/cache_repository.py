@@ -15,6 +15,12 @@ class AbstractCacheRepository(ABC):
     async def delete(self, *, key: str) -> None:
         raise NotImplementedError
 
+    @abstractmethod
+    async def set_if_absent(
+        self, *, key: str, value: Any, ttl: int | None = None
+    ) -> bool:
+        raise NotImplementedError
+
     @abstractmethod
     async def exists(self, *, key: str) -> bool:
         raise NotImplementedError
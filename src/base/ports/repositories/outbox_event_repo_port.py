@@ -1,19 +1,56 @@
 from abc import ABC, abstractmethod
-from datetime import datetime
+from collections.abc import Sequence
+from datetime import datetime, timedelta
 
 from src.base.domain.entities.outbox_event import OutboxEvent
+from src.base.domain.enums.priority import Priority
 from src.base.ports.repositories.repository import AbstractRepository
 
+# channel the dispatcher LISTENs on; notified when a ready event is committed
+OUTBOX_NOTIFY_CHANNEL = "outbox_events"
+
 
 class OutboxEventRepositoryPort(AbstractRepository, ABC):
     @abstractmethod
     async def add(self, *, entity: OutboxEvent, **kwargs) -> OutboxEvent:
         raise NotImplementedError
 
+    @abstractmethod
+    async def add_or_coalesce(self, *, entity: OutboxEvent, **kwargs) -> OutboxEvent:
+        """Insert, or fold into the open row with the same dedup_key and priority.
+
+        The surviving row keeps the earliest available_at. Atomic under
+        concurrent publishers. Rows currently claimed by a dispatcher are never
+        coalesced into; if one is released unprocessed while an open row with
+        its key exists, it is folded into that row instead.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def add_many(
+        self, *, entities: list[OutboxEvent], **kwargs
+    ) -> list[OutboxEvent]:
+        raise NotImplementedError
+
     @abstractmethod
     async def update(self, *, entity: OutboxEvent, **kwargs) -> OutboxEvent:
         raise NotImplementedError
 
+    @abstractmethod
+    async def get_next_due_at(
+        self,
+        *,
+        shard: tuple[int, int] | None = None,
+        priorities: Sequence[Priority] | None = None,
+        **kwargs,
+    ) -> datetime | None:
+        """When the next unprocessed event becomes claimable, if any.
+
+        That is its available_at, or its lease expiry when it is leased past
+        that. May be in the past.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def get_ready(
         self,
@@ -22,6 +59,53 @@ class OutboxEventRepositoryPort(AbstractRepository, ABC):
         limit: int = 100,
         lock: bool = False,
         skip_locked: bool = True,
+        shard: tuple[int, int] | None = None,
+        **kwargs,
+    ) -> list[OutboxEvent]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def claim_ready(
+        self,
+        *,
+        now: datetime,
+        worker_id: str,
+        lease: timedelta,
+        limit: int = 100,
+        shard: tuple[int, int] | None = None,
+        priority: Priority | None = None,
         **kwargs,
     ) -> list[OutboxEvent]:
+        """Lease up to ``limit`` ready events to ``worker_id`` until now + lease.
+
+        Rows with a live lease are skipped, and so are events whose aggregate
+        has a live lease held by another worker in the same priority lane, so
+        one aggregate is never split across workers. Expired leases are
+        claimable again. ``priority`` restricts the claim to one lane.
+        Concurrent claims on a lane are serialized until the caller commits,
+        so keep the claiming transaction short. Returned in dispatch order.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def extend_claims(
+        self, *, ids: list[int], worker_id: str, until: datetime, **kwargs
+    ) -> int:
+        """Push the lease of rows still held by ``worker_id``; returns how many."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def release_claim(
+        self, *, entity: OutboxEvent, worker_id: str, **kwargs
+    ) -> bool:
+        """Write back the dispatch outcome and drop the lease.
+
+        Returns False (and writes nothing) if the lease was lost to another
+        worker in the meantime.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def notify_ready(self, **kwargs) -> None:
+        """Wake dispatchers once the current transaction commits."""
         raise NotImplementedError
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Iterable
 
 
 class AbstractRepository(ABC):
@@ -54,3 +54,23 @@ class AbstractRepository(ABC):
         **kwargs,
     ) -> Any | None:
         raise NotImplementedError
+
+    @abstractmethod
+    async def get_many_by_ids(
+        self,
+        *,
+        ids: Iterable[int],
+        include_deleted: bool = False,
+        **kwargs,
+    ) -> dict[int, Any]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def warm_cache(
+        self,
+        *,
+        ids: Iterable[int],
+        ttl: int | None = None,
+        **kwargs,
+    ) -> int:
+        raise NotImplementedError
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from collections.abc import Awaitable, Callable, Mapping
+from collections.abc import Awaitable, Callable, Mapping, Sequence
 from dataclasses import dataclass
 from typing import Any
 
@@ -12,9 +12,24 @@ class EventBusMessage:
     message_id: str | None = None
 
 
+@dataclass(frozen=True, slots=True)
+class DeadLetter:
+    message: EventBusMessage
+    attempts: int
+    error: str | None = None
+
+
 EventBusHandler = Callable[[EventBusMessage], Awaitable[None]]
 
 
+class DeadLetterError(Exception):
+    """Raised by a handler that already retried a message and gave up.
+
+    The bus parks the message as dead right away instead of scheduling
+    another retry.
+    """
+
+
 class EventBusPort(ABC):
     @abstractmethod
     def is_enabled(self) -> bool:
@@ -24,10 +39,37 @@ class EventBusPort(ABC):
     async def publish(self, message: EventBusMessage) -> None:
         raise NotImplementedError
 
+    @abstractmethod
+    async def publish_many(
+        self, messages: Sequence[EventBusMessage]
+    ) -> list[Exception | None]:
+        """Publish a batch; returns one outcome per message, in order.
+
+        ``None`` means the broker confirmed the message; an exception means it
+        was not (and should be retried).
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def consume(self, *, handler: EventBusHandler) -> None:
         raise NotImplementedError
 
+    @abstractmethod
+    async def list_dead_letters(self, *, limit: int = 100) -> list[DeadLetter]:
+        """Peek at dead-lettered messages without removing them."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def replay_dead_letters(
+        self, *, limit: int = 100, message_ids: Sequence[str] | None = None
+    ) -> int:
+        """Move dead-lettered messages (all, or only ``message_ids``) back to
+        the main queue with a fresh attempt count; returns how many.
+
+        ``limit`` caps the replays; ids are looked for through the whole
+        dead-letter queue."""
+        raise NotImplementedError
+
     @abstractmethod
     async def close(self) -> None:
         raise NotImplementedError
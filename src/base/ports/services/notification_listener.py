@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+
+
+class NotificationListenerPort(ABC):
+    @abstractmethod
+    async def wait(self, *, channel: str, timeout: float, waiter: str = "") -> bool:
+        """Block until a notification arrives on `channel` or `timeout` elapses.
+
+        Every `waiter` (e.g. a job name) sees every notification, including
+        ones that arrived while it was not waiting. Returns True when woken by
+        a notification, False on timeout.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def close(self) -> None:
+        raise NotImplementedError
@@ -1,10 +1,32 @@
+from functools import partial
+
+from src.base.domain.enums.priority import Priority
 from src.base.domain.jobs import JobSpec
-from src.base.workers.dispatch_outbox_events import dispatch_outbox_events
+from src.base.ports.repositories.outbox_event_repo_port import OUTBOX_NOTIFY_CHANNEL
+from src.base.workers.dispatch_outbox_events import (
+    dispatch_outbox_events,
+    next_outbox_event_due,
+)
 
 JOBS = {
     "dispatch_outbox_events": JobSpec(
         job=dispatch_outbox_events,
         interval=2.0,
         batch=50,
+        wakeup_channel=OUTBOX_NOTIFY_CHANNEL,
+        max_interval=30.0,
+        next_due=next_outbox_event_due,
+        sends=True,
+    ),
+    # dedicated pool for the transactional lane: a one-off send never waits
+    # for a campaign batch in the general dispatcher to finish
+    "dispatch_transactional_outbox_events": JobSpec(
+        job=partial(dispatch_outbox_events, priorities=(Priority.transactional,)),
+        interval=0.5,
+        batch=20,
+        wakeup_channel=OUTBOX_NOTIFY_CHANNEL,
+        max_interval=5.0,
+        next_due=partial(next_outbox_event_due, priorities=(Priority.transactional,)),
+        sends=True,
     ),
 }
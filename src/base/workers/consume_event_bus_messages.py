@@ -1,3 +1,4 @@
+import asyncio
 import inspect
 import logging
 from typing import Any, Callable
@@ -6,6 +7,7 @@ from src.base.application.outbox.registry import OutboxRegistry
 from src.base.domain.events.outbox_domain_event import OutboxDomainEvent
 from src.base.ports.services.event_bus import EventBusMessage, EventBusPort
 from src.base.ports.unit_of_work import AsyncUnitOfWork
+from src.base.workers.partitioned_consumer import PartitionedConsumer
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +36,10 @@ def _build_handler_kwargs(
             kwargs[name] = container.import_staging_repo()
         elif name == "import_registry":
             kwargs[name] = container.import_registry()
+        elif name == "suppression_list_repo":
+            kwargs[name] = container.suppression_list_repo()
+        elif name == "lazy_entity_cache":
+            kwargs[name] = container.lazy_entity_cache().set_uow(uow)
 
     return kwargs
 
@@ -45,17 +51,16 @@ async def consume_event_bus_messages(
     container: Any,
     event_bus: EventBusPort,
     batch_size: int = 1,  # unused; kept for worker runner compatibility
+    workers: int = 8,
+    report_interval: float = 30.0,
+    max_attempts: int = 1,
 ) -> dict[str, int]:
     if not event_bus.is_enabled():
         raise RuntimeError(
             "consume_event_bus_messages requires broker_driver != 'none'"
         )
 
-    processed = 0
-
     async def _handle(msg: EventBusMessage) -> None:
-        nonlocal processed
-
         handler = outbox_registry.get_handler(msg.event_type)
         if handler is None:
             # Not for this service — ack by returning
@@ -74,11 +79,16 @@ async def consume_event_bus_messages(
             await handler(**kwargs)
             await uow.commit()
 
-        processed += 1
-
+    # the bus acks a delivery only once submit() returns, i.e. after commit
+    # max_attempts > 1 retries an aggregate's failure in place (see
+    # PartitionedConsumer); the in-memory bus leaves retries to the outbox
+    engine = PartitionedConsumer(_handle, workers=workers, max_attempts=max_attempts)
+    reporter = asyncio.create_task(engine.report_forever(interval=report_interval))
     try:
-        await event_bus.consume(handler=_handle)
+        await event_bus.consume(handler=engine.submit)
     finally:
+        reporter.cancel()
+        await engine.close()
         await event_bus.close()
 
-    return {"processed": processed}
+    return {"processed": engine.processed, "failed": engine.failed}
@@ -1,15 +1,27 @@
+import asyncio
 import inspect
 import logging
+import os
+import socket
+import uuid
+from collections.abc import Sequence
 from datetime import datetime, timedelta, timezone
 from typing import Any, Callable
 
 from src.base.application.outbox.registry import OutboxRegistry
+from src.base.domain.entities.outbox_event import OutboxEvent
+from src.base.domain.enums.priority import Priority
 from src.base.domain.events.outbox_domain_event import OutboxDomainEvent
+from src.base.domain.retry_policy import MAX_ATTEMPTS, backoff
+from src.base.infrastructure.lazy_entity_cache import LazyEntityCache
 from src.files.ports.services.file_service import FileServicePort
 from src.importing.application.registry.import_registry import ImportRegistry
 from src.importing.ports.repositories.import_staging_repo_port import (
     ImportStagingRepositoryPort,
 )
+from src.importing.ports.repositories.suppression_list_repo_port import (
+    SuppressionListRepositoryPort,
+)
 from src.importing.ports.services.tabular_reader_port import TabularReaderPort
 from src.messaging.application.registry.messenger_registry import MessengerRegistry
 from src.base.ports.unit_of_work import AsyncUnitOfWork
@@ -17,12 +29,9 @@ from src.base.ports.services.event_bus import EventBusMessage, EventBusPort
 
 logger = logging.getLogger(__name__)
 
-MAX_ATTEMPTS = 10
-
-
-def _backoff(attempts: int) -> timedelta:
-    seconds = min(60, 2 ** max(0, attempts - 1))
-    return timedelta(seconds=seconds)
+# share of a dispatch batch each lane gets while both have work waiting;
+# a lane's unused share goes to the others
+LANE_WEIGHTS: dict[Priority, int] = {Priority.transactional: 4, Priority.bulk: 1}
 
 
 def _build_handler_kwargs(
@@ -35,6 +44,8 @@ def _build_handler_kwargs(
     tabular_reader: TabularReaderPort,
     import_staging_repo: ImportStagingRepositoryPort,
     import_registry: ImportRegistry,
+    suppression_list_repo: SuppressionListRepositoryPort,
+    lazy_entity_cache_factory: Callable[[], LazyEntityCache] | None = None,
 ) -> dict[str, Any]:
     kwargs: dict[str, Any] = {"uow": uow, "event": event}
 
@@ -53,10 +64,87 @@ def _build_handler_kwargs(
             kwargs[name] = import_staging_repo
         elif name == "import_registry":
             kwargs[name] = import_registry
+        elif name == "suppression_list_repo":
+            kwargs[name] = suppression_list_repo
+        elif name == "lazy_entity_cache" and lazy_entity_cache_factory is not None:
+            # one per handler: the cache is bound to the handler's own UoW
+            kwargs[name] = lazy_entity_cache_factory().set_uow(uow)
 
     return kwargs
 
 
+def _broker_message(ev: OutboxEvent) -> EventBusMessage:
+    headers = {
+        "outbox_id": str(ev.id),
+        "attempts": str(ev.attempts or 0),
+        "available_at": ev.available_at.isoformat(),
+    }
+    if ev.dedup_key:
+        headers["dedup_key"] = ev.dedup_key
+    if ev.aggregate_type:
+        headers["aggregate_type"] = ev.aggregate_type
+    if ev.aggregate_id:
+        headers["aggregate_id"] = ev.aggregate_id
+    headers["priority"] = ev.priority.value
+
+    return EventBusMessage(
+        event_type=ev.event_type,
+        payload=ev.payload,
+        headers=headers,
+        message_id=str(ev.id),
+    )
+
+
+def _group_by_aggregate(events: list[OutboxEvent]) -> list[list[OutboxEvent]]:
+    """Split a batch into independent lanes, keeping per-aggregate order."""
+    groups: dict[tuple[Priority, str | None, str], list[OutboxEvent]] = {}
+    for ev in events:
+        if ev.aggregate_id:
+            key = (ev.priority, ev.aggregate_type, ev.aggregate_id)
+        else:
+            key = (ev.priority, None, f"id:{ev.id}")
+        groups.setdefault(key, []).append(ev)
+    return list(groups.values())
+
+
+async def _claim_weighted(
+    uow: AsyncUnitOfWork,
+    *,
+    priorities: Sequence[Priority],
+    batch_size: int,
+    **claim_kwargs: Any,
+) -> list[OutboxEvent]:
+    """Weighted fair claim across lanes, heaviest lane first.
+
+    Each claim locks its lane until commit, so every caller must visit lanes
+    in the same order; LANE_WEIGHTS keeps that equal to Priority order.
+    """
+    order = sorted(priorities, key=lambda p: -LANE_WEIGHTS.get(p, 1))
+    total = sum(LANE_WEIGHTS.get(p, 1) for p in order)
+    quotas = {p: max(1, batch_size * LANE_WEIGHTS.get(p, 1) // total) for p in order}
+
+    claimed: dict[Priority, list[OutboxEvent]] = {}
+    for p in order:
+        claimed[p] = await uow.outbox_event_repo.claim_ready(
+            limit=quotas[p], priority=p, **claim_kwargs
+        )
+
+    # work-conserving: spare room goes to lanes that filled their share
+    spare = batch_size - sum(len(evs) for evs in claimed.values())
+    for p in order:
+        if spare <= 0:
+            break
+        if len(claimed[p]) < quotas[p]:
+            continue
+        more = await uow.outbox_event_repo.claim_ready(
+            limit=spare, priority=p, **claim_kwargs
+        )
+        claimed[p].extend(more)
+        spare -= len(more)
+
+    return [ev for p in order for ev in claimed[p]]
+
+
 async def dispatch_outbox_events(
     *,
     uow_factory: Callable[[], AsyncUnitOfWork],
@@ -66,11 +154,19 @@ async def dispatch_outbox_events(
     tabular_reader: TabularReaderPort,
     import_staging_repo: ImportStagingRepositoryPort,
     import_registry: ImportRegistry,
+    suppression_list_repo: SuppressionListRepositoryPort,
     dispatch_strategy: str,
     event_bus: EventBusPort,
     batch_size: int = 50,
+    concurrency: int = 8,
+    shard: tuple[int, int] | None = None,
+    lease_seconds: int = 60,
+    priorities: Sequence[Priority] = tuple(Priority),
+    lazy_entity_cache_factory: Callable[[], LazyEntityCache] | None = None,
 ) -> dict[str, int]:
     now = datetime.now(timezone.utc)
+    lease = timedelta(seconds=max(1, lease_seconds))
+    worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
 
     processed = 0
     rescheduled = 0
@@ -85,103 +181,207 @@ async def dispatch_outbox_events(
     if strategy == "broker" and not event_bus.is_enabled():
         raise RuntimeError(
             "outbox_dispatch_strategy='broker' but broker is disabled "
-            "(set broker_driver='rabbitmq' and broker_url)"
+            "(set broker_driver='rabbitmq' and broker_url, or 'inmemory')"
         )
 
-    async with uow_factory() as uow:
-        events = await uow.outbox_event_repo.get_ready(
-            now=now,
-            limit=batch_size,
-            lock=True,
-            skip_locked=True,
-        )
+    semaphore = asyncio.Semaphore(max(1, concurrency))
 
-        for ev in events:
-            ev.attempts = (ev.attempts or 0) + 1
+    def _failed(ev: OutboxEvent, error: Exception) -> str:
+        ev.last_error = str(error)[:1000]
 
-            try:
-                if strategy == "direct":
-                    handler = outbox_registry.get_handler(ev.event_type)
-                    if handler is None:
-                        ev.last_error = (
-                            f"No handler registered for event_type={ev.event_type}"
-                        )
-                        ev.processed_at = now
-                        await uow.outbox_event_repo.update(entity=ev)
-                        dead_lettered += 1
-                        continue
-
-                    typed_event = outbox_registry.build_event(ev.event_type, ev.payload)
-                    if typed_event is None:
-                        ev.last_error = (
-                            f"No event class registered for event_type={ev.event_type}"
-                        )
-                        ev.processed_at = now
-                        await uow.outbox_event_repo.update(entity=ev)
-                        dead_lettered += 1
-                        continue
-
-                    kwargs = _build_handler_kwargs(
-                        handler,
-                        uow=uow,
-                        event=typed_event,
-                        messenger_registry=messenger_registry,
-                        file_service=file_service,
-                        tabular_reader=tabular_reader,
-                        import_staging_repo=import_staging_repo,
-                        import_registry=import_registry,
-                    )
-                    await handler(**kwargs)
+        if ev.attempts >= MAX_ATTEMPTS:
+            ev.processed_at = now
+            return "dead_lettered"
 
-                else:
-                    # strategy == "broker": publish only; consumers execute handlers
-                    headers = {
-                        "outbox_id": str(ev.id),
-                        "attempts": str(ev.attempts or 0),
-                    }
-                    if ev.dedup_key:
-                        headers["dedup_key"] = ev.dedup_key
-                    if ev.aggregate_type:
-                        headers["aggregate_type"] = ev.aggregate_type
-                    if ev.aggregate_id:
-                        headers["aggregate_id"] = ev.aggregate_id
-
-                    await event_bus.publish(
-                        EventBusMessage(
-                            event_type=ev.event_type,
-                            payload=ev.payload,
-                            headers=headers,
-                            message_id=str(ev.id),
-                        )
-                    )
+        ev.available_at = now + backoff(ev.attempts)
+        return "rescheduled"
 
-                ev.last_error = None
+    async def _dispatch_one(ev: OutboxEvent) -> str:
+        ev.attempts = (ev.attempts or 0) + 1
+
+        try:
+            handler = outbox_registry.get_handler(ev.event_type)
+            if handler is None:
+                ev.last_error = f"No handler registered for event_type={ev.event_type}"
                 ev.processed_at = now
-                await uow.outbox_event_repo.update(entity=ev)
-                processed += 1
+                return "dead_lettered"
 
-            except Exception as e:
-                logger.exception(
-                    "Outbox dispatch failed event_id=%s type=%s strategy=%s",
-                    ev.id,
-                    ev.event_type,
-                    strategy,
+            typed_event = outbox_registry.build_event(ev.event_type, ev.payload)
+            if typed_event is None:
+                ev.last_error = (
+                    f"No event class registered for event_type={ev.event_type}"
+                )
+                ev.processed_at = now
+                return "dead_lettered"
+
+            # each event gets its own session: a failing handler rolls back
+            # only its own work and cannot poison the rest of the batch
+            async with semaphore, uow_factory() as event_uow:
+                kwargs = _build_handler_kwargs(
+                    handler,
+                    uow=event_uow,
+                    event=typed_event,
+                    messenger_registry=messenger_registry,
+                    file_service=file_service,
+                    tabular_reader=tabular_reader,
+                    import_staging_repo=import_staging_repo,
+                    import_registry=import_registry,
+                    suppression_list_repo=suppression_list_repo,
+                    lazy_entity_cache_factory=lazy_entity_cache_factory,
                 )
-                ev.last_error = str(e)[:1000]
+                await handler(**kwargs)
+                await event_uow.commit()
+
+            ev.last_error = None
+            ev.processed_at = now
+            return "processed"
+
+        except Exception as e:
+            logger.exception(
+                "Outbox dispatch failed event_id=%s type=%s strategy=%s",
+                ev.id,
+                ev.event_type,
+                strategy,
+            )
+            return _failed(ev, e)
 
-                if ev.attempts >= MAX_ATTEMPTS:
+    async def _dispatch_lane(lane: list[OutboxEvent]) -> list[str]:
+        outcomes: list[str] = []
+        for i, ev in enumerate(lane):
+            outcome = await _dispatch_one(ev)
+            outcomes.append(outcome)
+            if outcome == "rescheduled":
+                # keep the aggregate ordered: later events wait behind the retry
+                for later in lane[i + 1 :]:
+                    later.available_at = ev.available_at
+                break
+        return outcomes
+
+    async def _publish_lanes(lanes: list[list[OutboxEvent]]) -> list[str]:
+        # strategy == "broker": publish only; consumers execute handlers.
+        # Each wave takes the next event of every live lane and goes out as one
+        # confirmed batch, so aggregates stay ordered while the batch is
+        # pipelined. Rows are marked processed only once their confirm is in.
+        outcomes: list[str] = []
+        pending = [lane for lane in lanes if lane]
+        while pending:
+            wave = [lane[0] for lane in pending]
+            for ev in wave:
+                ev.attempts = (ev.attempts or 0) + 1
+
+            try:
+                errors = await event_bus.publish_many(
+                    [_broker_message(ev) for ev in wave]
+                )
+            except Exception as e:
+                # connection-level failure: nothing in this wave is confirmed
+                errors = [e] * len(wave)
+
+            still_pending: list[list[OutboxEvent]] = []
+            for lane, ev, error in zip(pending, wave, errors):
+                if error is None:
+                    ev.last_error = None
                     ev.processed_at = now
-                    await uow.outbox_event_repo.update(entity=ev)
-                    dead_lettered += 1
+                    outcome = "processed"
                 else:
-                    ev.available_at = now + _backoff(ev.attempts)
-                    await uow.outbox_event_repo.update(entity=ev)
-                    rescheduled += 1
+                    logger.error(
+                        "Outbox publish not confirmed event_id=%s type=%s: %s",
+                        ev.id,
+                        ev.event_type,
+                        error,
+                    )
+                    outcome = _failed(ev, error)
+                outcomes.append(outcome)
+
+                if outcome == "rescheduled":
+                    # keep the aggregate ordered: later events wait behind it
+                    for later in lane[1:]:
+                        later.available_at = ev.available_at
+                elif len(lane) > 1:
+                    still_pending.append(lane[1:])
+            pending = still_pending
+        return outcomes
 
+    # claim in a short transaction: nothing stays locked while handlers run
+    async with uow_factory() as uow:
+        events = await _claim_weighted(
+            uow,
+            priorities=priorities,
+            batch_size=batch_size,
+            now=now,
+            worker_id=worker_id,
+            lease=lease,
+            shard=shard,
+        )
         await uow.commit()
 
+    if not events:
+        return {"processed": 0, "rescheduled": 0, "dead_lettered": 0}
+
+    async def _keep_leases() -> None:
+        # long handlers (bulk import stages) must not lose their lease
+        while True:
+            await asyncio.sleep(lease.total_seconds() / 3)
+            ids = [ev.id for ev in events if ev.processed_at is None]
+            try:
+                async with uow_factory() as uow:
+                    await uow.outbox_event_repo.extend_claims(
+                        ids=ids,
+                        worker_id=worker_id,
+                        until=datetime.now(timezone.utc) + lease,
+                    )
+                    await uow.commit()
+            except Exception:
+                logger.warning("Failed to extend outbox leases", exc_info=True)
+
+    heartbeat = asyncio.create_task(_keep_leases())
+    try:
+        lanes = _group_by_aggregate(events)
+        if strategy == "broker":
+            results = [await _publish_lanes(lanes)]
+        else:
+            results = await asyncio.gather(*(_dispatch_lane(lane) for lane in lanes))
+        for outcomes in results:
+            processed += outcomes.count("processed")
+            rescheduled += outcomes.count("rescheduled")
+            dead_lettered += outcomes.count("dead_lettered")
+    finally:
+        heartbeat.cancel()
+        await asyncio.gather(heartbeat, return_exceptions=True)
+
+        # finalize in a second short transaction
+        async with uow_factory() as uow:
+            for ev in events:
+                released = await uow.outbox_event_repo.release_claim(
+                    entity=ev, worker_id=worker_id
+                )
+                if not released:
+                    logger.warning(
+                        "Outbox lease lost before finalize event_id=%s type=%s",
+                        ev.id,
+                        ev.event_type,
+                    )
+            await uow.commit()
+
     return {
         "processed": processed,
         "rescheduled": rescheduled,
         "dead_lettered": dead_lettered,
     }
+
+
+async def next_outbox_event_due(
+    *,
+    uow_factory: Callable[[], AsyncUnitOfWork],
+    shard: tuple[int, int] | None = None,
+    priorities: Sequence[Priority] = tuple(Priority),
+) -> datetime | None:
+    """When `dispatch_outbox_events` next has something to claim.
+
+    Future-dated and retried events send no NOTIFY when they fall due, so an
+    idle dispatcher uses this to bound its backoff.
+    """
+    async with uow_factory() as uow:
+        return await uow.outbox_event_repo.get_next_due_at(
+            shard=shard, priorities=priorities
+        )
@@ -0,0 +1,176 @@
+import asyncio
+import logging
+import time
+import zlib
+from datetime import datetime, timezone
+from typing import Any
+
+from src.base.domain.retry_policy import backoff
+from src.base.ports.services.event_bus import (
+    DeadLetterError,
+    EventBusHandler,
+    EventBusMessage,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class PartitionedConsumer:
+    """Runs bus messages on a fixed pool of workers, one queue per worker.
+
+    Messages carrying an ``aggregate_id`` header always land on the same
+    worker, so each aggregate is handled strictly in delivery order while
+    unrelated aggregates run in parallel. Messages without one are spread
+    round-robin.
+
+    `submit` resolves only once the handler has finished (and committed), so
+    the bus adapter acks after the work is durable and a failure nacks it.
+
+    With ``max_attempts`` > 1 a failed message of an aggregate is retried in
+    place, with the outbox backoff, and its partition waits: later events of
+    that aggregate never overtake it, as with the outbox lane. Once attempts
+    run out it fails with DeadLetterError, so the bus parks it for good.
+    Messages without an aggregate fail straight back to the bus.
+    """
+
+    def __init__(
+        self, handler: EventBusHandler, *, workers: int = 8, max_attempts: int = 1
+    ) -> None:
+        self._handler = handler
+        self._max_attempts = max(1, max_attempts)
+        self._queues: list[asyncio.Queue] = [
+            asyncio.Queue() for _ in range(max(1, workers))
+        ]
+        self._tasks: list[asyncio.Task] = []
+        self._next = 0
+
+        self.in_flight = 0
+        self.processed = 0
+        self.failed = 0
+        self.retried = 0
+        self._max_lag = 0.0
+
+    @property
+    def workers(self) -> int:
+        return len(self._queues)
+
+    def _partition(self, msg: EventBusMessage) -> int:
+        headers = msg.headers or {}
+        aggregate_id = headers.get("aggregate_id")
+        if not aggregate_id:
+            self._next = (self._next + 1) % len(self._queues)
+            return self._next
+        # lanes are ordered independently (see outbox priority)
+        key = (
+            f"{headers.get('priority', '')}:"
+            f"{headers.get('aggregate_type', '')}:{aggregate_id}"
+        )
+        return zlib.crc32(key.encode("utf-8")) % len(self._queues)
+
+    def _observe_lag(self, msg: EventBusMessage) -> None:
+        raw = (msg.headers or {}).get("available_at")
+        if not raw:
+            return
+        try:
+            available_at = datetime.fromisoformat(raw)
+        except ValueError:
+            return
+        lag = (datetime.now(timezone.utc) - available_at).total_seconds()
+        self._max_lag = max(self._max_lag, lag)
+
+    def _ensure_started(self) -> None:
+        if self._tasks:
+            return
+        self._tasks = [
+            asyncio.create_task(self._work(queue), name=f"consumer-worker-{i}")
+            for i, queue in enumerate(self._queues)
+        ]
+
+    async def submit(self, msg: EventBusMessage) -> None:
+        self._ensure_started()
+        future = asyncio.get_running_loop().create_future()
+        # enqueue synchronously: deliveries keep their order per partition
+        self._queues[self._partition(msg)].put_nowait((msg, future))
+        self.in_flight += 1
+        try:
+            await future
+        finally:
+            self.in_flight -= 1
+
+    async def _work(self, queue: asyncio.Queue) -> None:
+        while True:
+            msg, future = await queue.get()
+            if future.done():
+                # delivery was abandoned (channel closed); it will be redelivered
+                continue
+            self._observe_lag(msg)
+            try:
+                await self._handle(msg, future)
+            except Exception as e:
+                self.failed += 1
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                self.processed += 1
+                if not future.done():
+                    future.set_result(None)
+
+    async def _handle(self, msg: EventBusMessage, future: asyncio.Future) -> None:
+        ordered = bool((msg.headers or {}).get("aggregate_id"))
+        attempts = self._max_attempts if ordered else 1
+        for attempt in range(1, attempts + 1):
+            try:
+                await self._handler(msg)
+                return
+            except Exception as e:
+                if attempt >= attempts:
+                    if attempts > 1:
+                        raise DeadLetterError(str(e)) from e
+                    raise
+                delay = backoff(attempt).total_seconds()
+                logger.warning(
+                    "Handler failed event_type=%s message_id=%s attempt=%d; "
+                    "holding its partition for %.0fs",
+                    msg.event_type,
+                    msg.message_id,
+                    attempt,
+                    delay,
+                    exc_info=True,
+                )
+            self.retried += 1
+            await asyncio.sleep(delay)
+            if future.done():
+                # delivery was abandoned meanwhile; it will be redelivered
+                return
+
+    def stats(self, *, reset_lag: bool = True) -> dict[str, Any]:
+        """In-flight/queued counts and the worst lag since the last call.
+
+        Lag is how long after its ``available_at`` an event started running.
+        """
+        max_lag, self._max_lag = self._max_lag, (0.0 if reset_lag else self._max_lag)
+        return {
+            "workers": len(self._queues),
+            "in_flight": self.in_flight,
+            "queued": sum(q.qsize() for q in self._queues),
+            "processed": self.processed,
+            "failed": self.failed,
+            "retried": self.retried,
+            "max_lag_seconds": round(max_lag, 3),
+        }
+
+    async def report_forever(self, *, interval: float = 30.0) -> None:
+        started = time.monotonic()
+        while True:
+            await asyncio.sleep(interval)
+            logger.info(
+                "consumer uptime=%ds %s",
+                int(time.monotonic() - started),
+                self.stats(),
+            )
+
+    async def close(self) -> None:
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
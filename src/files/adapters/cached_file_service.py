@@ -0,0 +1,156 @@
+"""Size-bounded in-process cache in front of a file service.
+
+Only whole-file `read` is cached: a campaign attachment is read once per
+message, so keeping its bytes saves a storage round trip on every send.
+Entries are dropped least-recently-used once ``max_bytes`` is exceeded and
+expire after ``ttl`` seconds; files larger than ``max_item_bytes`` are never
+kept. Writes and deletes made through this service drop the cached copy.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Mapping
+
+from src.files.ports.services.file_service import FileInfo, FileServicePort
+
+
+class CachedFileService(FileServicePort):
+    def __init__(
+        self,
+        inner: FileServicePort,
+        *,
+        max_bytes: int = 64 * 1024 * 1024,
+        max_item_bytes: int | None = None,
+        ttl: float = 600.0,
+    ) -> None:
+        self._inner = inner
+        self._max_bytes = max(0, int(max_bytes or 0))
+        self._max_item_bytes = (
+            self._max_bytes // 4 if max_item_bytes is None else max_item_bytes
+        )
+        self._ttl = float(ttl or 0)
+
+        # uri -> (expires_at, bytes)
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._size = 0
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "prefetched": 0}
+
+    # -------------------------
+    # Cache helpers
+    # -------------------------
+
+    @property
+    def _enabled(self) -> bool:
+        return self._max_bytes > 0 and self._ttl > 0
+
+    def _lookup(self, uri: str) -> bytes | None:
+        entry = self._entries.get(uri)
+        if entry is None:
+            return None
+        expires_at, data = entry
+        if expires_at < time.monotonic():
+            self._drop(uri)
+            return None
+        self._entries.move_to_end(uri)
+        return data
+
+    def _store(self, uri: str, data: bytes) -> None:
+        if not self._enabled or len(data) > self._max_item_bytes:
+            return
+        self._drop(uri)
+        self._entries[uri] = (time.monotonic() + self._ttl, data)
+        self._size += len(data)
+        while self._size > self._max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+            self._stats["evictions"] += 1
+
+    def _drop(self, uri: str) -> None:
+        entry = self._entries.pop(uri, None)
+        if entry is not None:
+            self._size -= len(entry[1])
+
+    async def prefetch(self, uri: str, *, size: int | None = None) -> bool:
+        """Load `uri` into the cache ahead of use; True if it was already cached.
+
+        A known `size` over the per-file limit skips the read. Not counted as
+        a hit or miss, so `stats` reflects real reads only.
+        """
+        if not self._enabled:
+            return False
+        if size is not None and size > self._max_item_bytes:
+            return False
+        if self._lookup(uri) is not None:
+            return True
+        self._store(uri, await self._inner.read(uri))
+        self._stats["prefetched"] += 1
+        return False
+
+    def stats(self, *, reset: bool = False) -> dict[str, Any]:
+        """Counters since the last reset, plus the current footprint."""
+        stats = dict(self._stats)
+        if reset:
+            self._stats = dict.fromkeys(self._stats, 0)
+        reads = stats["hits"] + stats["misses"]
+        return {
+            **stats,
+            "hit_ratio": round(stats["hits"] / reads, 3) if reads else None,
+            "entries": len(self._entries),
+            "bytes": self._size,
+        }
+
+    # -------------------------
+    # FileServicePort
+    # -------------------------
+
+    async def read(self, uri: str) -> bytes:
+        data = self._lookup(uri) if self._enabled else None
+        if data is not None:
+            self._stats["hits"] += 1
+            return data
+        self._stats["misses"] += 1
+        data = await self._inner.read(uri)
+        self._store(uri, data)
+        return data
+
+    async def stream(
+        self, uri: str, chunk_size: int = 1024 * 1024
+    ) -> AsyncIterator[bytes]:
+        async for chunk in self._inner.stream(uri, chunk_size):
+            yield chunk
+
+    def build_uri(self, *, prefix: str, name: str) -> str:
+        return self._inner.build_uri(prefix=prefix, name=name)
+
+    def build_download_url(self, *, uri: str) -> str:
+        return self._inner.build_download_url(uri=uri)
+
+    async def write(
+        self,
+        uri: str,
+        data: bytes,
+        *,
+        content_type: str | None = None,
+        meta: Mapping[str, str] | None = None,
+        overwrite: bool = True,
+    ) -> FileInfo:
+        self._drop(uri)
+        return await self._inner.write(
+            uri, data, content_type=content_type, meta=meta, overwrite=overwrite
+        )
+
+    async def delete(self, uri: str, *, missing_ok: bool = True) -> None:
+        self._drop(uri)
+        await self._inner.delete(uri, missing_ok=missing_ok)
+
+    async def exists(self, uri: str) -> bool:
+        return await self._inner.exists(uri)
+
+    async def stat(self, uri: str) -> FileInfo:
+        return await self._inner.stat(uri)
+
+    async def list(
+        self, prefix: str, *, recursive: bool = False
+    ) -> AsyncIterator[FileInfo]:
+        async for info in self._inner.list(prefix, recursive=recursive):
+            yield info
@@ -1,7 +1,13 @@
+from typing import Optional
 from sqlalchemy import select, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.base.adapters.sqlalchemydb.repository import AsyncSqlalchemyRepository
+from src.base.adapters.sqlalchemydb.repository import (
+    AfterCommit,
+    AsyncSqlalchemyRepository,
+    IdentityMap,
+)
+from src.base.ports.repositories.cache_repository import AbstractCacheRepository
 from src.files.adapters.sqlalchemydb.models.file import FileModel
 from src.files.domain.entities.file import File
 from src.files.ports.repositories.file_repo_port import FileRepositoryPort
@@ -11,8 +17,21 @@ class SqlalchemyFileRepository(
     AsyncSqlalchemyRepository[File, FileModel],
     FileRepositoryPort,
 ):
-    def __init__(self, session: AsyncSession) -> None:
-        super().__init__(session, FileModel)
+    def __init__(
+        self,
+        session: AsyncSession,
+        cache_repo: Optional[AbstractCacheRepository] = None,
+        *,
+        identity_map: Optional[IdentityMap] = None,
+        after_commit: Optional[AfterCommit] = None,
+    ) -> None:
+        super().__init__(
+            session,
+            FileModel,
+            cache_repo=cache_repo,
+            identity_map=identity_map,
+            after_commit=after_commit,
+        )
 
     # --- lookups -------------------------------------------------------------
 
@@ -0,0 +1,31 @@
+from redis.asyncio import Redis
+
+from src.importing.ports.repositories.suppression_list_repo_port import (
+    SuppressionListRepositoryPort,
+)
+
+
+class RedisSuppressionListRepository(SuppressionListRepositoryPort):
+    KEY_PREFIX = "importing"
+
+    def __init__(self, redis_client: Redis) -> None:
+        self.redis = redis_client
+
+    def _set_key(self, owner_id: int) -> str:
+        return f"{self.KEY_PREFIX}:suppression:{owner_id}"
+
+    async def add(self, *, owner_id: int, keys: list[str]) -> int:
+        if not keys:
+            return 0
+        return int(await self.redis.sadd(self._set_key(owner_id), *keys))
+
+    async def remove(self, *, owner_id: int, keys: list[str]) -> int:
+        if not keys:
+            return 0
+        return int(await self.redis.srem(self._set_key(owner_id), *keys))
+
+    async def contains_many(self, *, owner_id: int, keys: list[str]) -> list[bool]:
+        if not keys:
+            return []
+        flags = await self.redis.smismember(self._set_key(owner_id), keys)
+        return [bool(f) for f in flags]
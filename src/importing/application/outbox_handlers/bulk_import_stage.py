@@ -15,6 +15,9 @@ from src.importing.domain.enums.unknown_columns_policy import UnknownColumnsPoli
 from src.importing.ports.repositories.import_staging_repo_port import (
     ImportStagingRepositoryPort,
 )
+from src.importing.ports.repositories.suppression_list_repo_port import (
+    SuppressionListRepositoryPort,
+)
 from src.importing.ports.services.tabular_reader_port import TabularReaderPort
 
 
@@ -30,6 +33,7 @@ async def handle_bulk_import_stage_v1(
     tabular_reader: TabularReaderPort,
     import_staging_repo: ImportStagingRepositoryPort,
     import_registry: ImportRegistry,
+    suppression_list_repo: SuppressionListRepositoryPort | None = None,
 ) -> None:
     handler_cls = import_registry.get_handler(import_type=event.import_type)
     config_cls = import_registry.get_config(import_type=event.import_type)
@@ -134,7 +138,7 @@ async def handle_bulk_import_stage_v1(
         return
 
     # stage using handler
-    handler = handler_cls()
+    handler = handler_cls(suppression_list_repo=suppression_list_repo)
     try:
         handler.validate_config(config=config)
         stats = await handler.stage(
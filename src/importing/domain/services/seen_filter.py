@@ -0,0 +1,86 @@
+import hashlib
+import math
+
+
+class BloomFilter:
+    """Fixed-size probabilistic set: no false negatives, bounded false positives."""
+
+    def __init__(self, *, capacity: int, error_rate: float) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+
+        size = math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+        self._size = size
+        self._hashes = max(1, round(size / capacity * math.log(2)))
+        self._bits = bytearray((size + 7) // 8)
+
+    def _positions(self, key: str) -> list[int]:
+        # double hashing (Kirsch-Mitzenmacher) over one 128-bit digest
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self._size for i in range(self._hashes)]
+
+    def add(self, key: str) -> None:
+        for pos in self._positions(key):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, key: str) -> bool:
+        return all(
+            self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key)
+        )
+
+
+class BoundedSeenFilter:
+    """
+    Tracks keys already seen while keeping memory bounded.
+
+    Keys are held in an exact set until `exact_limit` is reached, then migrated
+    into a Bloom filter. After the switch a small fraction (~`error_rate`) of
+    new keys may be reported as already seen.
+    """
+
+    def __init__(
+        self,
+        *,
+        exact_limit: int = 100_000,
+        bloom_capacity: int = 5_000_000,
+        error_rate: float = 0.001,
+    ) -> None:
+        self._exact_limit = exact_limit
+        self._bloom_capacity = bloom_capacity
+        self._error_rate = error_rate
+        self._exact: set[str] | None = set()
+        self._bloom: BloomFilter | None = None
+
+    @property
+    def is_exact(self) -> bool:
+        return self._exact is not None
+
+    def __contains__(self, key: str) -> bool:
+        if self._exact is not None:
+            return key in self._exact
+        assert self._bloom is not None
+        return key in self._bloom
+
+    def add(self, key: str) -> None:
+        if self._exact is not None:
+            self._exact.add(key)
+            if len(self._exact) > self._exact_limit:
+                self._spill()
+            return
+        assert self._bloom is not None
+        self._bloom.add(key)
+
+    def _spill(self) -> None:
+        assert self._exact is not None
+        bloom = BloomFilter(
+            capacity=max(self._bloom_capacity, len(self._exact)),
+            error_rate=self._error_rate,
+        )
+        for key in self._exact:
+            bloom.add(key)
+        self._bloom = bloom
+        self._exact = None
@@ -6,10 +6,20 @@ from src.importing.domain.dtos.base_import_config import BaseImportConfig
 from src.importing.ports.repositories.import_staging_repo_port import (
     ImportStagingRepositoryPort,
 )
+from src.importing.ports.repositories.suppression_list_repo_port import (
+    SuppressionListRepositoryPort,
+)
 from src.importing.ports.services.tabular_reader_port import TabularDocument
 
 
 class ImportHandlerPort(ABC):
+    def __init__(
+        self,
+        *,
+        suppression_list_repo: SuppressionListRepositoryPort | None = None,
+    ) -> None:
+        self.suppression_list_repo = suppression_list_repo
+
     @abstractmethod
     def validate_config(self, *, config: BaseImportConfig) -> None:
         raise NotImplementedError
@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+
+
+class SuppressionListRepositoryPort(ABC):
+    """Per-owner set of recipient keys that imports must skip."""
+
+    @abstractmethod
+    async def add(self, *, owner_id: int, keys: list[str]) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def remove(self, *, owner_id: int, keys: list[str]) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def contains_many(self, *, owner_id: int, keys: list[str]) -> list[bool]:
+        raise NotImplementedError
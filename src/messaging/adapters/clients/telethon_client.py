@@ -10,6 +10,14 @@ from telethon.errors import (
     PhoneCodeInvalidError as TelethonPhoneCodeInvalidError,
     PhoneCodeExpiredError as TelethonPhoneCodeExpiredError,
     PasswordHashInvalidError as TelethonPasswordHashInvalidError,
+    InputUserDeactivatedError,
+    PeerIdInvalidError,
+    PhoneNumberInvalidError,
+    UserDeactivatedError,
+    UserIsBlockedError,
+    UserPrivacyRestrictedError,
+    UsernameInvalidError,
+    UsernameNotOccupiedError,
 )
 
 from src.messaging.ports.messengers.capabilities.auth.errors import (
@@ -18,8 +26,23 @@ from src.messaging.ports.messengers.capabilities.auth.errors import (
     InvalidPasswordError,
     SessionPasswordNeededError,
 )
+from src.messaging.ports.messengers.capabilities.contact.errors import (
+    RecipientUnreachableError,
+)
 from src.messaging.ports.services.telegram_client import TelegramClientPort
 
+# errors that will repeat for the same recipient whatever we send
+_UNREACHABLE_ERRORS = (
+    InputUserDeactivatedError,
+    PeerIdInvalidError,
+    PhoneNumberInvalidError,
+    UserDeactivatedError,
+    UserIsBlockedError,
+    UserPrivacyRestrictedError,
+    UsernameInvalidError,
+    UsernameNotOccupiedError,
+)
+
 
 def telethon_kwargs_from_proxy_url(proxy_url: str | None) -> dict[str, Any]:
     if not proxy_url:
@@ -172,6 +195,8 @@ class TelethonClient(TelegramClientPort):
         await self.connect()
         try:
             await self.client.send_message(target, text)
+        except _UNREACHABLE_ERRORS as e:
+            raise RecipientUnreachableError(str(e)) from e
         finally:
             await self.disconnect()
 
@@ -183,5 +208,7 @@ class TelethonClient(TelegramClientPort):
                 file=file,
                 caption=caption,
             )
+        except _UNREACHABLE_ERRORS as e:
+            raise RecipientUnreachableError(str(e)) from e
         finally:
             await self.disconnect()
@@ -1,9 +1,28 @@
 from typing import Literal
 from src.base.ports.services.abstract_http_client import AbstractAsyncHttpClient
 from src.base.ports.services.abstract_http_service import AbstractAsyncHttpService
+from src.messaging.ports.messengers.capabilities.contact.errors import (
+    RecipientUnreachableError,
+)
 from src.messaging.ports.services.whatsapp_service import WhatsappServicePort
 
 
+def _is_unknown_number(error: Exception) -> bool:
+    # Evolution API answers 400 {"response": {"message": [{"exists": false,
+    # "number": ...}]}} for numbers that are not on WhatsApp
+    response = getattr(error, "response", None)
+    if getattr(response, "status_code", None) != 400:
+        return False
+    try:
+        body = response.json()
+    except ValueError:
+        return False
+    if not isinstance(body, dict) or not isinstance(body.get("response"), dict):
+        return False
+    messages = body["response"].get("message") or []
+    return any(isinstance(m, dict) and m.get("exists") is False for m in messages)
+
+
 class WhatsappHttpService(AbstractAsyncHttpService, WhatsappServicePort):
     _token = ""
 
@@ -78,12 +97,17 @@ class WhatsappHttpService(AbstractAsyncHttpService, WhatsappServicePort):
             "number": number,
             "text": text,
         }
-        response = await self.client.request(
-            method="POST",
-            path=f"/message/sendText/{instance_name}",
-            json_data=payload,
-            headers=await self.get_headers(),
-        )
+        try:
+            response = await self.client.request(
+                method="POST",
+                path=f"/message/sendText/{instance_name}",
+                json_data=payload,
+                headers=await self.get_headers(),
+            )
+        except Exception as e:
+            if _is_unknown_number(e):
+                raise RecipientUnreachableError(f"{number} is not on WhatsApp") from e
+            raise
         return response
 
     async def send_media(
@@ -109,11 +133,16 @@ class WhatsappHttpService(AbstractAsyncHttpService, WhatsappServicePort):
         if delay is not None:
             payload = {**payload, "delay": delay}
 
-        response = await self.client.request(
-            method="POST",
-            path=f"/message/sendMedia/{instance_name}",
-            headers=await self.get_headers(),
-            json_data=payload,
-        )
+        try:
+            response = await self.client.request(
+                method="POST",
+                path=f"/message/sendMedia/{instance_name}",
+                headers=await self.get_headers(),
+                json_data=payload,
+            )
+        except Exception as e:
+            if _is_unknown_number(e):
+                raise RecipientUnreachableError(f"{number} is not on WhatsApp") from e
+            raise
 
         return response
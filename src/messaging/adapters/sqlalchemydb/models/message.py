@@ -4,6 +4,7 @@ from sqlalchemy import (
     Enum,
     ForeignKey,
     Integer,
+    JSON,
     String,
     Text,
 )
@@ -25,6 +26,7 @@ class MessageModel(Base, EntityModelMixin):
         "sending_time",
         "sent_time",
         "text",
+        "variables",
         "phone_number",
         "username",
         "user_id",
@@ -50,7 +52,8 @@ class MessageModel(Base, EntityModelMixin):
 
     sent_time = Column(DateTime(timezone=True), nullable=True)
 
-    text = Column(Text, nullable=False)
+    text = Column(Text, nullable=True)
+    variables = Column(JSON, nullable=True)
 
     phone_number = Column(String(50), nullable=True, index=True)
     username = Column(String(255), nullable=True)
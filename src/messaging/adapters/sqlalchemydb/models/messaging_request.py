@@ -1,6 +1,7 @@
 from sqlalchemy import (
     Column,
     DateTime,
+    Enum,
     ForeignKey,
     Integer,
     String,
@@ -9,6 +10,7 @@ from sqlalchemy import (
 
 from src.base.adapters.sqlalchemydb.database import Base
 from src.base.adapters.sqlalchemydb.mixins import EntityModelMixin
+from src.base.domain.enums.priority import Priority
 from src.messaging.domain.entities.messaging_request import MessagingRequest
 
 
@@ -25,6 +27,7 @@ class MessagingRequestModel(Base, EntityModelMixin):
         "attachment_file_id",
         "sending_time",
         "default_text",
+        "priority",
     ]
 
     id = Column(Integer, primary_key=True, index=True)
@@ -63,4 +66,10 @@ class MessagingRequestModel(Base, EntityModelMixin):
 
     default_text = Column(Text, nullable=True)
 
+    priority = Column(
+        Enum(Priority, name="priority"),
+        nullable=False,
+        server_default=Priority.bulk.name,
+    )
+
     deleted_at = Column(DateTime(timezone=True), nullable=True)
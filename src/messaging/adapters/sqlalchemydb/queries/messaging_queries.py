@@ -12,6 +12,7 @@ from src.messaging.adapters.sqlalchemydb.models.messaging_request import (
 from src.messaging.domain.dtos.message_dto import MessageDTO
 from src.messaging.domain.dtos.messaging_request_dto import MessageRequestDTO
 from src.messaging.domain.dtos.session_dto import SessionDTO
+from src.messaging.domain.services.message_template import message_text
 from src.messaging.adapters.sqlalchemydb.models.session import SessionModel
 
 from src.users.adapters.sqlalchemydb.models.base_user import BaseUserModel
@@ -26,11 +27,13 @@ class SqlalchemyMessagingQueries(AsyncSqlalchemyQueries, MessagingQueriesPort):
     # DTO Mappers
     # -----------------------------------------------------------------
 
-    def _to_message_dto(self, m: MessageModel) -> MessageDTO:
+    def _map_message_row_to_dto(self, row: tuple) -> MessageDTO:
+        # (message, request default_text): templated rows are rendered here
+        m, template = row
         return MessageDTO(
             id=m.id,
             message_request_id=m.message_request_id,
-            text=m.text,
+            text=message_text(text=m.text, variables=m.variables, template=template),
             phone_number=m.phone_number,
             username=m.username,
             user_id=m.user_id,
@@ -173,7 +176,11 @@ class SqlalchemyMessagingQueries(AsyncSqlalchemyQueries, MessagingQueriesPort):
 
     async def get_messages_for_request(self, *, request_id: int) -> list[MessageDTO]:
         stmt = (
-            select(MessageModel)
+            select(MessageModel, MessagingRequestModel.default_text)
+            .join(
+                MessagingRequestModel,
+                MessagingRequestModel.id == MessageModel.message_request_id,
+            )
             .where(
                 MessageModel.message_request_id == request_id,
                 MessageModel.deleted_at.is_(None),
@@ -181,7 +188,7 @@ class SqlalchemyMessagingQueries(AsyncSqlalchemyQueries, MessagingQueriesPort):
             .order_by(MessageModel.sending_time.asc())
         )
 
-        return await self._all(stmt, self._to_message_dto)
+        return await self._all_tuples(stmt, self._map_message_row_to_dto)
 
     async def get_session_details(self, *, session_id: int) -> SessionDTO | None:
         stmt = (
@@ -200,8 +207,15 @@ class SqlalchemyMessagingQueries(AsyncSqlalchemyQueries, MessagingQueriesPort):
         return await self._one_tuple(stmt, self._map_session_row_to_dto)
 
     async def get_message_by_id(self, *, message_id: int) -> MessageDTO | None:
-        stmt = select(MessageModel).where(
-            MessageModel.id == message_id,
-            MessageModel.deleted_at.is_(None),
+        stmt = (
+            select(MessageModel, MessagingRequestModel.default_text)
+            .join(
+                MessagingRequestModel,
+                MessagingRequestModel.id == MessageModel.message_request_id,
+            )
+            .where(
+                MessageModel.id == message_id,
+                MessageModel.deleted_at.is_(None),
+            )
         )
-        return await self._one(stmt, self._to_message_dto)
+        return await self._one_tuple(stmt, self._map_message_row_to_dto)
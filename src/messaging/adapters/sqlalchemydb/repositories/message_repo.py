@@ -1,10 +1,13 @@
 from datetime import datetime
 
-from sqlalchemy import select
+from sqlalchemy import String, cast, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.base.adapters.sqlalchemydb.repository import AsyncSqlalchemyRepository
 from src.messaging.adapters.sqlalchemydb.models.message import MessageModel
+from src.messaging.adapters.sqlalchemydb.models.messaging_request import (
+    MessagingRequestModel,
+)
 from src.messaging.domain.enums.message_status import MessageStatus
 from src.messaging.domain.entities.message import Message
 from src.messaging.ports.repositories.message_repo_port import (
@@ -107,3 +110,50 @@ class SqlalchemyMessageRepository(
 
         res = await self.session.execute(stmt)
         return res.scalars().first()
+
+    async def get_upcoming_send_targets(
+        self,
+        *,
+        before: datetime,
+        limit: int = 500,
+        include_deleted: bool = False,
+        shard: tuple[int, int] | None = None,
+        **kwargs,
+    ) -> list[tuple[int, int | None]]:
+        """Distinct (session_id, attachment_file_id) of the next pending sends.
+
+        Looks at the first `limit` pending messages due up to `before`
+        (overdue ones included), in sending order. `shard` (index, count)
+        keeps the sessions whose send events that outbox shard claims.
+        """
+        upcoming = (
+            select(MessagingRequestModel.session_id, MessageModel.attachment_file_id)
+            .join(
+                MessagingRequestModel,
+                MessagingRequestModel.id == MessageModel.message_request_id,
+            )
+            .where(
+                MessageModel.status == MessageStatus.pending,
+                MessageModel.sending_time <= before,
+                MessageModel.sent_time.is_(None),
+            )
+            .order_by(MessageModel.sending_time.asc(), MessageModel.id.asc())
+            .limit(limit)
+        )
+
+        if not include_deleted:
+            upcoming = upcoming.where(MessageModel.deleted_at.is_(None))
+
+        if shard is not None:
+            # same hash as the outbox shard: send events are keyed by session
+            index, count = shard
+            key = cast(MessagingRequestModel.session_id, String)
+            upcoming = upcoming.where(
+                func.hashtext(key).op("&")(0x7FFFFFFF) % count == index
+            )
+
+        upcoming = upcoming.subquery()
+        stmt = select(upcoming.c.session_id, upcoming.c.attachment_file_id).distinct()
+
+        res = await self.session.execute(stmt)
+        return [(session_id, file_id) for session_id, file_id in res.all()]
@@ -1,6 +1,13 @@
+from typing import Optional
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.base.adapters.sqlalchemydb.repository import AsyncSqlalchemyRepository
+from src.base.adapters.sqlalchemydb.repository import (
+    AfterCommit,
+    AsyncSqlalchemyRepository,
+    IdentityMap,
+)
+from src.base.ports.repositories.cache_repository import AbstractCacheRepository
 from src.messaging.adapters.sqlalchemydb.models.messaging_request import (
     MessagingRequestModel,
 )
@@ -14,5 +21,18 @@ class SqlalchemyMessagingRequestRepository(
     AsyncSqlalchemyRepository[MessagingRequest, MessagingRequestModel],
     MessagingRequestRepositoryPort,
 ):
-    def __init__(self, session: AsyncSession) -> None:
-        super().__init__(session, MessagingRequestModel)
+    def __init__(
+        self,
+        session: AsyncSession,
+        cache_repo: Optional[AbstractCacheRepository] = None,
+        *,
+        identity_map: Optional[IdentityMap] = None,
+        after_commit: Optional[AfterCommit] = None,
+    ) -> None:
+        super().__init__(
+            session,
+            MessagingRequestModel,
+            cache_repo=cache_repo,
+            identity_map=identity_map,
+            after_commit=after_commit,
+        )
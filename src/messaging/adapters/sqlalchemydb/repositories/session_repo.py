@@ -1,9 +1,14 @@
+from typing import Optional
 from uuid import UUID
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.base.adapters.sqlalchemydb.repository import AsyncSqlalchemyRepository
+from src.base.adapters.sqlalchemydb.repository import (
+    AsyncSqlalchemyRepository,
+    IdentityMap,
+)
+from src.base.ports.repositories.cache_repository import AbstractCacheRepository
 from src.messaging.adapters.sqlalchemydb.models.session import SessionModel
 from src.messaging.domain.entities.session import Session, MessengerType
 from src.messaging.ports.repositories.session_repo_port import (
@@ -15,8 +20,16 @@ class SqlalchemySessionRepository(
     AsyncSqlalchemyRepository[Session, SessionModel],
     SessionRepositoryPort,
 ):
-    def __init__(self, session: AsyncSession) -> None:
-        super().__init__(session, SessionModel)
+    def __init__(
+        self,
+        session: AsyncSession,
+        cache_repo: Optional[AbstractCacheRepository] = None,
+        *,
+        identity_map: Optional[IdentityMap] = None,
+    ) -> None:
+        super().__init__(
+            session, SessionModel, cache_repo=cache_repo, identity_map=identity_map
+        )
 
     async def get_by_uuid(
         self,
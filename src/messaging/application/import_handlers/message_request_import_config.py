@@ -1,9 +1,11 @@
-from typing import ClassVar
+from datetime import time
+from typing import Any, ClassVar
 
-from pydantic import Field
+from pydantic import Field, field_validator, model_validator
 
 from src.importing.domain.dtos.base_import_config import BaseImportConfig
 from src.importing.domain.enums.unknown_columns_policy import UnknownColumnsPolicy
+from src.messaging.domain.services.send_pacer import utc_time
 
 
 class MessageRequestImportConfig(BaseImportConfig):
@@ -38,3 +40,48 @@ class MessageRequestImportConfig(BaseImportConfig):
 
     stop_on_row_error: bool = False
     max_errors: int = 500
+
+    # drop rows whose recipient was already seen earlier in the same file
+    # (opt-in: repeated rows used to be sent as separate messages)
+    dedupe_recipients: bool = False
+    # drop rows whose recipient is on the owner's suppression list (opt-outs
+    # added through the API and recipients the messenger refused)
+    skip_suppressed: bool = True
+
+    # pacing for rows without their own sending_time: spread them at this
+    # rate instead of making the whole campaign due at once (None = off)
+    messages_per_minute: int | None = Field(default=None, ge=1)
+    # optional daily sending window (UTC, may cross midnight); times given
+    # with an offset (e.g. "09:00+02:00") are converted to UTC
+    window_start: time | None = None
+    window_end: time | None = None
+    # each paced slot is delayed by a random 0..jitter_seconds
+    jitter_seconds: float = Field(default=0.0, ge=0)
+
+    @field_validator("window_start", "window_end")
+    @classmethod
+    def _window_to_utc(cls, value: time | None) -> time | None:
+        return utc_time(value)
+
+    @model_validator(mode="after")
+    def _validate_pacing(self) -> "MessageRequestImportConfig":
+        if (self.window_start is None) != (self.window_end is None):
+            raise ValueError("window_start and window_end must be set together")
+        if self.window_start is not None and self.window_start == self.window_end:
+            raise ValueError("window_start and window_end must differ")
+        if self.window_start is not None and self.messages_per_minute is None:
+            raise ValueError("a sending window requires messages_per_minute")
+        return self
+
+    def pacing(self) -> dict[str, Any] | None:
+        """JSON-safe pacing options for the import context."""
+        if self.messages_per_minute is None:
+            return None
+        return {
+            "messages_per_minute": self.messages_per_minute,
+            "window_start": (
+                self.window_start.isoformat() if self.window_start else None
+            ),
+            "window_end": self.window_end.isoformat() if self.window_end else None,
+            "jitter_seconds": self.jitter_seconds,
+        }
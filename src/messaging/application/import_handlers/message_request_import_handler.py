@@ -1,10 +1,11 @@
-from datetime import datetime, timezone, UTC
+from datetime import datetime, time, timezone, UTC
 from typing import Any
 
 from src.base.application.services.outbox_service import OutboxService
 from src.base.exceptions import BadRequestException
 from src.importing.domain.dtos.base_import_config import BaseImportConfig
 from src.importing.domain.enums.unknown_columns_policy import UnknownColumnsPolicy
+from src.importing.domain.services.seen_filter import BoundedSeenFilter
 from src.importing.ports.import_handler_port import ImportHandlerPort
 from src.importing.ports.repositories.import_staging_repo_port import (
     ImportStagingRepositoryPort,
@@ -14,6 +15,12 @@ from src.messaging.application.outbox.events.request_ready_to_send_v1 import (
     MessageRequestReadyToSendV1,
 )
 from src.messaging.domain.entities.message import Message
+from src.messaging.domain.services.message_template import (
+    MessageTemplate,
+    compile_template,
+)
+from src.messaging.domain.services.recipient_keys import recipient_keys
+from src.messaging.domain.services.send_pacer import SendPacer
 
 from src.messaging.application.import_handlers.message_request_import_config import (
     MessageRequestImportConfig,
@@ -24,6 +31,15 @@ def _canon(s: str) -> str:
     return (s or "").strip().casefold()
 
 
+def _recipient_keys(normalized: dict[str, Any]) -> list[str]:
+    """Canonical identity keys for a staged row (used for dedupe/suppression)."""
+    return recipient_keys(
+        phone_number=normalized.get("phone_number"),
+        username=normalized.get("username"),
+        user_id=normalized.get("user_id"),
+    )
+
+
 def _parse_dt(value: Any) -> datetime | None:
     if value is None:
         return None
@@ -43,6 +59,33 @@ def _parse_dt(value: Any) -> datetime | None:
     return dt.astimezone(timezone.utc)
 
 
+def _pacer(pacing: dict[str, Any] | None, start: datetime) -> SendPacer | None:
+    if not pacing or not pacing.get("messages_per_minute"):
+        return None
+    window_start = pacing.get("window_start")
+    window_end = pacing.get("window_end")
+    return SendPacer(
+        start=start,
+        messages_per_minute=int(pacing["messages_per_minute"]),
+        window_start=time.fromisoformat(window_start) if window_start else None,
+        window_end=time.fromisoformat(window_end) if window_end else None,
+        jitter_seconds=float(pacing.get("jitter_seconds") or 0.0),
+    )
+
+
+def _template_variables(
+    template: MessageTemplate, item: dict[str, Any]
+) -> dict[str, str | None]:
+    """Only the variables the template uses; extras win over recipient fields."""
+    extras = item.get("extras") or {}
+    normalized = item.get("normalized") or {}
+    variables: dict[str, str | None] = {}
+    for name in template.fields:
+        value = extras.get(name, normalized.get(name))
+        variables[name] = None if value is None else str(value)
+    return variables
+
+
 class MessageRequestImportHandler(ImportHandlerPort):
     def validate_config(self, *, config: BaseImportConfig) -> None:
         if not isinstance(config, MessageRequestImportConfig):
@@ -91,6 +134,43 @@ class MessageRequestImportHandler(ImportHandlerPort):
         total = 0
         ok = 0
         failed = 0
+        duplicates = 0
+        suppressed = 0
+
+        seen = BoundedSeenFilter() if config.dedupe_recipients else None
+        owner_id = context.get("user_id")
+        check_suppressed = (
+            config.skip_suppressed
+            and self.suppression_list_repo is not None
+            and owner_id is not None
+        )
+
+        async def _flush() -> None:
+            nonlocal ok, suppressed
+            rows = staged_rows
+            if check_suppressed:
+                # one round trip per chunk; rows with errors carry no keys
+                keyed = [(row, _recipient_keys(row["normalized"])) for row in rows]
+                flat = [k for row, ks in keyed if not row["errors"] for k in ks]
+                hits: set[str] = set()
+                if flat:
+                    found = await self.suppression_list_repo.contains_many(
+                        owner_id=int(owner_id), keys=flat
+                    )
+                    hits = {k for k, f in zip(flat, found) if f}
+                if hits:
+                    rows = []
+                    for row, ks in keyed:
+                        if not row["errors"] and any(k in hits for k in ks):
+                            suppressed += 1
+                            ok -= 1
+                            continue
+                        rows.append(row)
+            if rows:
+                await staging_repo.push_rows(
+                    job_key=job_key, rows=rows, ttl_seconds=ttl_seconds
+                )
+            staged_rows.clear()
 
         declared_headers = config.all_declared_headers()
         declared_canon = {_canon(h) for h in declared_headers}
@@ -163,21 +243,23 @@ class MessageRequestImportHandler(ImportHandlerPort):
                         detail=f"Row error at row {r.row_number}: {row_errors}"
                     )
             else:
+                if seen is not None:
+                    keys = _recipient_keys(normalized)
+                    if any(k in seen for k in keys):
+                        duplicates += 1
+                        continue
+                    for k in keys:
+                        seen.add(k)
                 ok += 1
 
             staged_rows.append(staged)
 
             # flush in chunks
             if len(staged_rows) >= 500:
-                await staging_repo.push_rows(
-                    job_key=job_key, rows=staged_rows, ttl_seconds=ttl_seconds
-                )
-                staged_rows.clear()
+                await _flush()
 
         if staged_rows:
-            await staging_repo.push_rows(
-                job_key=job_key, rows=staged_rows, ttl_seconds=ttl_seconds
-            )
+            await _flush()
 
         if errors:
             await staging_repo.add_errors(
@@ -189,10 +271,22 @@ class MessageRequestImportHandler(ImportHandlerPort):
 
         await staging_repo.update_meta(
             job_key=job_key,
-            updates={"total_rows": total, "staged_rows": ok, "failed_rows": failed},
+            updates={
+                "total_rows": total,
+                "staged_rows": ok,
+                "failed_rows": failed,
+                "duplicate_rows": duplicates,
+                "suppressed_rows": suppressed,
+            },
             ttl_seconds=ttl_seconds,
         )
-        return {"total": total, "staged": ok, "failed": failed}
+        return {
+            "total": total,
+            "staged": ok,
+            "failed": failed,
+            "duplicates": duplicates,
+            "suppressed": suppressed,
+        }
 
     async def process(
         self,
@@ -212,6 +306,20 @@ class MessageRequestImportHandler(ImportHandlerPort):
         default_text = (context.get("default_text") or "").strip()
         default_sending_time = context.get("default_sending_time")  # iso string or None
         attachment_file_id = context.get("attachment_file_id")
+        # with a templated default_text, rows without their own text are
+        # stored as variables for it instead of a rendered copy; otherwise
+        # they get default_text verbatim
+        template = None
+        if default_text and context.get("templated"):
+            try:
+                template = compile_template(default_text)
+            except ValueError as e:
+                raise BadRequestException(detail=str(e))
+        # rows without their own sending_time are spread at the configured rate
+        pacer = _pacer(
+            context.get("pacing"),
+            _parse_dt(default_sending_time) or datetime.now(UTC),
+        )
 
         earliest: datetime | None = None
         created = 0
@@ -231,14 +339,21 @@ class MessageRequestImportHandler(ImportHandlerPort):
 
                 n = item.get("normalized") or {}
 
-                txt = (n.get("text") or "").strip() or default_text
-                if not txt:
+                own_text = (n.get("text") or "").strip() or None
+                if own_text is None and not default_text:
                     skipped += 1
                     continue
+                variables = None
+                if own_text is None and template is None:
+                    own_text = default_text
+                elif own_text is None and not template.is_static:
+                    variables = _template_variables(template, item)
 
                 sending_time = None
                 if n.get("sending_time"):
                     sending_time = datetime.fromisoformat(n["sending_time"])
+                elif pacer is not None:
+                    sending_time = pacer.next()
                 elif default_sending_time:
                     sending_time = datetime.fromisoformat(default_sending_time)
 
@@ -247,7 +362,8 @@ class MessageRequestImportHandler(ImportHandlerPort):
                     phone_number=n.get("phone_number"),
                     username=n.get("username"),
                     user_id=n.get("user_id"),
-                    text=txt,
+                    text=own_text,
+                    variables=variables,
                     attachment_file_id=attachment_file_id,
                     sending_time=sending_time,
                 )
@@ -259,15 +375,16 @@ class MessageRequestImportHandler(ImportHandlerPort):
 
             await uow.commit()
 
-        # publish downstream "ready to send"
+        # publish downstream "ready to send" (keyed by session, see send_message)
+        session_id = context.get("session_id")
         outbox = OutboxService(uow)
         await outbox.publish(
             MessageRequestReadyToSendV1(
                 message_request_id=int(message_request_id),
                 available_at=earliest or datetime.now(UTC),
                 dedup_key=f"messaging_request:{message_request_id}:send",
-                aggregate_type="messaging_request",
-                aggregate_id=str(message_request_id),
+                aggregate_type="session" if session_id else "messaging_request",
+                aggregate_id=str(session_id or message_request_id),
             )
         )
         await uow.commit()
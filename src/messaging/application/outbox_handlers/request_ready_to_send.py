@@ -2,16 +2,28 @@ import logging
 from datetime import datetime, timezone
 
 from src.base.application.services.outbox_service import OutboxService
+from src.base.infrastructure.lazy_entity_cache import LazyEntityCache
 from src.base.ports.unit_of_work import AsyncUnitOfWork
+from src.importing.ports.repositories.suppression_list_repo_port import (
+    SuppressionListRepositoryPort,
+)
 from src.messaging.application.outbox.events.request_ready_to_send_v1 import (
     MessageRequestReadyToSendV1,
 )
 from src.messaging.application.registry.messenger_registry import MessengerRegistry
 from src.messaging.domain.entities.contact import Contact
+from src.messaging.domain.entities.message import Message
+from src.messaging.domain.entities.messaging_request import MessagingRequest
+from src.messaging.domain.entities.session import Session
 from src.messaging.domain.enums.message_status import MessageStatus
+from src.messaging.domain.services.message_template import message_text
+from src.messaging.domain.services.recipient_keys import recipient_keys
 from src.messaging.domain.validators.contact_validator import (
     validate_contact_for_messenger,
 )
+from src.messaging.ports.messengers.capabilities.contact.errors import (
+    RecipientUnreachableError,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -23,13 +35,22 @@ async def handle_request_ready_to_send(
     uow: AsyncUnitOfWork,
     event: MessageRequestReadyToSendV1,
     messenger_registry: MessengerRegistry,
+    suppression_list_repo: SuppressionListRepositoryPort | None = None,
+    lazy_entity_cache: LazyEntityCache | None = None,
 ) -> None:
     if event is None:
         raise RuntimeError("Typed event not registered for this handler")
 
     now = datetime.now(timezone.utc)
 
-    req = await uow.message_request_repo.get_by_id(id=event.message_request_id)
+    # every batch of a campaign reads the same request row: the lazy cache
+    # loads it once per TTL across all workers, and repository writes drop it
+    if lazy_entity_cache is not None:
+        req = await lazy_entity_cache.get_by_id(
+            entity_type=MessagingRequest, id=event.message_request_id
+        )
+    else:
+        req = await uow.message_request_repo.get_by_id(id=event.message_request_id)
     if req is None:
         raise RuntimeError(f"MessageRequest not found: {event.message_request_id}")
 
@@ -37,25 +58,76 @@ async def handle_request_ready_to_send(
     if session is None:
         raise RuntimeError(f"Session not found: {req.session_id}")
 
-    # lock a batch of due messages
-    messages = await uow.message_repo.get_pending_to_send_before(
+    # lock a batch of this request's due messages (a global batch could be
+    # all campaign rows and starve a single send)
+    messages = await uow.message_repo.get_pending_for_request_to_send_before(
+        request_id=req.id,
         before=now,
         limit=SEND_BATCH,
         lock=True,
         skip_locked=True,
     )
 
-    # only send messages belonging to this request (cheap filter)
-    messages = [m for m in messages if m.message_request_id == req.id]
-
-    if not messages:
+    if messages:
+        unreachable = await _send_batch(
+            uow=uow,
+            messages=messages,
+            session=session,
+            messenger_registry=messenger_registry,
+            template=req.default_text,
+            now=now,
+        )
+        # later imports of this owner skip recipients the messenger refused
+        if unreachable and suppression_list_repo is not None:
+            await suppression_list_repo.add(owner_id=req.user_id, keys=unreachable)
+
+    # Schedule the next run at the next pending sending_time: right away if
+    # this run handled a batch and more are due, otherwise when the next
+    # (e.g. paced) row falls due. Due rows we could not lock belong to
+    # another run, which reschedules itself.
+    next_time = await uow.message_repo.get_next_pending_sending_time_for_request(
+        request_id=req.id
+    )
+    if next_time is None or (next_time <= now and not messages):
         return
 
+    outbox = OutboxService(uow)
+    await outbox.publish(
+        MessageRequestReadyToSendV1(
+            message_request_id=req.id,
+            available_at=max(next_time, now),
+            dedup_key=f"messaging_request:{req.id}:send",
+            aggregate_type="session",
+            aggregate_id=str(req.session_id),
+            priority=req.priority,
+        )
+    )
+
+
+async def _send_batch(
+    *,
+    uow: AsyncUnitOfWork,
+    messages: list[Message],
+    session: Session,
+    messenger_registry: MessengerRegistry,
+    template: str | None,
+    now: datetime,
+) -> list[str]:
+    """Send `messages`; returns the recipient keys of permanent refusals."""
     messenger = await messenger_registry.for_session(session)
 
-    sent_any = 0
+    files = await uow.file_repo.get_many_by_ids(
+        ids=[m.attachment_file_id for m in messages if m.attachment_file_id]
+    )
+
+    unreachable: list[str] = []
     for msg in messages:
         try:
+            # templated rows: the request's template is compiled once (cached)
+            # and rendered here, so a bad row fails only its own message
+            text = message_text(
+                text=msg.text, variables=msg.variables, template=template
+            )
             validate_contact_for_messenger(
                 phone_number=msg.phone_number,
                 username=msg.username,
@@ -63,11 +135,7 @@ async def handle_request_ready_to_send(
                 messenger_type=session.session_type,
             )
 
-            file = (
-                await uow.file_repo.get_by_id(id=msg.attachment_file_id)
-                if msg.attachment_file_id
-                else None
-            )
+            file = files.get(msg.attachment_file_id) if msg.attachment_file_id else None
 
             contact = Contact(
                 contact_type=session.session_type,
@@ -76,36 +144,26 @@ async def handle_request_ready_to_send(
                 id=msg.user_id,
             )
 
-            await messenger.send_message(contact=contact, text=msg.text, file=file)
+            await messenger.send_message(contact=contact, text=text, file=file)
 
             msg.status = MessageStatus.successful
             msg.sent_time = now
             await uow.message_repo.update(entity=msg)
-            sent_any += 1
 
         except Exception as e:
-            logger.exception("Failed sending message id=%s", getattr(msg, "id", None))
+            if isinstance(e, RecipientUnreachableError):
+                logger.info("Recipient unreachable, message id=%s: %s", msg.id, e)
+                unreachable += recipient_keys(
+                    phone_number=msg.phone_number,
+                    username=msg.username,
+                    user_id=msg.user_id,
+                )
+            else:
+                logger.exception(
+                    "Failed sending message id=%s", getattr(msg, "id", None)
+                )
             msg.status = MessageStatus.failed
             msg.error_message = str(e)[:500]
             await uow.message_repo.update(entity=msg)
 
-    # If we sent something, check if more remain; if so re-enqueue quickly.
-    if sent_any > 0:
-        remaining = await uow.message_repo.get_pending_to_send_before(
-            before=now,
-            limit=1,
-            lock=False,
-            skip_locked=True,
-        )
-        remaining = [m for m in remaining if m.message_request_id == req.id]
-        if remaining:
-            outbox = OutboxService(uow)
-            await outbox.publish(
-                MessageRequestReadyToSendV1(
-                    message_request_id=req.id,
-                    available_at=now,  # immediate retry for next batch
-                    dedup_key=f"messaging_request:{req.id}:send",
-                    aggregate_type="messaging_request",
-                    aggregate_id=str(req.id),
-                )
-            )
+    return unreachable
@@ -4,7 +4,11 @@ from typing import Any
 
 from src.base.application.services.outbox_service import OutboxService
 from src.base.exceptions import BadRequestException, NotFoundException
+from src.messaging.application.import_handlers.message_request_import_config import (
+    MessageRequestImportConfig,
+)
 from src.messaging.domain.entities.messaging_request import MessagingRequest
+from src.messaging.domain.services.message_template import compile_template
 from src.messaging.domain.dtos.create_message_request_import_dto import (
     CreateMessageRequestImportDTO,
 )
@@ -14,6 +18,8 @@ from src.importing.application.outbox.events.bulk_import_stage_v1 import (
 from src.importing.domain.enums.import_status import ImportStatus
 from src.users.domain.entities.base_user import BaseUser
 
+_RECIPIENT_FIELDS = ("phone_number", "username", "user_id")
+
 
 async def create_message_request_import_use_case(
     *,
@@ -28,6 +34,7 @@ async def create_message_request_import_use_case(
     import_config: dict[str, Any],
     ttl_seconds: int,
     import_staging_repo,
+    templated: bool = False,
 ) -> CreateMessageRequestImportDTO:
     if user.id is None:
         raise BadRequestException(detail="User id is required")
@@ -43,6 +50,21 @@ async def create_message_request_import_use_case(
     if not f:
         raise NotFoundException(detail="File not found")
 
+    # a templated default_text is the template for rows without their own
+    # text; every placeholder must be an extras variable or a recipient field
+    default_text = (default_text or "").strip() or None
+    if default_text and templated:
+        try:
+            template = compile_template(default_text)
+        except ValueError as e:
+            raise BadRequestException(detail=str(e))
+        known = set(import_config.get("extras") or {}) | set(_RECIPIENT_FIELDS)
+        unknown = template.fields - known
+        if unknown:
+            raise BadRequestException(
+                detail=f"Template uses undefined variables: {sorted(unknown)}"
+            )
+
     # create message request
     req = MessagingRequest(
         user_id=user_id,
@@ -84,10 +106,14 @@ async def create_message_request_import_use_case(
                 "session_id": session_id,
                 "message_request_id": req.id,
                 "default_text": default_text,
+                "templated": templated,
                 "default_sending_time": (
                     default_sending_time.isoformat() if default_sending_time else None
                 ),
                 "attachment_file_id": attachment_file_id,
+                "pacing": MessageRequestImportConfig.model_validate(
+                    import_config
+                ).pacing(),
             },
             dedup_key=f"bulk_import:{job_key}:stage",
             aggregate_type="bulk_import",
@@ -1,6 +1,7 @@
 from datetime import UTC, datetime
 
 from src.base.application.services.outbox_service import OutboxService
+from src.base.domain.enums.priority import Priority
 from src.base.exceptions import BadRequestException, NotFoundException
 from src.base.ports.unit_of_work import AsyncUnitOfWork
 from src.messaging.application.outbox.events.request_ready_to_send_v1 import (
@@ -53,6 +54,7 @@ async def send_message_use_case(
         attachment_file_id=file_id,
         title=None,
         default_text=text,
+        priority=Priority.transactional,
     )
     message_request = await uow.message_request_repo.add(entity=message_request)
     await uow.flush()
@@ -85,8 +87,10 @@ async def send_message_use_case(
             message_request_id=message_request_id,
             available_at=msg.sending_time,
             dedup_key=f"messaging_request:{message_request_id}:send",
-            aggregate_type="messaging_request",
-            aggregate_id=str(message_request_id),
+            # sends are keyed by session so one worker owns each messenger client
+            aggregate_type="session",
+            aggregate_id=str(session_entity_id),
+            priority=message_request.priority,
         )
     )
 
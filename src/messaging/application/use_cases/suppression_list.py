@@ -0,0 +1,60 @@
+from src.base.exceptions import BadRequestException
+from src.importing.ports.repositories.suppression_list_repo_port import (
+    SuppressionListRepositoryPort,
+)
+from src.messaging.domain.services.recipient_keys import recipient_keys
+from src.users.domain.entities.base_user import BaseUser
+
+
+def _keys(
+    *,
+    phone_numbers: list[str],
+    usernames: list[str],
+    user_ids: list[str],
+) -> list[str]:
+    keys: list[str] = []
+    for phone_number in phone_numbers:
+        keys += recipient_keys(phone_number=phone_number)
+    for username in usernames:
+        keys += recipient_keys(username=username)
+    for user_id in user_ids:
+        keys += recipient_keys(user_id=user_id)
+    if not keys:
+        raise BadRequestException(detail="No recipients given")
+    return list(dict.fromkeys(keys))
+
+
+def _owner_id(user: BaseUser) -> int:
+    if user.id is None:
+        raise BadRequestException(detail="User id is required")
+    return int(user.id)
+
+
+async def add_to_suppression_list_use_case(
+    *,
+    user: BaseUser,
+    phone_numbers: list[str],
+    usernames: list[str],
+    user_ids: list[str],
+    suppression_list_repo: SuppressionListRepositoryPort,
+) -> int:
+    """Opt recipients out of the user's future imports; returns how many were new."""
+    return await suppression_list_repo.add(
+        owner_id=_owner_id(user),
+        keys=_keys(phone_numbers=phone_numbers, usernames=usernames, user_ids=user_ids),
+    )
+
+
+async def remove_from_suppression_list_use_case(
+    *,
+    user: BaseUser,
+    phone_numbers: list[str],
+    usernames: list[str],
+    user_ids: list[str],
+    suppression_list_repo: SuppressionListRepositoryPort,
+) -> int:
+    """Allow recipients again; returns how many were on the list."""
+    return await suppression_list_repo.remove(
+        owner_id=_owner_id(user),
+        keys=_keys(phone_numbers=phone_numbers, usernames=usernames, user_ids=user_ids),
+    )
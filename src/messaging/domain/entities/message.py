@@ -1,16 +1,35 @@
 from datetime import UTC, datetime
+from typing import Any
 
 from src.base.domain.entity import BaseEntity
 from src.messaging.domain.enums.message_status import MessageStatus
 
 
 class Message(BaseEntity):
+    # one instance per row on every send batch: keep them small
+    __slots__ = (
+        "message_request_id",
+        "sending_time",
+        "sent_time",
+        "text",
+        "variables",
+        "phone_number",
+        "username",
+        "user_id",
+        "attachment_file_id",
+        "status",
+        "error_message",
+    )
+
     repo_attr = "message_repo"
 
     message_request_id: int
     sending_time: datetime
     sent_time: datetime | None
-    text: str
+    # None for templated rows: the text is the request's default_text
+    # rendered with `variables`
+    text: str | None
+    variables: dict[str, Any] | None
     phone_number: str | None
     username: str | None
     user_id: str | None
@@ -22,7 +41,8 @@ class Message(BaseEntity):
         self,
         *,
         message_request_id: int,
-        text: str,
+        text: str | None = None,
+        variables: dict[str, Any] | None = None,
         sending_time: datetime | None = None,
         sent_time: datetime | None = None,
         phone_number: str | None = None,
@@ -39,6 +59,7 @@ class Message(BaseEntity):
         self.sending_time = sending_time or datetime.now(UTC)
         self.sent_time = sent_time
         self.text = text
+        self.variables = variables
         self.phone_number = phone_number
         self.username = username
         self.user_id = user_id
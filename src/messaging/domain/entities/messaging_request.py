@@ -1,6 +1,7 @@
 from datetime import UTC, datetime
 
 from src.base.domain.entity import BaseEntity
+from src.base.domain.enums.priority import Priority
 
 
 class MessagingRequest(BaseEntity):
@@ -13,6 +14,8 @@ class MessagingRequest(BaseEntity):
     attachment_file_id: int | None = None
     sending_time: datetime
     default_text: str | None = None
+    # dispatch lane for this request's send events
+    priority: Priority = Priority.bulk
 
     def __init__(
         self,
@@ -24,6 +27,7 @@ class MessagingRequest(BaseEntity):
         title: str | None = None,
         sending_time: datetime | None = None,
         default_text: str | None = None,
+        priority: Priority = Priority.bulk,
         id: int | None = None,
         deleted_at: datetime | None = None,
     ) -> None:
@@ -35,3 +39,4 @@ class MessagingRequest(BaseEntity):
         self.attachment_file_id = attachment_file_id
         self.sending_time = sending_time or datetime.now(UTC)
         self.default_text = default_text
+        self.priority = priority
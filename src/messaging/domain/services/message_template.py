@@ -0,0 +1,73 @@
+from functools import lru_cache
+from string import Formatter
+from typing import Any, Mapping
+
+
+class MessageTemplate:
+    """
+    Message text with `{name}` placeholders, parsed once.
+
+    `{{` and `}}` are literal braces. Placeholders are plain names (no format
+    specs, attributes or indexes); a missing or None variable renders as "".
+    """
+
+    __slots__ = ("source", "fields", "_literals", "_names")
+
+    def __init__(self, source: str) -> None:
+        literals: list[str] = []
+        names: list[str] = []
+        pending = ""
+        try:
+            parsed = list(Formatter().parse(source))
+        except ValueError as e:
+            raise ValueError(f"Invalid message template: {e}") from None
+
+        for literal, name, spec, conversion in parsed:
+            pending += literal
+            if name is None:
+                continue
+            if not name.isidentifier() or spec or conversion:
+                raise ValueError(f"Invalid placeholder: {{{name}}}")
+            literals.append(pending)
+            names.append(name)
+            pending = ""
+        literals.append(pending)
+
+        self.source = source
+        self.fields: frozenset[str] = frozenset(names)
+        # literals[0] name[0] literals[1] name[1] ... literals[-1]
+        self._literals = tuple(literals)
+        self._names = tuple(names)
+
+    @property
+    def is_static(self) -> bool:
+        return not self._names
+
+    def render(self, variables: Mapping[str, Any] | None = None) -> str:
+        if not self._names:
+            return self._literals[0]
+        variables = variables or {}
+        out = [self._literals[0]]
+        for name, literal in zip(self._names, self._literals[1:]):
+            value = variables.get(name)
+            out.append("" if value is None else str(value))
+            out.append(literal)
+        return "".join(out)
+
+
+@lru_cache(maxsize=256)
+def compile_template(source: str) -> MessageTemplate:
+    """Compiled template for a request's text, shared across batches."""
+    return MessageTemplate(source)
+
+
+def message_text(
+    *,
+    text: str | None,
+    variables: Mapping[str, Any] | None,
+    template: str | None,
+) -> str:
+    """A message's own text, else its request's template rendered for it."""
+    if text is not None:
+        return text
+    return compile_template(template or "").render(variables)
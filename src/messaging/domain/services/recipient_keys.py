@@ -0,0 +1,30 @@
+from typing import Any
+
+
+def recipient_keys(
+    *,
+    phone_number: Any = None,
+    username: Any = None,
+    user_id: Any = None,
+) -> list[str]:
+    """Canonical identity keys of a recipient (dedupe and suppression list)."""
+    keys: list[str] = []
+
+    if phone_number:
+        p = str(phone_number)
+        for ch in " -().":
+            p = p.replace(ch, "")
+        if p.startswith("00"):
+            p = "+" + p[2:]
+        if p:
+            keys.append(f"phone:{p}")
+
+    if username:
+        u = str(username).strip().casefold().lstrip("@")
+        if u:
+            keys.append(f"username:{u}")
+
+    if user_id:
+        keys.append(f"user_id:{str(user_id).strip()}")
+
+    return keys
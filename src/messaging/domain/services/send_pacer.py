@@ -0,0 +1,68 @@
+import random
+from datetime import UTC, date, datetime, time, timedelta
+
+
+def utc_time(t: time | None) -> time | None:
+    """A naive UTC wall time; offset-aware times are converted."""
+    if t is None or t.utcoffset() is None:
+        return t
+    return datetime.combine(date(2000, 1, 1), t).astimezone(UTC).time()
+
+
+class SendPacer:
+    """
+    Hands out staggered sending times at a fixed rate.
+
+    Slot n is `start + n * 60 / messages_per_minute` seconds, delayed by up to
+    `jitter_seconds`. With a daily window (UTC, may cross midnight) slots that
+    would fall outside it continue from the next window start, so the rate
+    applies inside the window only.
+    """
+
+    def __init__(
+        self,
+        *,
+        start: datetime,
+        messages_per_minute: int,
+        window_start: time | None = None,
+        window_end: time | None = None,
+        jitter_seconds: float = 0.0,
+        rng: random.Random | None = None,
+    ) -> None:
+        if messages_per_minute <= 0:
+            raise ValueError("messages_per_minute must be positive")
+        window_start, window_end = utc_time(window_start), utc_time(window_end)
+        if (window_start is None) != (window_end is None):
+            raise ValueError("window_start and window_end must be set together")
+        if window_start is not None and window_start == window_end:
+            raise ValueError("window_start and window_end must differ")
+
+        self._interval = timedelta(seconds=60.0 / messages_per_minute)
+        self._window_start = window_start
+        self._window_end = window_end
+        self._jitter = max(0.0, jitter_seconds)
+        self._rng = rng or random.Random()
+        self._cursor = self._into_window(start.astimezone(UTC))
+
+    def _in_window(self, t: datetime) -> bool:
+        start, end = self._window_start, self._window_end
+        if start is None or end is None:
+            return True
+        now = t.time()
+        if start < end:
+            return start <= now < end
+        return now >= start or now < end
+
+    def _into_window(self, t: datetime) -> datetime:
+        if self._in_window(t):
+            return t
+        assert self._window_start is not None
+        opens = datetime.combine(t.date(), self._window_start, tzinfo=UTC)
+        return opens if opens > t else opens + timedelta(days=1)
+
+    def next(self) -> datetime:
+        slot = self._cursor
+        self._cursor = self._into_window(slot + self._interval)
+        if self._jitter:
+            slot += timedelta(seconds=self._rng.uniform(0.0, self._jitter))
+        return slot
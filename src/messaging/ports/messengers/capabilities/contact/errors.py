@@ -0,0 +1,4 @@
+# the messenger permanently refused the recipient (unknown, blocked,
+# deactivated, ...); sending to the same contact again will not help
+class RecipientUnreachableError(Exception):
+    pass
@@ -93,3 +93,15 @@ class MessageRepositoryPort(AbstractRepository, ABC):
         **kwargs,
     ) -> datetime | None:
         raise NotImplementedError
+
+    @abstractmethod
+    async def get_upcoming_send_targets(
+        self,
+        *,
+        before: datetime,
+        limit: int = 500,
+        include_deleted: bool = False,
+        shard: tuple[int, int] | None = None,
+        **kwargs,
+    ) -> list[tuple[int, int | None]]:
+        raise NotImplementedError
@@ -1,3 +1,15 @@
 from src.base.domain.jobs import JobSpec
+from src.messaging.workers.prefetch_upcoming_sends import prefetch_upcoming_sends
 
-JOBS = {}
+JOBS: dict[str, JobSpec] = {}
+
+# warm caches local to the process that sends, so they run beside the
+# dispatcher or the consumer rather than as jobs of their own
+SENDER_JOBS = {
+    "prefetch_upcoming_sends": JobSpec(
+        job=prefetch_upcoming_sends,
+        interval=30.0,
+        batch=500,
+        max_interval=120.0,
+    ),
+}
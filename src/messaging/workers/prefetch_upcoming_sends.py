@@ -0,0 +1,81 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable
+
+from src.base.ports.unit_of_work import AsyncUnitOfWork
+from src.files.adapters.cached_file_service import CachedFileService
+
+logger = logging.getLogger(__name__)
+
+# attachment reads in flight at once while warming
+PREFETCH_CONCURRENCY = 4
+
+
+def _ratio(hits: int, total: int) -> float | None:
+    return round(hits / total, 3) if total else None
+
+
+async def prefetch_upcoming_sends(
+    *,
+    uow_factory: Callable[[], AsyncUnitOfWork],
+    attachment_cache: CachedFileService,
+    batch_size: int = 500,
+    lookahead_seconds: int = 300,
+    shard: tuple[int, int] | None = None,
+) -> dict[str, Any]:
+    """Warm what the next sends will load, before they fall due.
+
+    File rows go into the shared entity cache (every process reads it), kept
+    at least `lookahead_seconds`. Attachment bytes go into this process's
+    `attachment_cache`, which the messengers read through, so this runs
+    inside the process that sends (see `SENDER_JOBS`) and a sharded worker
+    only warms the sessions its outbox `shard` sends for.
+
+    Reports how much was already warm, and the attachment cache hit ratio
+    seen by real sends since the previous run.
+    """
+    now = datetime.now(timezone.utc)
+    ttl = max(1, int(lookahead_seconds))
+
+    async with uow_factory() as uow:
+        targets = await uow.message_repo.get_upcoming_send_targets(
+            before=now + timedelta(seconds=lookahead_seconds),
+            limit=batch_size,
+            shard=shard,
+        )
+        session_ids = {session_id for session_id, _ in targets}
+        file_ids = {file_id for _, file_id in targets if file_id}
+
+        files_cached = await uow.file_repo.warm_cache(ids=file_ids, ttl=ttl)
+        files = await uow.file_repo.get_many_by_ids(ids=file_ids)
+
+    # inline (base64) attachments never hit storage
+    sizes = {
+        f.uri: f.size
+        for f in files.values()
+        if f.uri and not getattr(f, "base64", None)
+    }
+    window = asyncio.Semaphore(PREFETCH_CONCURRENCY)
+
+    async def _warm(uri: str, size: int | None) -> bool:
+        async with window:
+            try:
+                return await attachment_cache.prefetch(uri, size=size)
+            except Exception:
+                logger.warning("Failed to prefetch attachment %s", uri, exc_info=True)
+                return False
+
+    attachments_cached = sum(
+        await asyncio.gather(*(_warm(uri, size) for uri, size in sizes.items()))
+    )
+    send_stats = attachment_cache.stats(reset=True)
+
+    return {
+        "sessions": len(session_ids),
+        "files": len(file_ids),
+        "attachments": len(sizes),
+        "files_warm_ratio": _ratio(files_cached, len(file_ids)),
+        "attachments_warm_ratio": _ratio(attachments_cached, len(sizes)),
+        "attachment_hit_ratio": send_stats["hit_ratio"],
+    }
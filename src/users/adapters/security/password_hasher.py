@@ -1,12 +1,32 @@
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
 from passlib.context import CryptContext
 from passlib.exc import UnknownHashError
 
+from src.base.exceptions import TooManyRequestsException
 from src.users.ports.security.password_hasher import PasswordHasherPort
 
+logger = logging.getLogger(__name__)
+
 
 class PasslibPasswordHasher(PasswordHasherPort):
     _pwd = CryptContext(schemes=["bcrypt_sha256"], deprecated="auto")
 
+    def __init__(self, *, max_workers: int = 2, max_pending: int = 32) -> None:
+        # bcrypt releases the GIL, so a small dedicated pool keeps the event
+        # loop free without letting a login storm eat every core
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="password-hasher"
+        )
+        self._max_workers = max_workers
+        self._max_pending = max_pending
+        self._pending = 0
+        self._completed = 0
+        self._rejected = 0
+
     def is_hashed(self, value: str) -> bool:
         return self._pwd.identify(value) is not None
 
@@ -21,3 +41,39 @@ class PasslibPasswordHasher(PasswordHasherPort):
             return self._pwd.verify(plain_password, hashed_password)
         except UnknownHashError:
             return False
+
+    async def hash_async(self, password: str) -> str:
+        return await self._offload(self.hash, password)
+
+    async def verify_async(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._offload(self.verify, plain_password, hashed_password)
+
+    async def _offload(self, fn: Callable[..., Any], *args: Any) -> Any:
+        if self._pending >= self._max_pending:
+            self._rejected += 1
+            logger.warning("Password hasher saturated: %s", self.stats())
+            raise TooManyRequestsException(
+                detail="Too many concurrent logins, retry shortly",
+                headers={"Retry-After": "1"},
+            )
+
+        self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, fn, *args)
+        finally:
+            self._pending -= 1
+            self._completed += 1
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "workers": self._max_workers,
+            "in_flight": min(self._pending, self._max_workers),
+            "queued": max(0, self._pending - self._max_workers),
+            "max_pending": self._max_pending,
+            "completed": self._completed,
+            "rejected": self._rejected,
+        }
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,133 @@
+import time
+from collections import OrderedDict
+from typing import Any
+
+from src.base.ports.repositories.cache_repository import AbstractCacheRepository
+from src.users.domain.entities.admin import Admin
+from src.users.domain.entities.base_user import BaseUser
+from src.users.domain.entities.user import User
+from src.users.domain.enums.user_type import UserType
+from src.users.ports.security.principal_cache import PrincipalCachePort
+
+
+class _CachedPrincipal:
+    """A user rebuilt from the cache: read-only and without a password hash.
+
+    Reading `password` or assigning any field raises, so a cached principal
+    can neither check credentials nor be written back over the real row; load
+    the user from its repository for that.
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        object.__setattr__(self, "_sealed", True)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if getattr(self, "_sealed", False):
+            raise AttributeError(f"Cached principal is read-only: {name}")
+        object.__setattr__(self, name, value)
+
+    @property
+    def password(self) -> str:
+        raise AttributeError("Cached principal carries no password hash")
+
+    @password.setter
+    def password(self, value: str) -> None:
+        # set by the entity constructor; never kept
+        pass
+
+
+class _CachedBaseUser(_CachedPrincipal, BaseUser):
+    pass
+
+
+class _CachedUser(_CachedPrincipal, User):
+    pass
+
+
+class _CachedAdmin(_CachedPrincipal, Admin):
+    pass
+
+
+def _to_principal(data: dict[str, Any]) -> BaseUser:
+    common: dict[str, Any] = {
+        "id": data.get("id"),
+        "username": data["username"],
+        "password": "",
+        "first_name": data.get("first_name"),
+        "sur_name": data.get("sur_name"),
+        "phone_number": data.get("phone_number"),
+    }
+    user_type = UserType(data.get("user_type", UserType.base_user))
+    if user_type == UserType.admin:
+        return _CachedAdmin(**common)
+    if user_type == UserType.user:
+        return _CachedUser(**common, is_active=bool(data.get("is_active", False)))
+    return _CachedBaseUser(**common, user_type=user_type)
+
+
+class TwoLevelPrincipalCache(PrincipalCachePort):
+    """Authenticated-user cache keyed by (username, token iat).
+
+    A small in-process map with a very short TTL sits in front of the shared
+    cache repository, so hot tokens cost neither a DB query nor a Redis round
+    trip. Invalidation clears this process and Redis; other processes catch up
+    within `local_ttl`.
+    """
+
+    KEY_PREFIX = "principal"
+
+    def __init__(
+        self,
+        cache_repo: AbstractCacheRepository,
+        *,
+        ttl: int = 60,
+        local_ttl: float = 5.0,
+        local_max_size: int = 10_000,
+    ) -> None:
+        self._cache = cache_repo
+        self._ttl = ttl
+        self._local_ttl = local_ttl
+        self._local_max_size = local_max_size
+        self._local: OrderedDict[tuple[str, int], tuple[float, dict[str, Any]]] = (
+            OrderedDict()
+        )
+
+    def _generation_key(self, username: str) -> str:
+        return f"{self.KEY_PREFIX}:{username}:gen"
+
+    async def _key(self, username: str, iat: int) -> str:
+        # per-user generation: invalidation is one INCR, no keyspace scan
+        generation = int(await self._cache.get(key=self._generation_key(username)) or 0)
+        return f"{self.KEY_PREFIX}:{username}:g{generation}:{iat}"
+
+    def _remember(self, username: str, iat: int, data: dict[str, Any]) -> None:
+        self._local[(username, iat)] = (time.monotonic() + self._local_ttl, data)
+        self._local.move_to_end((username, iat))
+        while len(self._local) > self._local_max_size:
+            self._local.popitem(last=False)
+
+    async def get(self, *, username: str, iat: int) -> BaseUser | None:
+        hit = self._local.get((username, iat))
+        if hit is not None:
+            expires_at, data = hit
+            if expires_at > time.monotonic():
+                return _to_principal(data)
+            del self._local[(username, iat)]
+
+        data = await self._cache.get(key=await self._key(username, iat))
+        if not isinstance(data, dict):
+            return None
+        self._remember(username, iat, data)
+        return _to_principal(data)
+
+    async def set(self, *, username: str, iat: int, user: BaseUser) -> None:
+        data = user.dump(mode="json")
+        self._remember(username, iat, data)
+        key = await self._key(username, iat)
+        await self._cache.set(key=key, value=data, ttl=self._ttl)
+
+    async def invalidate(self, *, username: str) -> None:
+        for key in [k for k in self._local if k[0] == username]:
+            del self._local[key]
+        await self._cache.incr(key=self._generation_key(username))
@@ -4,13 +4,18 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.base.adapters.sqlalchemydb.repository import AsyncSqlalchemyRepository
 from src.base.ports.repositories.cache_repository import AbstractCacheRepository
+from src.users.adapters.sqlalchemydb.repositories.principal_invalidation import (
+    PrincipalInvalidationMixin,
+)
 from src.users.adapters.sqlalchemydb.models.admin import AdminModel
 from src.users.adapters.sqlalchemydb.models.base_user import BaseUserModel
 from src.users.domain.entities.admin import Admin
+from src.users.ports.security.principal_cache import PrincipalCachePort
 from src.users.ports.repositories.admin_repo_port import AdminRepositoryPort
 
 
 class SqlalchemyAdminRepository(
+    PrincipalInvalidationMixin,
     AsyncSqlalchemyRepository[Admin, AdminModel],
     AdminRepositoryPort,
 ):
@@ -19,8 +24,10 @@ class SqlalchemyAdminRepository(
         self,
         session: AsyncSession,
         cache_repo: Optional[AbstractCacheRepository] = None,
+        principal_cache: Optional[PrincipalCachePort] = None,
     ) -> None:
         super().__init__(session, AdminModel, cache_repo=cache_repo)
+        self._principal_cache = principal_cache
 
     async def get_by_username(
         self,
@@ -32,8 +39,9 @@ class SqlalchemyAdminRepository(
         **kwargs,
     ) -> Admin | None:
         # Check cache if enabled
+        cache_key: str | None = None
         if self._cache and use_cache:
-            cache_key = f"{self.model.__name__}:username:{username}"
+            cache_key = await self._scoped_cache_key(f"username:{username}")
             cached = await self._cache.get(key=cache_key)
             if cached is not None:
                 return cached
@@ -51,8 +59,7 @@ class SqlalchemyAdminRepository(
         entity = model.to_entity() if model else None
 
         # Store in cache if enabled
-        if self._cache and use_cache and entity is not None:
-            cache_key = f"{self.model.__name__}:username:{username}"
+        if self._cache and cache_key is not None and entity is not None:
             await self._cache.set(
                 key=cache_key, value=entity, ttl=ttl or self._default_ttl
             )
@@ -5,17 +5,22 @@ from sqlalchemy.orm import selectin_polymorphic
 
 from src.base.adapters.sqlalchemydb.repository import AsyncSqlalchemyRepository
 from src.base.ports.repositories.cache_repository import AbstractCacheRepository
+from src.users.adapters.sqlalchemydb.repositories.principal_invalidation import (
+    PrincipalInvalidationMixin,
+)
 from src.users.adapters.sqlalchemydb.models.admin import AdminModel
 from src.users.adapters.sqlalchemydb.models.user import UserModel
 from src.users.adapters.sqlalchemydb.models.base_user import BaseUserModel
 from src.users.domain.entities.base_user import BaseUser
 from src.users.domain.enums.user_type import UserType
+from src.users.ports.security.principal_cache import PrincipalCachePort
 from src.users.ports.repositories.base_user_repo_port import (
     BaseUserRepositoryPort,
 )
 
 
 class SqlalchemyBaseUserRepository(
+    PrincipalInvalidationMixin,
     AsyncSqlalchemyRepository[BaseUser, BaseUserModel],
     BaseUserRepositoryPort,
 ):
@@ -24,8 +29,10 @@ class SqlalchemyBaseUserRepository(
         self,
         session: AsyncSession,
         cache_repo: Optional[AbstractCacheRepository] = None,
+        principal_cache: Optional[PrincipalCachePort] = None,
     ) -> None:
         super().__init__(session, BaseUserModel, cache_repo=cache_repo)
+        self._principal_cache = principal_cache
 
     async def get_by_username(
         self,
@@ -36,8 +43,9 @@ class SqlalchemyBaseUserRepository(
         ttl: int | None = None,
         **kwargs,
     ) -> BaseUser | None:
+        cache_key: str | None = None
         if self._cache and use_cache:
-            cache_key = f"{self.model.__name__}:username:{username}"
+            cache_key = await self._scoped_cache_key(f"username:{username}")
             cached = await self._cache.get(key=cache_key)
             if cached is not None:
                 return cached
@@ -54,8 +62,7 @@ class SqlalchemyBaseUserRepository(
         entity = model.to_entity() if model else None
 
         # Store in cache if enabled
-        if self._cache and use_cache and entity is not None:
-            cache_key = f"{self.model.__name__}:username:{username}"
+        if self._cache and cache_key is not None and entity is not None:
             await self._cache.set(
                 key=cache_key, value=entity, ttl=ttl or self._default_ttl
             )
@@ -74,8 +81,11 @@ class SqlalchemyBaseUserRepository(
         **kwargs,
     ) -> Sequence[BaseUser]:
         # Check cache if enabled
+        cache_key: str | None = None
         if self._cache and use_cache:
-            cache_key = f"{self.model.__name__}:type:{user_type.value}:{limit}:{offset}:{include_deleted}"
+            cache_key = await self._scoped_cache_key(
+                f"type:{user_type.value}:{limit}:{offset}:{include_deleted}"
+            )
             cached = await self._cache.get(key=cache_key)
             if cached is not None:
                 return cached
@@ -92,8 +102,7 @@ class SqlalchemyBaseUserRepository(
         res = await self.session.execute(stmt)
         entities = [m.to_entity() for m in res.scalars().all()]
 
-        if self._cache and use_cache:
-            cache_key = f"{self.model.__name__}:type:{user_type.value}:{limit}:{offset}:{include_deleted}"
+        if self._cache and cache_key is not None:
             await self._cache.set(
                 key=cache_key, value=entities, ttl=ttl or self._default_ttl
             )
@@ -0,0 +1,31 @@
+from src.users.adapters.sqlalchemydb.models.base_user import BaseUserModel
+from src.users.ports.security.principal_cache import PrincipalCachePort
+
+
+class PrincipalInvalidationMixin:
+    """Drop cached auth principals whenever a user row is written."""
+
+    _principal_cache: PrincipalCachePort | None = None
+
+    async def _current_username(self, id: int | None) -> str | None:
+        if id is None or self._principal_cache is None:
+            return None
+        model = await self.session.get(BaseUserModel, id)  # type: ignore[attr-defined]
+        return model.username if model else None
+
+    async def _invalidate_principals(self, *usernames: str | None) -> None:
+        if self._principal_cache is None:
+            return
+        for username in {u for u in usernames if u}:
+            await self._principal_cache.invalidate(username=username)
+
+    async def update(self, *, entity, **kwargs):
+        previous = await self._current_username(entity.id)
+        result = await super().update(entity=entity, **kwargs)  # type: ignore[misc]
+        await self._invalidate_principals(previous, entity.username)
+        return result
+
+    async def delete(self, *, id: int, soft_delete: bool = True, **kwargs) -> None:
+        previous = await self._current_username(id)
+        await super().delete(id=id, soft_delete=soft_delete, **kwargs)  # type: ignore[misc]
+        await self._invalidate_principals(previous)
@@ -4,14 +4,19 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.base.adapters.sqlalchemydb.repository import AsyncSqlalchemyRepository
 from src.base.ports.repositories.cache_repository import AbstractCacheRepository
+from src.users.adapters.sqlalchemydb.repositories.principal_invalidation import (
+    PrincipalInvalidationMixin,
+)
 from src.users.adapters.sqlalchemydb.models.user import UserModel
 from src.users.adapters.sqlalchemydb.models.base_user import BaseUserModel
 from src.users.domain.enums.user_type import UserType
 from src.users.domain.entities.user import User
+from src.users.ports.security.principal_cache import PrincipalCachePort
 from src.users.ports.repositories.user_repo_port import UserRepositoryPort
 
 
 class SqlalchemyUserRepository(
+    PrincipalInvalidationMixin,
     AsyncSqlalchemyRepository[User, UserModel],
     UserRepositoryPort,
 ):
@@ -20,8 +25,10 @@ class SqlalchemyUserRepository(
         self,
         session: AsyncSession,
         cache_repo: Optional[AbstractCacheRepository] = None,
+        principal_cache: Optional[PrincipalCachePort] = None,
     ) -> None:
         super().__init__(session, UserModel, cache_repo=cache_repo)
+        self._principal_cache = principal_cache
 
     async def get_by_username(
         self,
@@ -33,8 +40,9 @@ class SqlalchemyUserRepository(
         **kwargs,
     ) -> User | None:
         # Check cache if enabled
+        cache_key: str | None = None
         if self._cache and use_cache:
-            cache_key = f"{self.model.__name__}:username:{username}"
+            cache_key = await self._scoped_cache_key(f"username:{username}")
             cached = await self._cache.get(key=cache_key)
             if cached is not None:
                 return cached
@@ -54,8 +62,7 @@ class SqlalchemyUserRepository(
         entity = model.to_entity() if model else None
 
         # Store in cache if enabled
-        if self._cache and use_cache and entity is not None:
-            cache_key = f"{self.model.__name__}:username:{username}"
+        if self._cache and cache_key is not None and entity is not None:
             await self._cache.set(
                 key=cache_key, value=entity, ttl=ttl or self._default_ttl
             )
@@ -13,7 +13,7 @@ async def authenticate_user(
     password_hasher: PasswordHasherPort,
 ) -> str:
     user = await uow.base_user_repo.get_by_username(username=username)
-    if not user or not password_hasher.verify(password, user.password):
+    if not user or not await password_hasher.verify_async(password, user.password):
         raise UnauthorizedException("Invalid username or password")
 
     return jwt_service.create_access_token(subject=user.username)
@@ -3,6 +3,7 @@ from datetime import datetime, timezone
 from src.base.ports.unit_of_work import AsyncUnitOfWork
 from src.base.exceptions import NotFoundException, UnauthorizedException
 from src.users.ports.security.jwt import JwtPort
+from src.users.ports.security.principal_cache import PrincipalCachePort
 from src.users.domain.entities.base_user import BaseUser
 
 
@@ -11,6 +12,7 @@ async def get_current_user_from_token(
     token: str,
     uow: AsyncUnitOfWork,
     jwt_service: JwtPort,
+    principal_cache: PrincipalCachePort | None = None,
 ) -> BaseUser:
     payload = jwt_service.decode(token)
 
@@ -23,8 +25,17 @@ async def get_current_user_from_token(
     if datetime.now(timezone.utc).timestamp() > float(exp):
         raise UnauthorizedException("Token expired")
 
+    iat = payload.get("iat")
+    if principal_cache is not None and iat is not None:
+        cached = await principal_cache.get(username=username, iat=int(iat))
+        if cached is not None:
+            return cached
+
     async with uow:
         user = await uow.base_user_repo.get_by_username(username=username)
-        if not user:
-            raise NotFoundException(BaseUser)
-        return user
+    if not user:
+        raise NotFoundException(BaseUser)
+
+    if principal_cache is not None and iat is not None:
+        await principal_cache.set(username=username, iat=int(iat), user=user)
+    return user
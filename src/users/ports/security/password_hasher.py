@@ -17,3 +17,13 @@ class PasswordHasherPort(ABC):
     @abstractmethod
     def verify(self, plain_password: str, hashed_password: str) -> bool:
         raise NotImplementedError
+
+    @abstractmethod
+    async def hash_async(self, password: str) -> str:
+        """`hash` without blocking the event loop."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def verify_async(self, plain_password: str, hashed_password: str) -> bool:
+        """`verify` without blocking the event loop."""
+        raise NotImplementedError
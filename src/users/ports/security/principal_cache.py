@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+
+from src.users.domain.entities.base_user import BaseUser
+
+
+class PrincipalCachePort(ABC):
+    @abstractmethod
+    async def get(self, *, username: str, iat: int) -> BaseUser | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def set(self, *, username: str, iat: int, user: BaseUser) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def invalidate(self, *, username: str) -> None:
+        raise NotImplementedError